@@ -0,0 +1,40 @@
+-- Migration 005: Record odds changes into historical_odds with a trigger
+-- Replaces the application-side "did the odds change?" diff. Requires
+-- PostgreSQL 13+ (gen_random_uuid() is built in).
+-- DatabaseManager.create_tables() installs the same objects on startup.
+-- recorded_at is TIMESTAMP without time zone holding naive UTC (like every
+-- other writer), so the trigger stores timezone('utc', now()) rather than
+-- CURRENT_TIMESTAMP, which would be converted to the session time zone.
+
+CREATE OR REPLACE FUNCTION record_odds_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO historical_odds (id, contract_id, yes_odds, no_odds, volume, recorded_at)
+    VALUES (
+        gen_random_uuid(),
+        NEW.id,
+        NEW.current_yes_odds,
+        COALESCE(NEW.current_no_odds, 1 - NEW.current_yes_odds),
+        NEW.volume_24h,
+        timezone('utc', now())
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- New contracts: record their first odds
+DROP TRIGGER IF EXISTS record_contract_odds_insert ON contracts;
+CREATE TRIGGER record_contract_odds_insert
+    AFTER INSERT ON contracts
+    FOR EACH ROW
+    WHEN (NEW.current_yes_odds IS NOT NULL)
+    EXECUTE FUNCTION record_odds_change();
+
+-- Existing contracts: record only when yes odds actually moved
+DROP TRIGGER IF EXISTS record_contract_odds_update ON contracts;
+CREATE TRIGGER record_contract_odds_update
+    AFTER UPDATE OF current_yes_odds ON contracts
+    FOR EACH ROW
+    WHEN (NEW.current_yes_odds IS NOT NULL
+          AND OLD.current_yes_odds IS DISTINCT FROM NEW.current_yes_odds)
+    EXECUTE FUNCTION record_odds_change();
@@ -0,0 +1,18 @@
+-- Migration 006: Composite (contract_id, time) indexes for time-window queries
+-- Gap detection filters sentiment and odds history by contract and a time
+-- range every cycle; these indexes turn each filter into a single index
+-- range scan instead of a per-contract lookup plus recheck on the timestamp.
+-- Both are ascending to match the Index definitions in models.py; Postgres
+-- scans them backwards for newest-first reads.
+
+-- Sentiment windows in GapDetectionAgent (analyzed_at >= cutoff per contract)
+CREATE INDEX IF NOT EXISTS idx_sentiment_contract_analyzed_at
+    ON sentiment_analysis(contract_id, analyzed_at);
+
+-- Odds history windows. init_db.sql already creates this index as
+-- (contract_id, recorded_at DESC), and IF NOT EXISTS leaves that version in
+-- place; databases built via DatabaseManager.create_tables() get it here,
+-- ascending as in models.py. The two definitions differ only in direction,
+-- which a btree scan handles either way, so they serve the same queries.
+CREATE INDEX IF NOT EXISTS idx_historical_odds_contract
+    ON historical_odds(contract_id, recorded_at);
@@ -0,0 +1,7 @@
+-- Migration 007: Partial index for active, unexpired contract lookups
+-- Every cycle selects contracts with active = true and end_date in the
+-- future (or NULL). Indexing end_date over active rows only keeps the index
+-- small and lets the planner skip inactive/resolved contracts entirely.
+
+CREATE INDEX IF NOT EXISTS idx_contracts_active_open
+    ON contracts(end_date NULLS LAST) WHERE active = true;
@@ -0,0 +1,8 @@
+-- Migration 008: Index for the latest unresolved gap per contract and type
+-- The reporter selects DISTINCT ON (contract_id, gap_type) ordered by
+-- detected_at to keep only the newest unresolved gap of each kind. This
+-- index covers that ordering over unresolved rows, so the planner can walk
+-- it instead of scanning and sorting all of detected_gaps.
+
+CREATE INDEX IF NOT EXISTS idx_detected_gaps_latest_open
+    ON detected_gaps(contract_id, gap_type, detected_at) WHERE resolved = false;
@@ -1,22 +1,163 @@
 """Data Collection Agent - Fetches market and social media data."""
 
 import hashlib
+import re
 import threading
 import concurrent.futures
+import csv
+import functools
+import io
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple
-from uuid import UUID
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
 from crewai import Agent, Task
+from psycopg2.extras import execute_values
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ..config import get_settings
 from ..database import get_db_manager
-from ..database.models import Contract, SocialPost, HistoricalOdds
+from ..database.models import Contract
 from ..services import PolymarketAPI, TwitterScraper, RedditScraper
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keyword extraction: stop words and patterns are built once at import time
+# rather than on every _extract_keywords() call.
+_KEYWORD_STOP_WORDS = frozenset({
+    # Determiners / articles
+    'the', 'a', 'an', 'this', 'that', 'these', 'those',
+    # Prepositions
+    'in', 'on', 'at', 'to', 'for', 'of', 'by', 'with', 'from',
+    'into', 'through', 'during', 'before', 'after', 'above', 'below',
+    'between', 'under', 'over', 'about', 'against', 'within',
+    # Conjunctions
+    'and', 'or', 'but', 'nor', 'yet', 'so',
+    # Pronouns
+    'he', 'she', 'it', 'they', 'them', 'his', 'her', 'its', 'their',
+    'who', 'whom', 'which', 'what', 'whose',
+    # Common verbs
+    'will', 'would', 'could', 'should', 'shall', 'may', 'might',
+    'can', 'does', 'did', 'has', 'have', 'had', 'been', 'being',
+    'was', 'were', 'are', 'is', 'be', 'do', 'get', 'got',
+    'become', 'reach', 'exceed', 'fall', 'rise', 'drop', 'hit',
+    'remain', 'stay', 'happen', 'occur', 'take', 'make', 'go',
+    'win', 'lose', 'pass', 'fail', 'sign', 'announce', 'report',
+    'increase', 'decrease', 'collect', 'receive', 'give', 'keep',
+    'hold', 'release', 'close', 'open', 'set', 'run', 'lead',
+    'move', 'change', 'turn', 'show', 'come', 'leave', 'call',
+    'pay', 'play', 'put', 'bring', 'use', 'try', 'ask', 'tell',
+    'say', 'said', 'know', 'think', 'see', 'want', 'need', 'look',
+    'find', 'give', 'work', 'seem', 'feel', 'provide', 'include',
+    'consider', 'appear', 'allow', 'meet', 'add', 'expect',
+    'continue', 'create', 'offer', 'serve', 'cause', 'require',
+    'follow', 'agree', 'support', 'produce', 'lose', 'return',
+    # Generic nouns (too broad for useful search)
+    'yes', 'no', 'more', 'less', 'than',
+    'least', 'most', 'end', 'start', 'begin', 'next', 'last', 'first',
+    'many', 'much', 'some', 'any', 'each', 'every', 'all',
+    'other', 'another', 'such', 'only', 'also', 'just',
+    'how', 'when', 'where', 'why', 'whether',
+    'per', 'cost', 'price', 'total', 'number', 'amount',
+    'people', 'person', 'year', 'years', 'month', 'months',
+    'day', 'days', 'week', 'weeks', 'time', 'date',
+    'level', 'rate', 'share', 'point', 'part', 'place',
+    'case', 'group', 'company', 'system', 'program', 'question',
+    'government', 'world', 'area', 'state', 'states',
+    'market', 'markets', 'billion', 'million', 'trillion',
+    'average', 'high', 'low', 'new', 'old', 'long', 'short',
+    'revenue', 'value', 'growth', 'result', 'report', 'data',
+    'percent', 'currently', 'based', 'likely', 'according',
+    'announced', 'expected', 'still', 'even', 'well', 'back',
+    'official', 'officially', 'current', 'annual', 'daily',
+    'approximately', 'roughly', 'estimated', 'around',
+})
+
+# Everything except ASCII letters and whitespace. Stripping it in one pass
+# also removes prices, percentages, number ranges and punctuation.
+_NON_ALPHA_RE = re.compile(r'[^a-zA-Z\s]')
+
+# Ingestion transactions only write data that the next cycle re-fetches anyway
+_ASYNC_COMMIT_SQL = text("SET LOCAL synchronous_commit = off")
+
+# Raw Gamma API fields _filter_and_rank_contracts reads; everything else in
+# the market payload is dropped as soon as the market is parsed
+_RANKING_RAW_FIELDS = ('spread', 'oneDayPriceChange', 'oneHourPriceChange')
+
+# Rows per multi-row INSERT page. Keeps every statement well under Postgres'
+# 65535 bind-parameter limit; larger batches stop paying off around here.
+_BULK_BATCH_SIZE = 1000
+
+
+# Bulk-write SQL for social posts. ids and timestamps are supplied
+# client-side because tables created via create_all() have no server defaults.
+# Existing posts only get the new contract merged into related_contracts;
+# the WHERE skips the write entirely when the contract is already linked.
+_SOCIAL_POST_COLUMNS = (
+    "post_id, platform, author, content, url, "
+    "engagement_score, posted_at, fetched_at, related_contracts"
+)
+_SOCIAL_POST_ON_CONFLICT = """
+    ON CONFLICT (post_id) DO UPDATE
+        SET related_contracts = array_cat(
+            COALESCE(social_posts.related_contracts, '{}'::uuid[]),
+            EXCLUDED.related_contracts
+        )
+        WHERE NOT COALESCE(social_posts.related_contracts @> EXCLUDED.related_contracts, FALSE)
+    RETURNING post_id, (xmax = 0) AS inserted
+"""
+
+# social_posts column limits enforced before the batch write
+_POST_ID_MAX_LENGTH = 255
+_POST_FIELD_MAX_LENGTH = 255  # platform/author
+_INT4_MIN, _INT4_MAX = -2**31, 2**31 - 1
+
+# Small batches: one multi-row INSERT via psycopg2 execute_values
+_SOCIAL_POST_UPSERT_SQL = (
+    f"INSERT INTO social_posts (id, {_SOCIAL_POST_COLUMNS}) VALUES %s"
+    + _SOCIAL_POST_ON_CONFLICT
+)
+_SOCIAL_POST_TEMPLATE = "(%s::uuid, %s, %s, %s, %s, %s, %s, %s, %s, %s::uuid[])"
+
+# Large batches: COPY into a per-connection temp table, then merge with a
+# single INSERT ... SELECT. Rows are cleared automatically at commit.
+_SOCIAL_POST_COPY_THRESHOLD = 500
+_SOCIAL_POST_STAGING_DDL = """
+    CREATE TEMP TABLE IF NOT EXISTS social_posts_staging (
+        post_id VARCHAR(255),
+        platform VARCHAR(50),
+        author VARCHAR(255),
+        content TEXT,
+        url TEXT,
+        engagement_score INTEGER,
+        posted_at TIMESTAMPTZ,
+        fetched_at TIMESTAMPTZ,
+        related_contracts UUID[]
+    ) ON COMMIT DELETE ROWS
+"""
+_SOCIAL_POST_COPY_SQL = f"COPY social_posts_staging ({_SOCIAL_POST_COLUMNS}) FROM STDIN WITH (FORMAT csv)"
+_SOCIAL_POST_MERGE_SQL = (
+    f"INSERT INTO social_posts (id, {_SOCIAL_POST_COLUMNS}) "
+    f"SELECT gen_random_uuid(), {_SOCIAL_POST_COLUMNS} FROM social_posts_staging "
+    "ORDER BY post_id"
+    + _SOCIAL_POST_ON_CONFLICT
+)
+
+
+@dataclass(frozen=True)
+class ContractSummary:
+    """Stored contract handed from market collection to social collection."""
+
+    __slots__ = ('id', 'contract_id', 'question', 'category')
+
+    id: str  # Contract UUID (database primary key)
+    contract_id: str  # Polymarket condition ID
+    question: str
+    category: Optional[str]
+
 
 class DataCollectionAgent:
     """
@@ -128,7 +269,26 @@ class DataCollectionAgent:
 
         # Thread-safety locks for parallel contract processing
         self._x_mirror_lock = threading.Lock()  # Playwright is NOT thread-safe
-        self._db_lock = threading.Lock()  # Serialize DB writes (session.add + commit)
+
+        # Per-cycle cache of (platform, keyword, hours_back) -> posts, so contracts
+        # sharing a keyword (e.g. "Trump", "Bitcoin") reuse one API response
+        self._query_cache: Dict[Tuple[str, str, int], List[Dict]] = {}
+        self._query_cache_lock = threading.Lock()
+        # category -> subreddits; the mapping is static, so this lives as
+        # long as the agent rather than being reset every cycle
+        self._subreddit_cache: Dict[str, Tuple[str, ...]] = {}
+
+        # Shared pool that runs each contract's social sources concurrently
+        self._source_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.settings.social_source_workers,
+            thread_name_prefix='social-source'
+        )
+
+        # Shared pool for per-keyword social API calls; bounded across all contracts
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.settings.social_fetch_workers,
+            thread_name_prefix='social-io'
+        )
 
         logger.info("Data Collection Agent initialized")
 
@@ -149,7 +309,11 @@ class DataCollectionAgent:
             allow_delegation=False
         )
 
-    def _filter_and_rank_contracts(self, parsed_markets: List[Dict]) -> List[Dict]:
+    def _filter_and_rank_contracts(
+        self,
+        parsed_markets: List[Dict],
+        now: Optional[datetime] = None
+    ) -> List[Dict]:
         """
         Filter out garbage contracts, keep everything relevant, sort best-first.
 
@@ -164,12 +328,13 @@ class DataCollectionAgent:
 
         Args:
             parsed_markets: All parsed contract dicts (with raw_data attached)
+            now: Reference time (UTC) for time-to-expiry scoring; defaults to now
 
         Returns:
             Filtered + scored list, best contracts first
         """
         import math
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
 
         kept = []
         garbage_count = 0
@@ -252,80 +417,87 @@ class DataCollectionAgent:
 
         return kept
 
-    def collect_market_data(self) -> List[Dict]:
+    def collect_market_data(self, cycle_ts: Optional[datetime] = None) -> List[ContractSummary]:
         """
         Collect active Polymarket contracts with smart selection.
 
         Fetches all active markets, stores them in DB, then selects a diverse
         representative sample for social media analysis.
 
+        Args:
+            cycle_ts: Cycle timestamp (UTC) used for expiry checks; defaults to now
+
         Returns:
-            List of contract dictionaries with metadata
+            List of contract summaries, best-first
         """
         logger.info("Starting market data collection...")
+        cycle_ts = cycle_ts or datetime.now(timezone.utc)
 
         try:
-            # Fetch a large pool — we want the full universe to select from
+            # Fetch a large pool — we want the full universe to select from.
+            # Expired markets are filtered by the API, so the whole pool is live.
             fetch_limit = max(500, self.settings.max_contracts_per_cycle * 5)
-            markets = self.polymarket.get_active_markets(
-                limit=fetch_limit
+            markets = self.polymarket.iter_active_markets(
+                limit=fetch_limit,
+                end_date_min=cycle_ts
             )
 
             all_parsed = []
-            contracts_data = []
 
-            with self.db_manager.get_session() as session:
-                for market in markets:
-                    # Parse market to standardized format
-                    contract_data = self.polymarket.parse_market_to_contract(market)
-                    if not contract_data.get('contract_id'):
+            # Parse + filter as markets stream in. Keyed by contract_id so a market
+            # repeated across pages can't hit the same row twice in one upsert.
+            # Only the raw fields used for ranking are retained, so full API
+            # payloads are released one market at a time.
+            parsed_by_id: Dict[str, Dict] = {}
+            for market in markets:
+                # Parse market to standardized format
+                contract_data = self.polymarket.parse_market_to_contract(market)
+                if not contract_data.get('contract_id'):
+                    continue
+
+                # Skip expired contracts (backstop for the server-side filter)
+                if contract_data.get('end_date'):
+                    if contract_data['end_date'] < cycle_ts:
                         continue
 
-                    # Skip expired contracts
-                    if contract_data.get('end_date'):
-                        if contract_data['end_date'] < datetime.now(timezone.utc):
-                            continue
-
-                    # Store ALL contracts in DB (full universe for historical tracking)
-                    existing = session.query(Contract).filter(
-                        Contract.contract_id == contract_data['contract_id']
-                    ).first()
-
-                    if existing:
-                        for key, value in contract_data.items():
-                            if key not in ['raw_data', 'created_at']:
-                                setattr(existing, key, value)
-
-                        if (contract_data.get('current_yes_odds') and
-                            contract_data['current_yes_odds'] != existing.current_yes_odds):
-                            historical = HistoricalOdds(
-                                contract_id=existing.id,
-                                yes_odds=contract_data['current_yes_odds'],
-                                no_odds=contract_data['current_no_odds'],
-                                volume=contract_data.get('volume_24h')
-                            )
-                            session.add(historical)
-                        contract_obj = existing
-                    else:
-                        db_data = {k: v for k, v in contract_data.items() if k != 'raw_data'}
-                        contract_obj = Contract(**db_data)
-                        session.add(contract_obj)
-                        session.flush()
-
-                        if contract_data.get('current_yes_odds'):
-                            historical = HistoricalOdds(
-                                contract_id=contract_obj.id,
-                                yes_odds=contract_data['current_yes_odds'],
-                                no_odds=contract_data['current_no_odds'],
-                                volume=contract_data.get('volume_24h')
-                            )
-                            session.add(historical)
+                raw = contract_data.get('raw_data') or {}
+                contract_data['raw_data'] = {k: raw[k] for k in _RANKING_RAW_FIELDS if k in raw}
+                parsed_by_id[contract_data['contract_id']] = contract_data
 
+            if not parsed_by_id:
+                logger.info("Stored 0 contracts in database")
+                return []
+
+            with self.db_manager.get_session() as session:
+                # Market snapshots are re-fetched every cycle, so losing the last
+                # commit on a crash is harmless; skip waiting for the WAL flush.
+                session.execute(_ASYNC_COMMIT_SQL)
+
+                # Store ALL contracts in DB (full universe for historical tracking)
+                # with one INSERT ... ON CONFLICT DO UPDATE per batch. Odds changes
+                # are recorded into historical_odds by the record_odds_change
+                # trigger, so no previous-odds read or diff is needed here.
+                rows = [
+                    {k: v for k, v in c.items() if k != 'raw_data'}
+                    for c in parsed_by_id.values()
+                ]
+                # The statement carries no row data, so it is the same on every
+                # batch and every cycle: SQLAlchemy compiles it once and serves
+                # it from the compiled cache, and insertmanyvalues expands the
+                # parameter list into multi-row VALUES pages of
+                # _BULK_BATCH_SIZE. The old .values(batch) form built and
+                # compiled a fresh statement for each distinct batch size.
+                upserted = session.execute(
+                    self._contract_upsert_stmt(tuple(rows[0])), rows
+                ).all()
+
+                for row in upserted:
+                    contract_data = parsed_by_id[row.contract_id]
                     all_parsed.append({
-                        'id': str(contract_obj.id),
-                        'contract_id': contract_obj.contract_id,
-                        'question': contract_obj.question,
-                        'category': contract_obj.category,
+                        'id': str(row.id),
+                        'contract_id': row.contract_id,
+                        'question': row.question,
+                        'category': row.category,
                         'current_yes_odds': contract_data.get('current_yes_odds'),
                         'volume_24h': contract_data.get('volume_24h'),
                         'liquidity': contract_data.get('liquidity'),
@@ -338,16 +510,13 @@ class DataCollectionAgent:
             logger.info(f"Stored {len(all_parsed)} contracts in database")
 
             # Filter out garbage, keep everything relevant, sorted best-first
-            filtered = self._filter_and_rank_contracts(all_parsed)
+            filtered = self._filter_and_rank_contracts(all_parsed, now=cycle_ts)
 
             # Strip internal scoring fields for downstream use
-            for c in filtered:
-                contracts_data.append({
-                    'id': c['id'],
-                    'contract_id': c['contract_id'],
-                    'question': c['question'],
-                    'category': c['category'],
-                })
+            contracts_data = [
+                ContractSummary(c['id'], c['contract_id'], c['question'], c['category'])
+                for c in filtered
+            ]
 
             logger.info(f"Passing {len(contracts_data)}/{len(all_parsed)} contracts for social analysis "
                          f"(garbage removed, best-first ordering)")
@@ -357,303 +526,541 @@ class DataCollectionAgent:
             logger.error(f"Error collecting market data: {e}")
             return []
 
-    def _collect_for_contract(self, contract: Dict, hours_back: int) -> Tuple[str, List[Dict]]:
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _contract_upsert_stmt(columns: Tuple[str, ...]):
+        """
+        Build the contracts INSERT ... ON CONFLICT DO UPDATE ... RETURNING statement.
+
+        Args:
+            columns: Column names present in the parsed contract rows
+
+        Returns:
+            Reusable insert statement, executed with a list of row dicts
+        """
+        stmt = pg_insert(Contract.__table__)
+        return stmt.on_conflict_do_update(
+            index_elements=['contract_id'],
+            set_={
+                **{c: getattr(stmt.excluded, c) for c in columns
+                   if c not in ('contract_id', 'created_at')},
+                'updated_at': func.now(),
+            }
+        ).returning(
+            Contract.id, Contract.contract_id, Contract.question, Contract.category
+        ).execution_options(insertmanyvalues_page_size=_BULK_BATCH_SIZE)
+
+    def _collect_for_contract(
+        self,
+        contract: ContractSummary,
+        hours_back: int,
+        cycle_ts: Optional[datetime] = None
+    ) -> Tuple[str, List[Dict]]:
         """
         Collect all social media data for a single contract.
 
-        Thread-safe: X Mirror calls are serialized via self._x_mirror_lock
-        (Playwright is not thread-safe). All other sources are safe for
-        concurrent use across threads.
+        Every enabled source is queried concurrently on the shared source
+        pool; results are merged in a fixed source order so output is
+        deterministic. Thread-safe: X Mirror calls are serialized via
+        self._x_mirror_lock (Playwright is not thread-safe). All other
+        sources are safe for concurrent use across threads.
 
         Args:
-            contract: Contract dictionary with id, question, category, contract_id
+            contract: Contract summary
             hours_back: How many hours back to search
+            cycle_ts: Cycle timestamp (UTC) stamped on stored posts
 
         Returns:
             Dictionary mapping contract IDs to social posts
         """
-        max_for_social = getattr(self.settings, 'max_contracts_for_social', 10)
-        contracts_to_process = contracts[:max_for_social]
-
-        logger.info(
-            f"Starting social media data collection for "
-            f"{len(contracts_to_process)}/{len(contracts)} contracts "
-            f"(cap: MAX_CONTRACTS_FOR_SOCIAL={max_for_social})..."
-        )
-
-        results = {}
-        hours_back = self.settings.data_collection_lookback_hours
-
-        # Contracts are already sorted best-first (highest composite score),
-        # so we process the most interesting ones within the cap.
-        for contract in contracts_to_process:
-            contract_id = contract['id']
-            question = contract['question']
+        contract_id = contract.id
+        question = contract.question
 
         logger.info(f"Collecting social data for: {question[:50]}...")
 
         posts = []
 
         # Extract keywords from question
-        keywords = self._extract_keywords(question)
+        keywords = list(self._extract_keywords(question))
 
         if not keywords:
             logger.debug(f"No meaningful keywords for: {question[:50]}... - skipping social collection")
             return (contract_id, posts)
 
-        # Collect Twitter data
-        if self.twitter.enabled:
-            try:
-                for keyword in keywords[:3]:  # Limit keywords
-                    twitter_posts = self.twitter.search_tweets(
-                        query=keyword,
-                        max_results=20,
-                        hours_back=hours_back
-                    )
-                    posts.extend(twitter_posts)
-            except Exception as e:
-                logger.error(f"Error collecting Twitter data: {e}")
+        sources = (
+            self._collect_twitter,
+            self._collect_reddit,
+            self._collect_bluesky,
+            self._collect_rss_news,
+            self._collect_tavily,
+            self._collect_grok,
+            self._collect_x_mirror,
+            self._collect_reddit_mirror,
+            self._collect_gdelt,
+            self._collect_polymarket_comments,
+            self._collect_manifold_comments,
+        )
+        futures = [
+            self._source_executor.submit(source, contract, keywords, hours_back)
+            for source in sources
+        ]
+        for future in futures:
+            posts.extend(future.result())
+
+        # Store posts in database. Each call uses its own pooled session, so
+        # contracts write concurrently (see _store_social_posts on lock order)
+        if posts:
+            stored_posts = self._store_social_posts(posts, contract_id, cycle_ts)
+            return (contract_id, stored_posts)
 
-        # Collect Reddit data
-        if self.reddit.enabled:
-            try:
-                # Get relevant subreddits based on category
-                subreddits = self.reddit.get_relevant_subreddits(
-                    contract.get('category', '')
-                )
+        return (contract_id, posts)
 
-                for keyword in keywords[:3]:
-                    reddit_posts = self.reddit.search_multiple_subreddits(
-                        subreddits=subreddits[:3],  # Limit subreddits
-                        query=keyword,
-                        max_per_subreddit=10,
-                        hours_back=hours_back
-                    )
-                    posts.extend(reddit_posts)
-            except Exception as e:
-                logger.error(f"Error collecting Reddit data: {e}")
+    @staticmethod
+    def _title_query(question: str) -> str:
+        """Contract question trimmed for use as a title search query."""
+        return question[:120].rstrip('?').strip()
 
-        # Collect Bluesky data (FREE, always available)
-        # Keyword search + contract title search for direct bet discussion
-        if self.bluesky and self.bluesky.enabled:
-            try:
-                bsky_all = []
-                for keyword in keywords[:3]:
-                    bsky_posts = self.bluesky.search_posts(
-                        query=keyword,
-                        max_results=25,
-                        hours_back=hours_back
-                    )
-                    bsky_all.extend(bsky_posts)
+    def _collect_twitter(self, contract: ContractSummary, keywords: List[str], hours_back: int) -> List[Dict]:
+        """Collect Twitter data (all keywords OR-joined into one request)."""
+        if not self.twitter.enabled:
+            return []
+        try:
+            return self._fetch_batched(
+                'twitter',
+                hours_back,
+                lambda batch: self.twitter.search_tweets(
+                    query=batch,
+                    max_results=20 * len(batch),
+                    hours_back=hours_back
+                ),
+                keywords
+            )
+        except Exception as e:
+            logger.error(f"Error collecting Twitter data: {e}")
+            return []
 
-                # Title search: people discussing the actual Polymarket question
-                title_query = question[:120].rstrip('?').strip()
-                bsky_title = self.bluesky.search_posts(
-                    query=title_query,
-                    max_results=25,
+    def _collect_reddit(self, contract: ContractSummary, keywords: List[str], hours_back: int) -> List[Dict]:
+        """Collect Reddit data from the subreddits relevant to the contract's category."""
+        if not self.reddit.enabled:
+            return []
+        try:
+            subreddits = self._subreddits_for(contract.category or '')
+
+            return self._fetch_batched(
+                f"reddit:{','.join(subreddits)}",
+                hours_back,
+                lambda batch: self.reddit.search_multiple_subreddits(
+                    subreddits=list(subreddits),
+                    query=batch,
+                    max_per_subreddit=10,
                     hours_back=hours_back
-                )
-                keyword_count = len(bsky_all)
-                seen_ids = {p.get('post_id') for p in bsky_all}
-                title_new = 0
-                for p in bsky_title:
-                    if p.get('post_id') not in seen_ids:
-                        bsky_all.append(p)
-                        seen_ids.add(p.get('post_id'))
-                        title_new += 1
-
-                posts.extend(bsky_all)
-                logger.info(f"Collected {len(bsky_all)} Bluesky posts "
-                            f"({keyword_count} keyword + {title_new} title-search)")
-            except Exception as e:
-                logger.error(f"Error collecting Bluesky data: {e}")
+                ),
+                keywords
+            )
+        except Exception as e:
+            logger.error(f"Error collecting Reddit data: {e}")
+            return []
 
-        # Collect RSS news data (FREE, always available)
-        if self.rss_news:
-            try:
-                news_articles = self.rss_news.search_news(
-                    keywords=keywords[:5],  # Use more keywords for news
+    def _subreddits_for(self, category: str) -> Tuple[str, ...]:
+        """Subreddits to search for a category (resolved once per category)."""
+        subreddits = self._subreddit_cache.get(category)
+        if subreddits is None:
+            subreddits = tuple(self.reddit.get_relevant_subreddits(category)[:3])  # Limit subreddits
+            self._subreddit_cache[category] = subreddits
+        return subreddits
+
+    def _collect_bluesky(self, contract: ContractSummary, keywords: List[str], hours_back: int) -> List[Dict]:
+        """
+        Collect Bluesky data (FREE, always available).
+
+        Keyword search + contract title search for direct bet discussion.
+        """
+        if not (self.bluesky and self.bluesky.enabled):
+            return []
+        try:
+            # searchPosts has no OR operator, so keywords can't be batched
+            # into one request; issue them concurrently instead
+            bsky_all = self._fetch_per_keyword(
+                'bluesky',
+                hours_back,
+                lambda keyword: self.bluesky.search_posts(
+                    query=keyword,
+                    max_results=25,
                     hours_back=hours_back
-                )
+                ),
+                keywords[:3]
+            )
 
-                # Convert news articles to social post format.
-                # Use stable hash (SHA-256 of URL) so same article is deduplicated across runs.
-                for article in news_articles[:20]:  # Limit to 20 articles
-                    url_hash = hashlib.sha256(article['url'].encode('utf-8')).hexdigest()[:16]
-                    posts.append({
-                        'post_id': f"rss_{url_hash}",
-                        'platform': 'news_rss',
-                        'author': article['author'],
-                        'content': f"{article['title']}: {article['content']}",
-                        'posted_at': article['published_at'],  # Fixed: changed from created_at to posted_at
-                        'url': article['url'],
-                        'engagement_score': 50,  # Default score for news
-                        'source_name': article['source']
-                    })
+            # Title search: people discussing the actual Polymarket question
+            bsky_title = self.bluesky.search_posts(
+                query=self._title_query(contract.question),
+                max_results=25,
+                hours_back=hours_back
+            )
+            keyword_count = len(bsky_all)
+            seen_ids = {p.get('post_id') for p in bsky_all}
+            title_new = 0
+            for p in bsky_title:
+                if p.get('post_id') not in seen_ids:
+                    bsky_all.append(p)
+                    seen_ids.add(p.get('post_id'))
+                    title_new += 1
+
+            logger.info(f"Collected {len(bsky_all)} Bluesky posts "
+                        f"({keyword_count} keyword + {title_new} title-search)")
+            return bsky_all
+        except Exception as e:
+            logger.error(f"Error collecting Bluesky data: {e}")
+            return []
 
-                logger.info(f"Collected {len(news_articles)} news articles from RSS feeds")
-            except Exception as e:
-                logger.error(f"Error collecting RSS news data: {e}")
+    def _collect_rss_news(self, contract: ContractSummary, keywords: List[str], hours_back: int) -> List[Dict]:
+        """Collect RSS news data (FREE, always available)."""
+        if not self.rss_news:
+            return []
+        try:
+            news_articles = self.rss_news.search_news(
+                keywords=keywords[:5],  # Use more keywords for news
+                hours_back=hours_back
+            )
 
-        # Collect Tavily web search data (requires API key)
-        # Keyword search + contract title search
-        if self.tavily and self.tavily.enabled:
-            try:
-                search_query = ' '.join(keywords[:3])
-                tavily_results = self.tavily.search(query=search_query, max_results=10)
-
-                # Title search: find articles about the specific market question
-                title_query = question[:120].rstrip('?').strip()
-                tavily_title = self.tavily.search(query=title_query, max_results=5)
-                keyword_count = len(tavily_results)
-                seen_ids = {p.get('post_id') for p in tavily_results}
-                title_new = 0
-                for p in tavily_title:
-                    if p.get('post_id') not in seen_ids:
-                        tavily_results.append(p)
-                        seen_ids.add(p.get('post_id'))
-                        title_new += 1
-
-                posts.extend(tavily_results)
-                logger.info(f"Collected {len(tavily_results)} Tavily web results "
-                            f"({keyword_count} keyword + {title_new} title-search)")
-            except Exception as e:
-                logger.error(f"Error collecting Tavily data: {e}")
+            # Convert news articles to social post format.
+            # Use stable hash (SHA-256 of URL) so same article is deduplicated across runs.
+            posts = []
+            for article in news_articles[:20]:  # Limit to 20 articles
+                url_hash = hashlib.sha256(article['url'].encode('utf-8')).hexdigest()[:16]
+                posts.append({
+                    'post_id': f"rss_{url_hash}",
+                    'platform': 'news_rss',
+                    'author': article['author'],
+                    'content': f"{article['title']}: {article['content']}",
+                    'posted_at': article['published_at'],  # Fixed: changed from created_at to posted_at
+                    'url': article['url'],
+                    'engagement_score': 50,  # Default score for news
+                    'source_name': article['source']
+                })
 
-        # Collect Grok X sentiment (requires API key)
-        # Keyword search + contract title search
-        if self.grok and self.grok.enabled:
-            try:
-                search_query = ' '.join(keywords[:3])
-                grok_results = self.grok.analyze_x_sentiment(query=search_query)
-
-                # Title search: X posts discussing the actual bet
-                title_query = question[:120].rstrip('?').strip()
-                grok_title = self.grok.analyze_x_sentiment(query=title_query)
-                keyword_count = len(grok_results)
-                seen_ids = {p.get('post_id') for p in grok_results}
-                title_new = 0
-                for p in grok_title:
-                    if p.get('post_id') not in seen_ids:
-                        grok_results.append(p)
-                        seen_ids.add(p.get('post_id'))
-                        title_new += 1
-
-                posts.extend(grok_results)
-                logger.info(f"Collected {len(grok_results)} Grok X posts "
-                            f"({keyword_count} keyword + {title_new} title-search)")
-            except Exception as e:
-                logger.error(f"Error collecting Grok data: {e}")
+            logger.info(f"Collected {len(news_articles)} news articles from RSS feeds")
+            return posts
+        except Exception as e:
+            logger.error(f"Error collecting RSS news data: {e}")
+            return []
 
-        # Collect X mirror posts (free fallback, only when Grok unavailable)
-        # Two searches: keywords for broad topic sentiment + contract title
-        # for people specifically discussing the Polymarket bet
-        # NOTE: Playwright is NOT thread-safe — serialize with lock
-        if self.x_mirror and self.x_mirror.enabled:
-            try:
-                with self._x_mirror_lock:
-                    # Search 1: keyword-based (broad topic)
-                    search_query = ' '.join(keywords[:3])
-                    mirror_results = self.x_mirror.search_posts(query=search_query)
-
-                    # Search 2: contract title (people discussing the actual bet)
-                    # Truncate long questions to keep the search focused
-                    title_query = question[:120].rstrip('?').strip()
-                    title_results = self.x_mirror.search_posts(query=title_query)
-
-                # Deduplicate by post_id before merging (outside lock — no Playwright needed)
-                keyword_count = len(mirror_results)
-                seen_ids = {p['post_id'] for p in mirror_results}
-                title_new = 0
-                for p in title_results:
-                    if p['post_id'] not in seen_ids:
-                        mirror_results.append(p)
-                        seen_ids.add(p['post_id'])
-                        title_new += 1
-
-                posts.extend(mirror_results)
-                logger.info(f"Collected {len(mirror_results)} X mirror posts "
-                            f"({keyword_count} keyword + {title_new} title-search)")
-            except Exception as e:
-                logger.error(f"Error collecting X mirror data: {e}")
+    def _collect_tavily(self, contract: ContractSummary, keywords: List[str], hours_back: int) -> List[Dict]:
+        """
+        Collect Tavily web search data (requires API key).
 
-        # Collect Reddit mirror posts (free, no API key)
-        if self.reddit_mirror and self.reddit_mirror.enabled:
-            try:
-                search_query = ' '.join(keywords[:3])
-                reddit_results = self.reddit_mirror.search_posts(query=search_query, limit=10)
-                posts.extend(reddit_results)
-                logger.info(f"Collected {len(reddit_results)} Reddit mirror posts")
-            except Exception as e:
-                logger.error(f"Error collecting Reddit mirror data: {e}")
+        Keyword search + contract title search.
+        """
+        if not (self.tavily and self.tavily.enabled):
+            return []
+        try:
+            search_query = ' '.join(keywords[:3])
+            tavily_results = self.tavily.search(query=search_query, max_results=10)
+
+            # Title search: find articles about the specific market question
+            tavily_title = self.tavily.search(query=self._title_query(contract.question), max_results=5)
+            keyword_count = len(tavily_results)
+            seen_ids = {p.get('post_id') for p in tavily_results}
+            title_new = 0
+            for p in tavily_title:
+                if p.get('post_id') not in seen_ids:
+                    tavily_results.append(p)
+                    seen_ids.add(p.get('post_id'))
+                    title_new += 1
+
+            logger.info(f"Collected {len(tavily_results)} Tavily web results "
+                        f"({keyword_count} keyword + {title_new} title-search)")
+            return tavily_results
+        except Exception as e:
+            logger.error(f"Error collecting Tavily data: {e}")
+            return []
 
-        # Collect GDELT geopolitical news (free, no key required)
-        # Keyword-only — GDELT indexes news articles, not betting markets,
-        # so contract title search won't match news headlines
-        if self.gdelt and self.gdelt.enabled:
-            try:
+    def _collect_grok(self, contract: ContractSummary, keywords: List[str], hours_back: int) -> List[Dict]:
+        """
+        Collect Grok X sentiment (requires API key).
+
+        Keyword search + contract title search.
+        """
+        if not (self.grok and self.grok.enabled):
+            return []
+        try:
+            search_query = ' '.join(keywords[:3])
+            grok_results = self.grok.analyze_x_sentiment(query=search_query)
+
+            # Title search: X posts discussing the actual bet
+            grok_title = self.grok.analyze_x_sentiment(query=self._title_query(contract.question))
+            keyword_count = len(grok_results)
+            seen_ids = {p.get('post_id') for p in grok_results}
+            title_new = 0
+            for p in grok_title:
+                if p.get('post_id') not in seen_ids:
+                    grok_results.append(p)
+                    seen_ids.add(p.get('post_id'))
+                    title_new += 1
+
+            logger.info(f"Collected {len(grok_results)} Grok X posts "
+                        f"({keyword_count} keyword + {title_new} title-search)")
+            return grok_results
+        except Exception as e:
+            logger.error(f"Error collecting Grok data: {e}")
+            return []
+
+    def _collect_x_mirror(self, contract: ContractSummary, keywords: List[str], hours_back: int) -> List[Dict]:
+        """
+        Collect X mirror posts (free fallback, only when Grok unavailable).
+
+        Two searches: keywords for broad topic sentiment + contract title
+        for people specifically discussing the Polymarket bet.
+        NOTE: Playwright is NOT thread-safe — serialized with a lock.
+        """
+        if not (self.x_mirror and self.x_mirror.enabled):
+            return []
+        try:
+            with self._x_mirror_lock:
+                # Search 1: keyword-based (broad topic)
                 search_query = ' '.join(keywords[:3])
-                gdelt_results = self.gdelt.search_news(query=search_query, days_back=3)
-                posts.extend(gdelt_results)
-                logger.info(f"Collected {len(gdelt_results)} GDELT articles")
-            except Exception as e:
-                logger.error(f"Error collecting GDELT data: {e}")
+                mirror_results = self.x_mirror.search_posts(query=search_query)
+
+                # Search 2: contract title (people discussing the actual bet)
+                # Truncate long questions to keep the search focused
+                title_results = self.x_mirror.search_posts(query=self._title_query(contract.question))
+
+            # Deduplicate by post_id before merging (outside lock — no Playwright needed)
+            keyword_count = len(mirror_results)
+            seen_ids = {p['post_id'] for p in mirror_results}
+            title_new = 0
+            for p in title_results:
+                if p['post_id'] not in seen_ids:
+                    mirror_results.append(p)
+                    seen_ids.add(p['post_id'])
+                    title_new += 1
+
+            logger.info(f"Collected {len(mirror_results)} X mirror posts "
+                        f"({keyword_count} keyword + {title_new} title-search)")
+            return mirror_results
+        except Exception as e:
+            logger.error(f"Error collecting X mirror data: {e}")
+            return []
 
-        # Collect Polymarket comments (uses existing API, always available)
+    def _collect_reddit_mirror(self, contract: ContractSummary, keywords: List[str], hours_back: int) -> List[Dict]:
+        """Collect Reddit mirror posts (free, no API key)."""
+        if not (self.reddit_mirror and self.reddit_mirror.enabled):
+            return []
         try:
-            poly_contract_id = contract.get('contract_id', '')
-            if poly_contract_id:
-                poly_comments = self.polymarket.get_market_comments(
-                    condition_id=poly_contract_id, limit=30
-                )
-                posts.extend(poly_comments)
-                if poly_comments:
-                    logger.info(f"Collected {len(poly_comments)} Polymarket comments")
+            search_query = ' '.join(keywords[:3])
+            reddit_results = self.reddit_mirror.search_posts(query=search_query, limit=10)
+            logger.info(f"Collected {len(reddit_results)} Reddit mirror posts")
+            return reddit_results
+        except Exception as e:
+            logger.error(f"Error collecting Reddit mirror data: {e}")
+            return []
+
+    def _collect_gdelt(self, contract: ContractSummary, keywords: List[str], hours_back: int) -> List[Dict]:
+        """
+        Collect GDELT geopolitical news (free, no key required).
+
+        Keyword-only — GDELT indexes news articles, not betting markets,
+        so contract title search won't match news headlines.
+        """
+        if not (self.gdelt and self.gdelt.enabled):
+            return []
+        try:
+            search_query = ' '.join(keywords[:3])
+            gdelt_results = self.gdelt.search_news(query=search_query, days_back=3)
+            logger.info(f"Collected {len(gdelt_results)} GDELT articles")
+            return gdelt_results
+        except Exception as e:
+            logger.error(f"Error collecting GDELT data: {e}")
+            return []
+
+    def _collect_polymarket_comments(
+        self,
+        contract: ContractSummary,
+        keywords: List[str],
+        hours_back: int
+    ) -> List[Dict]:
+        """Collect Polymarket comments (uses existing API, always available)."""
+        try:
+            poly_contract_id = contract.contract_id
+            if not poly_contract_id:
+                return []
+            poly_comments = self.polymarket.get_market_comments(
+                condition_id=poly_contract_id, limit=30
+            )
+            if poly_comments:
+                logger.info(f"Collected {len(poly_comments)} Polymarket comments")
+            return poly_comments
         except Exception as e:
             logger.debug(f"Error collecting Polymarket comments: {e}")
+            return []
+
+    def _collect_manifold_comments(
+        self,
+        contract: ContractSummary,
+        keywords: List[str],
+        hours_back: int
+    ) -> List[Dict]:
+        """Collect Manifold comments (free, cross-reference matching markets)."""
+        if not (self.manifold and self.manifold.enabled):
+            return []
+        posts = []
+        try:
+            # Search for matching Manifold market to get its comments
+            search_query = ' '.join(keywords[:3])
+            manifold_markets = self.manifold.search_markets(query=search_query, limit=3) or []
+            for mm in manifold_markets:
+                mm_id = mm.get('market_id', '')
+                if mm_id:
+                    manifold_comments = self.manifold.get_market_comments(
+                        market_id=mm_id, limit=20
+                    )
+                    posts.extend(manifold_comments)
+            # posts holds only this source's comments, so its length is the count
+            if posts:
+                logger.info(f"Collected {len(posts)} Manifold comments")
+        except Exception as e:
+            logger.debug(f"Error collecting Manifold comments: {e}")
+        return posts
+
+    def _fetch_per_keyword(
+        self,
+        platform: str,
+        hours_back: int,
+        fetch: Callable[[str], List[Dict]],
+        keywords: List[str]
+    ) -> List[Dict]:
+        """
+        Run a per-keyword search for every keyword concurrently.
 
-        # Collect Manifold comments (free, cross-reference matching markets)
-        if self.manifold and self.manifold.enabled:
+        Results are cached for the rest of the cycle under
+        (platform, keyword, hours_back), so only keywords not yet searched
+        this cycle hit the API. Misses are submitted to the shared social
+        I/O pool so the number of in-flight requests stays bounded no matter
+        how many contracts are being processed.
+
+        Args:
+            platform: Cache namespace for the source (and its fixed parameters)
+            hours_back: Lookback window passed to the search
+            fetch: Callable taking a keyword and returning a list of posts
+            keywords: Keywords to search for
+
+        Returns:
+            Combined posts, in keyword order
+        """
+        results: Dict[str, List[Dict]] = {}
+        futures = {}
+        with self._query_cache_lock:
+            for keyword in keywords:
+                cached = self._query_cache.get((platform, keyword.lower(), hours_back))
+                if cached is not None:
+                    results[keyword] = cached
+        for keyword in keywords:
+            if keyword not in results:
+                futures[keyword] = self._io_executor.submit(fetch, keyword)
+
+        for keyword, future in futures.items():
             try:
-                # Search for matching Manifold market to get its comments
-                search_query = ' '.join(keywords[:3])
-                manifold_markets = self.manifold.search_markets(query=search_query, limit=3)
-                for mm in manifold_markets:
-                    mm_id = mm.get('market_id', '')
-                    if mm_id:
-                        manifold_comments = self.manifold.get_market_comments(
-                            market_id=mm_id, limit=20
-                        )
-                        posts.extend(manifold_comments)
-                total_mc = sum(1 for p in posts if p.get('platform') == 'manifold_comment')
-                if total_mc:
-                    logger.info(f"Collected {total_mc} Manifold comments")
+                fetched = future.result()
             except Exception as e:
-                logger.debug(f"Error collecting Manifold comments: {e}")
+                logger.error(f"Error searching {platform} for '{keyword}': {e}")
+                continue
+            results[keyword] = fetched
+            with self._query_cache_lock:
+                self._query_cache[(platform, keyword.lower(), hours_back)] = fetched
 
-        # Store posts in database (serialized via lock for session safety)
-        if posts:
-            with self._db_lock:
-                stored_posts = self._store_social_posts(posts, contract_id)
-            return (contract_id, stored_posts)
+        if len(futures) < len(keywords):
+            logger.debug(f"{platform}: {len(keywords) - len(futures)}/{len(keywords)} "
+                         f"keyword searches served from cycle cache")
 
-        return (contract_id, posts)
+        posts = []
+        for keyword in keywords:
+            posts.extend(results.get(keyword, []))
+        return posts
+
+    def _fetch_batched(
+        self,
+        platform: str,
+        hours_back: int,
+        fetch: Callable[[List[str]], List[Dict]],
+        keywords: List[str]
+    ) -> List[Dict]:
+        """
+        Run one OR-batched search covering all keywords.
 
-    def collect_social_media_data(self, contracts: List[Dict]) -> Dict[str, List[Dict]]:
+        One round-trip (and one rate-limit slot) replaces a request per
+        keyword. A non-empty result is cached for the rest of the cycle
+        under the normalized keyword set, so contracts sharing the same
+        keywords reuse it. Empty results are not cached: the scrapers
+        return [] on errors and rate limits too, and caching that would
+        blank the keyword set for every other contract this cycle.
+
+        Args:
+            platform: Cache namespace for the source (and its fixed parameters)
+            hours_back: Lookback window passed to the search
+            fetch: Callable taking the keyword list and returning a list of posts
+            keywords: Keywords to search for
+
+        Returns:
+            Posts de-duplicated by post_id
+        """
+        if not keywords:
+            return []
+
+        cache_key = (platform, ' OR '.join(sorted({k.lower() for k in keywords})), hours_back)
+        with self._query_cache_lock:
+            cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"{platform}: batched keyword search served from cycle cache")
+            return cached
+
+        seen_ids = set()
+        posts = []
+        for post in fetch(list(keywords)):
+            if post.get('post_id') not in seen_ids:
+                seen_ids.add(post.get('post_id'))
+                posts.append(post)
+
+        if posts:
+            with self._query_cache_lock:
+                self._query_cache[cache_key] = posts
+        return posts
+
+    def collect_social_media_data(
+        self,
+        contracts: List[ContractSummary],
+        cycle_ts: Optional[datetime] = None
+    ) -> Dict[str, List[Dict]]:
         """
         Collect social media posts related to contracts using parallel processing.
 
         Processes up to 3 contracts concurrently via ThreadPoolExecutor.
-        X Mirror (Playwright) calls are serialized via lock. DB writes are
-        also serialized to protect SQLAlchemy sessions.
+        X Mirror (Playwright) calls are serialized via lock. DB writes run
+        concurrently, each worker in its own session; every writer sorts its
+        rows by post_id so overlapping upserts lock shared posts in the same
+        order and cannot deadlock.
 
         Args:
-            contracts: List of contract dictionaries
+            contracts: Contract summaries, best-first
+            cycle_ts: Cycle timestamp (UTC) stamped on stored posts; defaults to now
 
         Returns:
             Dictionary mapping contract IDs to social posts
         """
-        logger.info(f"Starting social media data collection for {len(contracts)} contracts...")
+        cycle_ts = cycle_ts or datetime.now(timezone.utc)
+        max_for_social = self.settings.max_contracts_for_social
+        total_contracts = len(contracts)
+        # Contracts are already sorted best-first (highest composite score),
+        # so we process the most interesting ones within the cap. A cap of 0
+        # processes every contract and leaves throttling to the per-source
+        # rate limiters.
+        if max_for_social:
+            contracts = contracts[:max_for_social]
+
+        logger.info(
+            f"Starting social media data collection for "
+            f"{len(contracts)}/{total_contracts} contracts "
+            f"(cap: MAX_CONTRACTS_FOR_SOCIAL={max_for_social or 'none'})..."
+        )
 
         # Reset per-cycle state BEFORE spawning threads
         # (time budgets, circuit breakers, stats)
@@ -676,7 +1083,7 @@ class DataCollectionAgent:
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {
-                executor.submit(self._collect_for_contract, contract, hours_back): contract
+                executor.submit(self._collect_for_contract, contract, hours_back, cycle_ts): contract
                 for contract in contracts
             }
             for future in concurrent.futures.as_completed(futures):
@@ -687,7 +1094,7 @@ class DataCollectionAgent:
                         results[contract_id] = posts
                     logger.info(f"Collected {len(posts)} social posts for contract {contract_id}")
                 except Exception as e:
-                    logger.error(f"Error collecting for {contract.get('question', '')[:50]}: {e}")
+                    logger.error(f"Error collecting for {contract.question[:50]}: {e}")
 
         # Log X mirror performance summary for this cycle
         if self.x_mirror and self.x_mirror.enabled:
@@ -696,181 +1103,235 @@ class DataCollectionAgent:
         logger.info(f"Social media collection complete: {sum(len(p) for p in results.values())} total posts")
         return results
 
-    def _store_social_posts(self, posts: List[Dict], contract_id: str) -> List[Dict]:
+    def _store_social_posts(
+        self,
+        posts: List[Dict],
+        contract_id: str,
+        fetched_at: Optional[datetime] = None
+    ) -> List[Dict]:
         """
         Store social media posts in database.
 
-        Deduplicates posts by post_id before inserting. Commits after each
-        successful post so one failing post does not roll back the whole batch.
+        Deduplicates posts by post_id, then writes the batch with a single
+        execute_values upsert. Posts that already exist only get this
+        contract appended to related_contracts. Each post is cleaned by
+        _social_post_row first (NUL bytes stripped, engagement clamped to
+        int4, posted_at parsed), and posts it can't repair are skipped. If
+        the batch still fails, its rows are retried one at a time so a
+        single bad post only loses itself.
 
         Args:
             posts: List of post dictionaries
             contract_id: Associated contract UUID
+            fetched_at: Fetch timestamp for new rows (the cycle timestamp); defaults to now
 
         Returns:
-            List of stored post dictionaries
+            List of newly stored post dictionaries
         """
         stored_posts = []
 
-        # Deduplicate incoming posts by post_id
-        seen = set()
-        unique_posts = []
-        for p in posts:
-            pid = p.get('post_id')
-            if pid and pid not in seen:
-                seen.add(pid)
-                unique_posts.append(p)
+        fetched_at = fetched_at or datetime.now(timezone.utc)
+        related = [str(UUID(contract_id))]
+        rows = []
+        # Single pass: dedupe by post_id (first occurrence wins, so the upsert
+        # never sees the same key twice) and drop posts that can't be stored
+        valid_posts = {}
+        for post_data in posts:
+            row = self._social_post_row(post_data, fetched_at, related)
+            if row is None or row[1] in valid_posts:
+                continue
+            rows.append(row)
+            valid_posts[row[1]] = post_data
 
-        try:
-            with self.db_manager.get_session() as session:
-                for post_data in unique_posts:
-                    try:
-                        # Check if post already exists
-                        existing = session.query(SocialPost).filter(
-                            SocialPost.post_id == post_data['post_id']
-                        ).first()
-
-                        if existing:
-                            # Update related contracts if needed
-                            if contract_id not in [str(c) for c in (existing.related_contracts or [])]:
-                                contracts_list = list(existing.related_contracts or [])
-                                contracts_list.append(UUID(contract_id))
-                                existing.related_contracts = contracts_list
-                            session.commit()
-                            continue
-
-                        # Create new post
-                        post = SocialPost(
-                            post_id=post_data['post_id'],
-                            platform=post_data['platform'],
-                            author=post_data.get('author'),
-                            content=post_data['content'],
-                            url=post_data.get('url'),
-                            engagement_score=post_data.get('engagement_score', 0),
-                            posted_at=post_data['posted_at'],
-                            related_contracts=[UUID(contract_id)]
-                        )
-                        session.add(post)
-                        session.commit()
-                        stored_posts.append(post_data)
-
-                    except Exception as e:
-                        session.rollback()
-                        logger.debug(f"Skipped post {post_data.get('post_id', '?')}: {e}")
+        if not rows:
+            return stored_posts
 
+        # Contracts store concurrently and often share posts, so every writer
+        # must lock conflicting rows in the same (post_id) order or two
+        # overlapping upserts can deadlock
+        rows.sort(key=lambda row: row[1])
+
+        try:
+            returned = self._write_social_posts(rows)
         except Exception as e:
-            logger.error(f"Error storing social posts: {e}")
+            # Something in the batch slipped past _social_post_row; retry
+            # row by row so only the offending posts are lost
+            logger.warning(
+                f"Batch store of {len(rows)} social posts failed ({e}); retrying individually"
+            )
+            returned = []
+            for row in rows:
+                try:
+                    returned.extend(self._write_social_posts([row]))
+                except Exception as row_error:
+                    logger.error(f"Error storing social post {row[1]}: {row_error}")
 
+        stored_posts = [valid_posts[post_id] for post_id, inserted in returned if inserted]
         return stored_posts
 
     @staticmethod
-    def _extract_keywords(question: str) -> List[str]:
+    def _social_post_row(
+        post_data: Dict,
+        fetched_at: datetime,
+        related: List[str]
+    ) -> Optional[Tuple]:
         """
-        Extract meaningful search keywords from a Polymarket question.
-
-        Filters out stop words, numbers, price tokens, and generic terms
-        to produce keywords that will return relevant social media results.
+        Build a social_posts row tuple, cleaning values Postgres would reject.
 
         Args:
-            question: Market question
+            post_data: Post dictionary from a scraper
+            fetched_at: Fetch timestamp for the row
+            related: related_contracts value (contract UUID strings)
 
         Returns:
-            List of keywords (most specific first)
-        """
-        import re
-
-        stop_words = {
-            # Determiners / articles
-            'the', 'a', 'an', 'this', 'that', 'these', 'those',
-            # Prepositions
-            'in', 'on', 'at', 'to', 'for', 'of', 'by', 'with', 'from',
-            'into', 'through', 'during', 'before', 'after', 'above', 'below',
-            'between', 'under', 'over', 'about', 'against', 'within',
-            # Conjunctions
-            'and', 'or', 'but', 'nor', 'yet', 'so',
-            # Pronouns
-            'he', 'she', 'it', 'they', 'them', 'his', 'her', 'its', 'their',
-            'who', 'whom', 'which', 'what', 'whose',
-            # Common verbs
-            'will', 'would', 'could', 'should', 'shall', 'may', 'might',
-            'can', 'does', 'did', 'has', 'have', 'had', 'been', 'being',
-            'was', 'were', 'are', 'is', 'be', 'do', 'get', 'got',
-            'become', 'reach', 'exceed', 'fall', 'rise', 'drop', 'hit',
-            'remain', 'stay', 'happen', 'occur', 'take', 'make', 'go',
-            'win', 'lose', 'pass', 'fail', 'sign', 'announce', 'report',
-            'increase', 'decrease', 'collect', 'receive', 'give', 'keep',
-            'hold', 'release', 'close', 'open', 'set', 'run', 'lead',
-            'move', 'change', 'turn', 'show', 'come', 'leave', 'call',
-            'pay', 'play', 'put', 'bring', 'use', 'try', 'ask', 'tell',
-            'say', 'said', 'know', 'think', 'see', 'want', 'need', 'look',
-            'find', 'give', 'work', 'seem', 'feel', 'provide', 'include',
-            'consider', 'appear', 'allow', 'meet', 'add', 'expect',
-            'continue', 'create', 'offer', 'serve', 'cause', 'require',
-            'follow', 'agree', 'support', 'produce', 'lose', 'return',
-            # Generic nouns (too broad for useful search)
-            'yes', 'no', 'more', 'less', 'than',
-            'least', 'most', 'end', 'start', 'begin', 'next', 'last', 'first',
-            'many', 'much', 'some', 'any', 'each', 'every', 'all',
-            'other', 'another', 'such', 'only', 'also', 'just',
-            'how', 'when', 'where', 'why', 'whether',
-            'per', 'cost', 'price', 'total', 'number', 'amount',
-            'people', 'person', 'year', 'years', 'month', 'months',
-            'day', 'days', 'week', 'weeks', 'time', 'date',
-            'level', 'rate', 'share', 'point', 'part', 'place',
-            'case', 'group', 'company', 'system', 'program', 'question',
-            'government', 'world', 'area', 'state', 'states',
-            'market', 'markets', 'billion', 'million', 'trillion',
-            'average', 'high', 'low', 'new', 'old', 'long', 'short',
-            'revenue', 'value', 'growth', 'result', 'report', 'data',
-            'percent', 'currently', 'based', 'likely', 'according',
-            'announced', 'expected', 'still', 'even', 'well', 'back',
-            'official', 'officially', 'current', 'annual', 'daily',
-            'approximately', 'roughly', 'estimated', 'around',
-        }
+            Row tuple in _SOCIAL_POST_TEMPLATE order, or None if the post is
+            missing required fields or has an unusable post_id/posted_at
+        """
+        def clean(value):
+            # Postgres text columns cannot hold NUL bytes
+            return value.replace('\x00', '') if isinstance(value, str) else value
+
+        post_id = clean(post_data.get('post_id'))
+        platform = clean(post_data.get('platform'))
+        content = clean(post_data.get('content'))
+        posted_at = post_data.get('posted_at')
+        if not (post_id and platform and content and posted_at):
+            logger.debug(f"Skipped post {post_id}: missing required fields")
+            return None
+        post_id = str(post_id)
+        if len(post_id) > _POST_ID_MAX_LENGTH:
+            # Truncating could collide with another post's id
+            logger.debug(f"Skipped post {post_id[:50]}...: post_id too long")
+            return None
+
+        if isinstance(posted_at, str):
+            try:
+                posted_at = datetime.fromisoformat(posted_at.strip().replace('Z', '+00:00'))
+            except ValueError:
+                logger.debug(f"Skipped post {post_id}: unparseable posted_at {posted_at!r}")
+                return None
+        elif not isinstance(posted_at, datetime):
+            logger.debug(f"Skipped post {post_id}: unsupported posted_at {posted_at!r}")
+            return None
 
-        # Clean the question
-        text = question.replace('?', '').replace(',', '').replace("'s", '')
+        try:
+            engagement = int(post_data.get('engagement_score') or 0)
+        except (TypeError, ValueError, OverflowError):
+            engagement = 0
+        engagement = max(_INT4_MIN, min(_INT4_MAX, engagement))
+
+        author = clean(post_data.get('author'))
+        url = clean(post_data.get('url'))
+        return (
+            str(uuid4()),
+            post_id,
+            platform[:_POST_FIELD_MAX_LENGTH],
+            str(author)[:_POST_FIELD_MAX_LENGTH] if author else None,
+            content,
+            url,
+            engagement,
+            posted_at,
+            fetched_at,
+            related,
+        )
 
-        # Remove dollar amounts, percentages, and number ranges
-        text = re.sub(r'\$[\d,.]+\+?', '', text)
-        text = re.sub(r'[\d,.]+%', '', text)
-        text = re.sub(r'[\d,.]+-[\d,.]+', '', text)
-        text = re.sub(r'\b\d{1,3}(,\d{3})+\b', '', text)  # e.g. 1,750,000
+    def _write_social_posts(self, rows: List[Tuple]) -> List[Tuple[str, bool]]:
+        """
+        Upsert social_posts rows in one transaction.
 
-        words = text.split()
+        Args:
+            rows: Row tuples in _SOCIAL_POST_TEMPLATE order, sorted by post_id
 
-        # Keep capitalized words (proper nouns) with priority
-        proper_nouns = []
-        regular_words = []
-        for w in words:
-            clean = re.sub(r'[^a-zA-Z]', '', w)
-            if len(clean) < 3:
-                continue
-            if clean.lower() in stop_words:
-                continue
-            if w[0].isupper():
-                proper_nouns.append(clean)
+        Returns:
+            (post_id, inserted) pairs for rows that were inserted or linked
+        """
+        with self.db_manager.get_session() as session:
+            session.execute(_ASYNC_COMMIT_SQL)  # posts are re-collected next cycle
+            cur = session.connection().connection.cursor()
+            if len(rows) >= _SOCIAL_POST_COPY_THRESHOLD:
+                returned = self._copy_social_posts(cur, rows)
             else:
-                regular_words.append(clean.lower())
+                returned = execute_values(
+                    cur,
+                    _SOCIAL_POST_UPSERT_SQL,
+                    rows,
+                    template=_SOCIAL_POST_TEMPLATE,
+                    page_size=_BULK_BATCH_SIZE,
+                    fetch=True
+                )
+            session.commit()
+        return returned
+
+    @staticmethod
+    def _copy_social_posts(cur, rows: List[Tuple]) -> List[Tuple[str, bool]]:
+        """
+        Upsert a large post batch with COPY through a staging table.
+
+        Streams the rows as CSV into a temp table in one round-trip, then
+        merges them into social_posts with the same ON CONFLICT rules as
+        the execute_values path.
+
+        Args:
+            cur: psycopg2 cursor inside the caller's transaction
+            rows: Row tuples in _SOCIAL_POST_TEMPLATE order (id first)
 
-        # Proper nouns first (Trump, Bitcoin, etc.), then other meaningful words
-        keywords = proper_nouns + regular_words
+        Returns:
+            (post_id, inserted) pairs from the merge
+        """
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator='\n')
+        for row in rows:
+            # The id is generated server-side here; arrays use Postgres literal syntax
+            writer.writerow(row[1:-1] + ('{' + ','.join(row[-1]) + '}',))
+        buf.seek(0)
+
+        cur.execute(_SOCIAL_POST_STAGING_DDL)
+        cur.copy_expert(_SOCIAL_POST_COPY_SQL, buf)
+        cur.execute(_SOCIAL_POST_MERGE_SQL)
+        return cur.fetchall()
 
-        # Deduplicate while preserving order
-        seen = set()
-        unique = []
-        for kw in keywords:
-            kw_lower = kw.lower()
-            if kw_lower not in seen:
-                seen.add(kw_lower)
-                unique.append(kw)
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_keywords(question: str) -> Tuple[str, ...]:
+        """
+        Extract meaningful search keywords from a Polymarket question.
+
+        Filters out stop words, numbers, price tokens, and generic terms
+        to produce keywords that will return relevant social media results.
+        Results are memoized per question string (the same markets recur
+        every cycle), so the return value is an immutable tuple.
+
+        Args:
+            question: Market question
+
+        Returns:
+            Tuple of keywords (most specific first)
+        """
+        # Clean the question: drop possessives, then every non-letter (dollar
+        # amounts, percentages, ranges, punctuation) in a single C-level pass
+        words = _NON_ALPHA_RE.sub('', question.replace("'s", '')).split()
+
+        # Keep capitalized words (proper nouns) with priority
+        candidates = [
+            (w, w.lower()) for w in words
+            if len(w) >= 3 and w.lower() not in _KEYWORD_STOP_WORDS
+        ]
+        proper_nouns = [(lower, w) for w, lower in candidates if w[0].isupper()]
+        regular_words = [(lower, lower) for w, lower in candidates if not w[0].isupper()]
+
+        # Proper nouns first (Trump, Bitcoin, etc.), then other meaningful words;
+        # dict keeps the first spelling of each case-insensitive keyword, in order
+        unique_by_lower: Dict[str, str] = {}
+        for lower, kw in proper_nouns + regular_words:
+            unique_by_lower.setdefault(lower, kw)
+        unique = list(unique_by_lower.values())
 
         # If no proper nouns were found and only 1 generic word remains,
         # the keywords aren't specific enough for useful search results
         if not proper_nouns and len(unique) <= 1:
-            return []
+            return ()
 
-        return unique[:5]
+        return tuple(unique[:5])
 
     def create_collection_task(self) -> Task:
         """
@@ -904,16 +1365,23 @@ class DataCollectionAgent:
         """
         logger.info("=== Starting Data Collection Agent ===")
 
+        # One clock read per cycle: every odds/post row from this run shares it
+        cycle_ts = datetime.now(timezone.utc)
+
+        # Search results are only reused within a single cycle
+        with self._query_cache_lock:
+            self._query_cache.clear()
+
         # Collect market data
-        contracts = self.collect_market_data()
+        contracts = self.collect_market_data(cycle_ts)
 
         # Collect social media data
-        social_data = self.collect_social_media_data(contracts)
+        social_data = self.collect_social_media_data(contracts, cycle_ts)
 
         results = {
             'contracts': contracts,
             'social_posts': social_data,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': cycle_ts.isoformat()
         }
 
         logger.info(f"Data collection complete: {len(contracts)} contracts, "
@@ -1,27 +1,155 @@
 """Gap Detection Agent - Identifies pricing inefficiencies in prediction markets."""
 
+import concurrent.futures
+import functools
+import hashlib
 import json
+import re
 import sys
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 from uuid import UUID
 
 sys.path.insert(0, str(Path.home() / ".api-monitor"))
 
 from crewai import Agent, Task
-from sqlalchemy import func
+from sqlalchemy import case, distinct, func
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg
+from sqlalchemy.orm import load_only
 
 from ..config import get_settings, get_llm
 from ..database import get_db_manager
-from ..database.models import Contract, DetectedGap, SentimentAnalysis, HistoricalOdds
+from ..database.models import Contract, DetectedGap, SentimentAnalysis, HistoricalOdds, SocialPost
 from ..services.kalshi_api import KalshiAPI
 from ..services.manifold_api import ManifoldAPI
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Contract columns the detectors read; loading only these skips description
+# and the other text columns nothing here uses
+_DETECTOR_COLUMNS = load_only(
+    Contract.id, Contract.question, Contract.end_date, Contract.current_yes_odds,
+    Contract.current_no_odds, Contract.volume_24h, Contract.liquidity,
+)
+
+# Information-asymmetry windows: 2-hour "recent" vs 2-6 hour "baseline",
+# and the minimum sentiment rows each window needs
+_ASYMMETRY_RECENT_HOURS = 2
+_ASYMMETRY_BASELINE_HOURS = 6
+_ASYMMETRY_MIN_RECENT = 5
+_ASYMMETRY_MIN_BASELINE = 3
+
+# Minimum volume snapshots in the volume-spike recent and baseline windows
+_SPIKE_MIN_RECENT = 2
+_SPIKE_MIN_BASELINE = 3
+
+# Quanta for the DECIMAL(5, 4) odds and DECIMAL(5, 2) edge columns, built once
+_ODDS_QUANTUM = Decimal('0.0001')
+_EDGE_QUANTUM = Decimal('0.01')
+
+# Maximum number of generated explanations kept in memory
+_EXPLANATION_CACHE_SIZE = 1024
+
+# Maximum number of cross-market match decisions kept in memory
+_MATCH_CACHE_SIZE = 1024
+
+# Maximum number of cross-market search results kept in memory
+_SEARCH_CACHE_SIZE = 512
+
+# Maximum number of contracts on the arbitrage skip list
+_NO_ARBITRAGE_CACHE_SIZE = 4096
+
+_NON_WORD_RE = re.compile(r'[^a-z0-9]+')
+
+# LLM JSON cleanup: first opening bracket, and trailing commas before a close
+_JSON_START_RE = re.compile(r'[\[{]')
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+
+# Filler words dropped when turning a question into a cross-market search query
+_STOP_WORDS = frozenset({
+    'will', 'the', 'be', 'in', 'on', 'by', 'a', 'an', 'of', 'to',
+    'for', 'is', 'at', 'or', 'and', 'this', 'that', 'with', 'from',
+    'before', 'after', 'during', 'than', 'more', 'less', 'over',
+    'under', 'between', 'above', 'below', 'how', 'many', 'much',
+    'what', 'which', 'who', 'when', 'where', 'does', 'do', 'did',
+    'has', 'have', 'had', 'been', 'being', 'are', 'was', 'were',
+    'would', 'could', 'should', 'may', 'might', 'can', 'shall',
+})
+
+
+def _normalize_question(text: str) -> str:
+    """Lowercase a market question and collapse punctuation/whitespace for cache keys."""
+    return _NON_WORD_RE.sub(' ', text.lower()).strip()
+
+
+# Fixed instruction headers for LLM prompts. Each prompt starts with one of
+# these and puts the per-call data last, so providers that cache prompt
+# prefixes (OpenAI, DeepSeek) can reuse the shared part across calls.
+_EXPLANATION_INSTRUCTIONS = """Generate a clear, concise explanation for a pricing gap in a prediction market.
+
+Provide a 2-3 sentence explanation that:
+1. Describes the gap clearly
+2. Explains why it exists
+3. Notes the direction (bullish/bearish opportunity)
+
+Be specific and actionable. Do not use phrases like "might" or "could be" - be direct.
+
+"""
+
+_MATCH_INSTRUCTIONS = """Determine which of the candidate prediction markets below are about the SAME event as the Polymarket question.
+
+For each candidate, respond with ONLY a valid JSON array. Each element should have:
+- "index": the candidate number (1-based)
+- "match": true or false — true only if they resolve on the same real-world event
+- "confidence": 0.0 to 1.0 (how confident this is the same event)
+- "inverted": true if the questions are semantically OPPOSITE (e.g. "Will X resign?" vs "Will X remain in office?"), false otherwise
+
+Key rule: markets can cover the same event but be framed in opposite directions.
+For example, "Will Trump resign by 2026?" and "Will Trump be president at end of 2026?" resolve
+on the same underlying fact but YES on one corresponds to NO on the other — mark inverted=true.
+Only mark match=true if the markets genuinely resolve on the same underlying event.
+Respond with ONLY the JSON array, no extra text.
+
+"""
+
+_BATCH_MATCH_INSTRUCTIONS = """For each Polymarket CONTRACT below, determine which of its candidate markets from other platforms are about the SAME event.
+
+Respond with ONLY a valid JSON object mapping each contract number (as a string, e.g. "1") to a JSON array. Each array element should have:
+- "index": the candidate number (1-based, within that contract)
+- "match": true or false — true only if they resolve on the same real-world event
+- "confidence": 0.0 to 1.0 (how confident this is the same event)
+- "inverted": true if the questions are semantically OPPOSITE (e.g. "Will X resign?" vs "Will X remain in office?"), false otherwise
+
+Key rule: markets can cover the same event but be framed in opposite directions.
+For example, "Will Trump resign by 2026?" and "Will Trump be president at end of 2026?" resolve
+on the same underlying fact but YES on one corresponds to NO on the other — mark inverted=true.
+Only mark match=true if the markets genuinely resolve on the same underlying event.
+Respond with ONLY the JSON object, no extra text.
+
+"""
+
+
+class ExplanationPrompt(NamedTuple):
+    """LLM prompt for a gap explanation, with the text to use if the call fails."""
+
+    prompt: str
+    fallback: str
+
+
+class ArbitrageCheck(NamedTuple):
+    """A contract's cross-market candidates awaiting LLM matching, detached from its session."""
+
+    contract_id: str
+    question: str
+    yes_odds: Decimal
+    candidates: List[Dict]
+
 
 class GapDetectionAgent:
     """
@@ -42,6 +170,34 @@ class GapDetectionAgent:
         # Initialize LLM (OpenAI or Ollama based on config)
         self.llm = get_llm()
 
+        # CrewAI agent definition, built on first use by create_crewai_agent()
+        self._crewai_agent: Optional[Agent] = None
+
+        # sha1(prompt) -> (expires_at, explanation); prompts repeat across
+        # cycles while a market's odds and sentiment stay put. Reachable from
+        # the public detect_* methods on any thread, so guarded like the others
+        self._explanation_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._explanation_cache_lock = threading.Lock()
+
+        # Cross-market match decisions keyed by the normalized questions only
+        # (not the candidates' live probabilities), shared by detection workers
+        self._match_cache: "OrderedDict[str, Tuple[float, List[Tuple[int, float, bool]]]]" = OrderedDict()
+        self._match_cache_lock = threading.Lock()
+
+        # Competitor-platform search results keyed by extracted search query;
+        # related contracts often reduce to the same query
+        self._search_cache: "OrderedDict[str, Tuple[float, List[Dict]]]" = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        # contract id -> time until which arbitrage is skipped, set when a
+        # search found no candidates or the LLM confirmed no matches. Kept in
+        # expiry order so expired entries can be pruned from the front.
+        self._no_arbitrage_until: "OrderedDict[str, float]" = OrderedDict()
+        self._no_arbitrage_lock = threading.Lock()
+        self._search_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.settings.gap_detection_workers,
+            thread_name_prefix='market-search'
+        )
+
         # Initialize cross-market API clients for arbitrage detection
         self.kalshi_api = KalshiAPI()
         self.manifold_api = ManifoldAPI()
@@ -66,7 +222,35 @@ class GapDetectionAgent:
 
     def _invoke_llm(self, prompt: str) -> str:
         """Call LLM and return the response text, handling provider differences."""
-        response = self.llm.invoke(prompt)
+        return self._response_text(self.llm.invoke(prompt))
+
+    def _invoke_llm_batch(self, prompts: List[str]) -> List[Optional[str]]:
+        """
+        Send several prompts to the LLM concurrently.
+
+        Args:
+            prompts: Prompts to send
+
+        Returns:
+            Response texts in prompt order; None where a call failed
+        """
+        responses = self.llm.batch(
+            prompts,
+            config={'max_concurrency': self.settings.llm_batch_concurrency},
+            return_exceptions=True
+        )
+        texts = []
+        for response in responses:
+            if isinstance(response, Exception):
+                logger.error(f"LLM batch call failed: {response}")
+                texts.append(None)
+            else:
+                texts.append(self._response_text(response))
+        return texts
+
+    @staticmethod
+    def _response_text(response) -> str:
+        """Log token usage for one LLM response and return its text."""
         try:
             from api_logger import log_api_call
             meta = getattr(response, "response_metadata", {}) or {}
@@ -85,26 +269,21 @@ class GapDetectionAgent:
     @staticmethod
     def _clean_json(text: str) -> str:
         """Strip markdown code fences and repair common LLM JSON issues."""
-        import re
-
         if text.startswith('```'):
             text = text.split('```')[1]
             if text.startswith('json'):
                 text = text[4:]
             text = text.strip()
 
-        first_bracket = min(
-            (text.find('[') if text.find('[') >= 0 else len(text)),
-            (text.find('{') if text.find('{') >= 0 else len(text))
-        )
-        if first_bracket < len(text):
-            text = text[first_bracket:]
+        first_bracket = _JSON_START_RE.search(text)
+        if first_bracket:
+            text = text[first_bracket.start():]
 
         last_close = max(text.rfind(']'), text.rfind('}'))
         if last_close >= 0:
             text = text[:last_close + 1]
 
-        text = re.sub(r',\s*([}\]])', r'\1', text)
+        text = _TRAILING_COMMA_RE.sub(r'\1', text)
 
         return text
 
@@ -112,10 +291,15 @@ class GapDetectionAgent:
         """
         Create CrewAI agent definition.
 
+        The Agent is built once and reused by every task this instance creates.
+
         Returns:
             CrewAI Agent instance
         """
-        return Agent(
+        if self._crewai_agent is not None:
+            return self._crewai_agent
+
+        self._crewai_agent = Agent(
             role='Market Inefficiency Detector',
             goal='Identify pricing gaps and inefficiencies in prediction markets',
             backstory="""You are an expert quantitative analyst specializing in prediction
@@ -126,6 +310,142 @@ class GapDetectionAgent:
             allow_delegation=False,
             llm=self.llm
         )
+        return self._crewai_agent
+
+    @staticmethod
+    def _sentiment_aggregates(session, contract_ids: List[UUID]) -> Dict[UUID, Tuple]:
+        """
+        Aggregate sentiment for many contracts in one GROUP BY query.
+
+        Args:
+            session: Open database session
+            contract_ids: Contract primary keys to aggregate
+
+        Returns:
+            contract id -> (avg_score, total_posts, positive_count, platforms).
+            The score prefers ensemble_score, and AVG skips rows with neither.
+        """
+        if not contract_ids:
+            return {}
+        rows = session.query(
+            SentimentAnalysis.contract_id,
+            func.avg(func.coalesce(SentimentAnalysis.ensemble_score, SentimentAnalysis.sentiment_score)),
+            func.count(SentimentAnalysis.id),
+            func.sum(case((SentimentAnalysis.sentiment_label == 'positive', 1), else_=0)),
+            func.array_agg(distinct(SocialPost.platform)).filter(SocialPost.platform.isnot(None))
+        ).outerjoin(
+            SocialPost, SentimentAnalysis.post_id == SocialPost.id
+        ).filter(
+            SentimentAnalysis.contract_id.in_(contract_ids)
+        ).group_by(SentimentAnalysis.contract_id).all()
+        return {row[0]: tuple(row[1:]) for row in rows}
+
+    @staticmethod
+    def _odds_statistics(session, contract_ids: List[UUID]) -> Dict[UUID, Tuple]:
+        """
+        Summarize odds history for many contracts in one GROUP BY query.
+
+        Args:
+            session: Open database session
+            contract_ids: Contract primary keys to summarize
+
+        Returns:
+            contract id -> (avg_odds, std_dev, point_count, latest_odds), using
+            the population standard deviation
+        """
+        if not contract_ids:
+            return {}
+        rows = session.query(
+            HistoricalOdds.contract_id,
+            func.avg(HistoricalOdds.yes_odds),
+            func.stddev_pop(HistoricalOdds.yes_odds),
+            func.count(HistoricalOdds.id),
+            array_agg(aggregate_order_by(HistoricalOdds.yes_odds, HistoricalOdds.recorded_at.desc()))[1]
+        ).filter(
+            HistoricalOdds.contract_id.in_(contract_ids)
+        ).group_by(HistoricalOdds.contract_id).all()
+        return {row[0]: tuple(row[1:]) for row in rows}
+
+    def _window_activity(
+        self,
+        session,
+        contract_ids: List[UUID],
+        now: datetime
+    ) -> Dict[UUID, Tuple[int, int]]:
+        """
+        Count rows in the information-asymmetry and volume-spike windows.
+
+        Lets analyze_all_contracts skip those detectors' per-contract queries
+        for contracts that cannot meet their minimum data. The detectors use
+        the same now, and each window is counted whole, so the counts are an
+        upper bound on what they see and never skip a real gap.
+
+        Args:
+            session: Open database session
+            contract_ids: Contract primary keys to count
+            now: Detection start time
+
+        Returns:
+            contract id -> (sentiment rows in the asymmetry window,
+            volume snapshots in the spike window)
+        """
+        if not contract_ids:
+            return {}
+        sentiment_counts = dict(session.query(
+            SentimentAnalysis.contract_id, func.count(SentimentAnalysis.id)
+        ).filter(
+            SentimentAnalysis.contract_id.in_(contract_ids),
+            SentimentAnalysis.analyzed_at >= now - timedelta(hours=_ASYMMETRY_BASELINE_HOURS)
+        ).group_by(SentimentAnalysis.contract_id).all())
+
+        spike_hours = getattr(self.settings, 'volume_spike_baseline_hours', 12)
+        snapshot_counts = dict(session.query(
+            HistoricalOdds.contract_id, func.count(HistoricalOdds.id)
+        ).filter(
+            HistoricalOdds.contract_id.in_(contract_ids),
+            HistoricalOdds.recorded_at >= now - timedelta(hours=spike_hours),
+            HistoricalOdds.volume.isnot(None)
+        ).group_by(HistoricalOdds.contract_id).all())
+
+        return {
+            cid: (sentiment_counts.get(cid, 0), snapshot_counts.get(cid, 0))
+            for cid in contract_ids
+        }
+
+    def _run_for_contract(self, contract_id: str, detect: Callable, default=None):
+        """
+        Load one contract in a fresh session and run an internal detector on it.
+
+        Args:
+            contract_id: Contract UUID as string
+            detect: Callable taking (session, contract)
+            default: Value returned if the contract is missing or loading fails
+
+        Returns:
+            The detector's result, or default
+        """
+        try:
+            with self.db_manager.get_session() as session:
+                contract = session.get(Contract, UUID(contract_id), options=[_DETECTOR_COLUMNS])
+                if contract is None:
+                    return default
+                result = detect(session, contract)
+        except Exception as e:
+            logger.error(f"Error loading contract {contract_id} for gap detection: {e}")
+            return default
+
+        # Explanations are generated after the session is closed, and only
+        # for gaps that clear min_confidence_score; the rest keep the
+        # fallback text
+        gaps = [result] if isinstance(result, dict) else result if isinstance(result, list) else []
+        to_explain = []
+        for gap in gaps:
+            if gap['confidence_score'] >= self.settings.min_confidence_score:
+                to_explain.append(gap)
+            else:
+                gap.pop('explanation_prompt', None)
+        self._fill_explanations(to_explain)
+        return result
 
     def detect_sentiment_mismatch(self, contract_id: str) -> Optional[Dict]:
         """
@@ -137,141 +457,220 @@ class GapDetectionAgent:
         Returns:
             Gap dictionary if detected, None otherwise
         """
+        return self._run_for_contract(
+            contract_id,
+            lambda session, contract: self._detect_sentiment_mismatch(
+                session, contract, self._sentiment_aggregates(session, [contract.id]).get(contract.id)
+            )
+        )
+
+    def detect_information_asymmetry(self, contract_id: str) -> Optional[Dict]:
+        """
+        Detect information asymmetry gaps (recent news not reflected in odds).
+
+        Args:
+            contract_id: Contract UUID as string
+
+        Returns:
+            Gap dictionary if detected, None otherwise
+        """
+        return self._run_for_contract(contract_id, self._detect_information_asymmetry)
+
+    def detect_pattern_deviation(self, contract_id: str) -> Optional[Dict]:
+        """
+        Detect historical pattern deviations.
+
+        Args:
+            contract_id: Contract UUID as string
+
+        Returns:
+            Gap dictionary if detected, None otherwise
+        """
+        return self._run_for_contract(
+            contract_id,
+            lambda session, contract: self._detect_pattern_deviation(
+                contract, self._odds_statistics(session, [contract.id]).get(contract.id)
+            )
+        )
+
+    def detect_cross_market_arbitrage(self, contract_id: str) -> List[Dict]:
+        """
+        Detect cross-market arbitrage against Kalshi and Manifold Markets.
+
+        Args:
+            contract_id: Contract UUID as string
+
+        Returns:
+            List of arbitrage gap dicts (one per platform with price discrepancy)
+        """
+        return self._run_for_contract(
+            contract_id,
+            lambda session, contract: self._detect_cross_market_arbitrage(contract),
+            default=[]
+        )
+
+    def detect_volume_spike(self, contract_id: str) -> Optional[Dict]:
+        """
+        Detect volume spikes not yet reflected in the contract price.
+
+        Args:
+            contract_id: Contract UUID as string
+
+        Returns:
+            Gap dictionary if detected, None otherwise
+        """
+        return self._run_for_contract(contract_id, self._detect_volume_spike)
+
+    def _detect_sentiment_mismatch(
+        self,
+        session,
+        contract: Contract,
+        aggregates: Optional[Tuple]
+    ) -> Optional[Dict]:
+        """
+        Detect sentiment-probability mismatch for a contract.
+
+        Args:
+            session: Open database session
+            contract: Contract to analyze
+            aggregates: Row from _sentiment_aggregates for this contract, or None
+
+        Returns:
+            Gap dictionary if detected, None otherwise
+        """
+        contract_id = str(contract.id)
         try:
-            with self.db_manager.get_session() as session:
-                # Get contract
-                contract = session.query(Contract).filter(
-                    Contract.id == UUID(contract_id)
-                ).first()
-
-                if not contract or not contract.current_yes_odds:
-                    return None
-
-                # Get sentiment data
-                sentiment_analyses = session.query(SentimentAnalysis).filter(
-                    SentimentAnalysis.contract_id == UUID(contract_id)
-                ).all()
-
-                if not sentiment_analyses or len(sentiment_analyses) < 3:
-                    # Need sufficient data
-                    return None
-
-                # Calculate aggregate sentiment (prefer ensemble_score if available)
-                scores = []
-                for s in sentiment_analyses:
-                    if s.ensemble_score is not None:
-                        scores.append(float(s.ensemble_score))
-                    elif s.sentiment_score is not None:
-                        scores.append(float(s.sentiment_score))
-                avg_sentiment = sum(scores) / len(scores) if scores else 0.0
-                positive_count = sum(1 for s in sentiment_analyses if s.sentiment_label == 'positive')
-                positive_ratio = positive_count / len(sentiment_analyses)
-
-                # Current market odds
-                market_odds = float(contract.current_yes_odds)
-
-                # Use sentiment as a RELATIVE adjustment to market price.
-                # Positive sentiment suggests the market should be higher;
-                # negative sentiment suggests the market should be lower.
-                scale = getattr(self.settings, 'gap_sentiment_prob_scale', 0.4)
-                sentiment_adjustment = avg_sentiment * scale
-                implied_prob = market_odds + sentiment_adjustment
-                implied_prob = max(0.05, min(0.95, implied_prob))  # Clamp to valid range
-                implied_odds = Decimal(str(round(implied_prob, 4)))
-
-                # Calculate gap
-                gap_size = abs(implied_prob - market_odds)
-
-                # Check if gap exceeds threshold
-                if gap_size < self.settings.gap_detection_threshold:
-                    return None
-
-                # Determine direction and confidence
-                if implied_prob > market_odds:
-                    direction = "bullish"
-                    edge = (implied_prob - market_odds) * 100
-                else:
-                    direction = "bearish"
-                    edge = (market_odds - implied_prob) * 100
-
-                # Calculate confidence score (0-100)
-                # Count distinct social platforms
-                social_platforms = set()
-                for s in sentiment_analyses:
-                    if hasattr(s, 'post') and s.post and hasattr(s.post, 'platform'):
-                        social_platforms.add(s.post.platform)
-                social_sources_count = len(social_platforms)
-
-                # Compute contract features if engine available
-                contract_features = {}
-                if self.feature_engine:
-                    try:
-                        hist = session.query(HistoricalOdds).filter(
-                            HistoricalOdds.contract_id == UUID(contract_id)
-                        ).order_by(HistoricalOdds.recorded_at.asc()).all()
-                        hist_dicts = [{'yes_odds': float(h.yes_odds), 'volume': float(h.volume or 0)} for h in hist]
-                        contract_features = self.feature_engine.compute_features(
-                            contract.to_dict(), hist_dicts
-                        )
-                    except Exception:
-                        pass
-
-                if self.confidence_scorer:
-                    consistency = abs(positive_ratio - 0.5) * 2
-                    confidence = self.confidence_scorer.score(
-                        gap_type='sentiment_mismatch',
-                        gap_size=gap_size,
-                        data_volume=len(sentiment_analyses),
-                        sentiment_consistency=consistency,
-                        social_sources_count=social_sources_count,
-                        contract_features=contract_features,
-                    )
-                else:
-                    # Fallback to inline calculation
-                    gap_factor = min(gap_size / 0.15, 1.0) * 40
-                    volume_factor = min(len(sentiment_analyses) / 15, 1.0) * 30
-                    consistency_factor = abs(positive_ratio - 0.5) * 2 * 30
-                    confidence = min(max(int(gap_factor + volume_factor + consistency_factor), 0), 100)
-
-                # Generate explanation using LLM
-                explanation = self._generate_gap_explanation(
-                    contract=contract,
-                    gap_type="sentiment_mismatch",
-                    market_odds=market_odds,
-                    implied_odds=float(implied_odds),
-                    sentiment_data={
-                        'avg_sentiment': avg_sentiment,
-                        'positive_ratio': positive_ratio,
-                        'total_posts': len(sentiment_analyses),
-                        'direction': direction
-                    }
+            if not contract.current_yes_odds:
+                return None
+
+            if aggregates is None:
+                return None
+
+            avg_score, total_posts, positive_count, platforms = aggregates
+            if total_posts < 3:
+                # Need sufficient data
+                return None
+
+            avg_sentiment = float(avg_score) if avg_score is not None else 0.0
+            positive_ratio = (positive_count or 0) / total_posts
+
+            # Current market odds
+            market_odds = float(contract.current_yes_odds)
+
+            # Use sentiment as a RELATIVE adjustment to market price.
+            # Positive sentiment suggests the market should be higher;
+            # negative sentiment suggests the market should be lower.
+            scale = getattr(self.settings, 'gap_sentiment_prob_scale', 0.4)
+            sentiment_adjustment = avg_sentiment * scale
+            implied_prob = market_odds + sentiment_adjustment
+            implied_prob = max(0.05, min(0.95, implied_prob))  # Clamp to valid range
+            implied_odds = Decimal(implied_prob).quantize(_ODDS_QUANTUM, ROUND_HALF_UP)
+
+            # Calculate gap
+            gap_size = abs(implied_prob - market_odds)
+
+            # Check if gap exceeds threshold
+            if gap_size < self.settings.gap_detection_threshold:
+                return None
+
+            # Determine direction and confidence
+            if implied_prob > market_odds:
+                direction = "bullish"
+                edge = (implied_prob - market_odds) * 100
+            else:
+                direction = "bearish"
+                edge = (market_odds - implied_prob) * 100
+
+            # Calculate confidence score (0-100)
+            # Count distinct social platforms
+            social_platforms = set(platforms or [])
+            social_sources_count = len(social_platforms)
+
+            # Compute contract features if engine available
+            contract_features = {}
+            if self.feature_engine:
+                try:
+                    # Stream the full history as column tuples rather than
+                    # buffering every row before conversion
+                    hist = session.query(HistoricalOdds.yes_odds, HistoricalOdds.volume).filter(
+                        HistoricalOdds.contract_id == contract.id
+                    ).order_by(HistoricalOdds.recorded_at.asc()).yield_per(2000)
+                    hist_dicts = [{'yes_odds': float(h.yes_odds), 'volume': float(h.volume or 0)} for h in hist]
+                    # Only the fields compute_features reads, so the deferred
+                    # columns are never lazy-loaded
+                    contract_features = self.feature_engine.compute_features({
+                        'end_date': contract.end_date,
+                        'current_yes_odds': contract.current_yes_odds,
+                        'current_no_odds': contract.current_no_odds,
+                        'volume_24h': contract.volume_24h,
+                        'liquidity': contract.liquidity,
+                    }, hist_dicts)
+                except Exception:
+                    pass
+
+            if self.confidence_scorer:
+                consistency = abs(positive_ratio - 0.5) * 2
+                confidence = self.confidence_scorer.score(
+                    gap_type='sentiment_mismatch',
+                    gap_size=gap_size,
+                    data_volume=total_posts,
+                    sentiment_consistency=consistency,
+                    social_sources_count=social_sources_count,
+                    contract_features=contract_features,
                 )
-
-                return {
-                    'contract_id': contract_id,
-                    'gap_type': 'sentiment_mismatch',
-                    'confidence_score': confidence,
-                    'explanation': explanation,
-                    'market_odds': contract.current_yes_odds,
-                    'implied_odds': implied_odds,
-                    'edge_percentage': Decimal(str(round(edge, 2))),
-                    'social_sources_count': social_sources_count,
-                    'contract_features': contract_features,
-                    'evidence': {
-                        'avg_sentiment': round(avg_sentiment, 3),
-                        'positive_ratio': round(positive_ratio, 3),
-                        'total_posts': len(sentiment_analyses),
-                        'direction': direction,
-                        'gap_size': round(gap_size, 3),
-                        'social_sources': list(social_platforms),
-                    }
+            else:
+                # Fallback to inline calculation
+                gap_factor = min(gap_size / 0.15, 1.0) * 40
+                volume_factor = min(total_posts / 15, 1.0) * 30
+                consistency_factor = abs(positive_ratio - 0.5) * 2 * 30
+                confidence = min(max(int(gap_factor + volume_factor + consistency_factor), 0), 100)
+
+            # Explanation prompt (sent to the LLM in batch by _fill_explanations)
+            explanation_prompt = self._explanation_prompt(
+                question=contract.question,
+                gap_type="sentiment_mismatch",
+                market_odds=market_odds,
+                implied_odds=float(implied_odds),
+                sentiment_data={
+                    'avg_sentiment': round(avg_sentiment, 3),
+                    'positive_ratio': round(positive_ratio, 3),
+                    'total_posts': total_posts,
+                    'direction': direction
+                }
+            )
+
+            return {
+                'contract_id': contract_id,
+                'gap_type': 'sentiment_mismatch',
+                'confidence_score': confidence,
+                'explanation': explanation_prompt.fallback,
+                'explanation_prompt': explanation_prompt.prompt,
+                'market_odds': contract.current_yes_odds,
+                'implied_odds': implied_odds,
+                'edge_percentage': Decimal(edge).quantize(_EDGE_QUANTUM, ROUND_HALF_UP),
+                'social_sources_count': social_sources_count,
+                'contract_features': contract_features,
+                'evidence': {
+                    'avg_sentiment': round(avg_sentiment, 3),
+                    'positive_ratio': round(positive_ratio, 3),
+                    'total_posts': total_posts,
+                    'direction': direction,
+                    'gap_size': round(gap_size, 3),
+                    'social_sources': list(social_platforms),
                 }
+            }
 
         except Exception as e:
+            session.rollback()  # keep a shared session usable for the next detector
             logger.error(f"Error detecting sentiment mismatch: {e}")
             return None
 
-    def detect_information_asymmetry(self, contract_id: str) -> Optional[Dict]:
+    def _detect_information_asymmetry(
+        self,
+        session,
+        contract: Contract,
+        now: Optional[datetime] = None
+    ) -> Optional[Dict]:
         """
         Detect information asymmetry gaps (recent news not reflected in odds).
 
@@ -282,346 +681,398 @@ class GapDetectionAgent:
 
         News articles (news_rss) are weighted 3x; Reddit 1.5x; social 1x.
         Engagement score provides a secondary weight boost (up to 1.5x).
+
+        Args:
+            session: Open database session
+            contract: Contract to analyze
+            now: Window end time (defaults to the current time)
         """
+        contract_id = str(contract.id)
         # Source quality weights — news > reddit > social
         SOURCE_WEIGHTS = {'news_rss': 3.0, 'reddit': 1.5}
         DEFAULT_WEIGHT = 1.0
 
-        # Time windows: 2-hour "recent" vs 2-6 hour "baseline"
-        RECENT_HOURS = 2
-        BASELINE_HOURS = 6
-
         try:
-            with self.db_manager.get_session() as session:
-                contract = session.query(Contract).filter(
-                    Contract.id == UUID(contract_id)
-                ).first()
-
-                if not contract or not contract.current_yes_odds:
-                    return None
-
-                now = datetime.now(timezone.utc)
-                recent_cutoff = now - timedelta(hours=RECENT_HOURS)
-                baseline_cutoff = now - timedelta(hours=BASELINE_HOURS)
-
-                # Fetch recent sentiment (with posts for platform/engagement data)
-                recent_analyses = session.query(SentimentAnalysis).join(
-                    SentimentAnalysis.post
-                ).filter(
-                    SentimentAnalysis.contract_id == UUID(contract_id),
-                    SentimentAnalysis.analyzed_at >= recent_cutoff
-                ).all()
-
-                # Fetch baseline sentiment
-                baseline_analyses = session.query(SentimentAnalysis).join(
-                    SentimentAnalysis.post
-                ).filter(
-                    SentimentAnalysis.contract_id == UUID(contract_id),
-                    SentimentAnalysis.analyzed_at >= baseline_cutoff,
-                    SentimentAnalysis.analyzed_at < recent_cutoff
-                ).all()
-
-                # Minimum volume requirements
-                if len(recent_analyses) < 5 or len(baseline_analyses) < 3:
-                    return None
-
-                # --- Volume spike check ---
-                # Normalize both windows to posts/hour for a fair comparison
-                baseline_window_hours = BASELINE_HOURS - RECENT_HOURS  # 4 hours
-                recent_rate = len(recent_analyses) / RECENT_HOURS
-                baseline_rate = len(baseline_analyses) / baseline_window_hours
-                volume_spike_ratio = recent_rate / baseline_rate if baseline_rate > 0 else 1.0
-
-                # --- Source-weighted sentiment ---
-                def weighted_avg(analyses):
-                    total_weight = 0.0
-                    weighted_sum = 0.0
-                    for s in analyses:
-                        score = float(
-                            s.ensemble_score if s.ensemble_score is not None
-                            else s.sentiment_score
-                        )
-                        platform = s.post.platform if s.post else 'unknown'
-                        weight = SOURCE_WEIGHTS.get(platform, DEFAULT_WEIGHT)
-                        # Engagement boost: up to 1.5x for highly-engaged posts
-                        engagement = (s.post.engagement_score or 0) if s.post else 0
-                        weight *= 1.0 + (min(engagement, 100) / 100.0) * 0.5
-                        weighted_sum += score * weight
-                        total_weight += weight
-                    return weighted_sum / total_weight if total_weight > 0 else 0.0
-
-                recent_avg = weighted_avg(recent_analyses)
-                baseline_avg = weighted_avg(baseline_analyses)
-                sentiment_shift = recent_avg - baseline_avg
-
-                if abs(sentiment_shift) < 0.15:
-                    return None
-
-                # --- Directional consistency ---
-                # At least 60% of recent posts must agree on direction
-                shift_direction = 1 if sentiment_shift > 0 else -1
-                agreeing = sum(
-                    1 for s in recent_analyses
-                    if (float(s.sentiment_score) * shift_direction) > 0
-                )
-                consistency = agreeing / len(recent_analyses)
-
-                if consistency < 0.60:
-                    return None
-
-                # --- Odds movement over the same window ---
-                # Get the most recent historical odds record before recent_cutoff
-                # so we compare market movement over exactly the sentiment window.
-                odds_at_window_start = session.query(HistoricalOdds).filter(
-                    HistoricalOdds.contract_id == UUID(contract_id),
-                    HistoricalOdds.recorded_at <= recent_cutoff
-                ).order_by(HistoricalOdds.recorded_at.desc()).first()
-
-                if not odds_at_window_start:
-                    # Fall back to the oldest available record
-                    odds_at_window_start = session.query(HistoricalOdds).filter(
-                        HistoricalOdds.contract_id == UUID(contract_id)
-                    ).order_by(HistoricalOdds.recorded_at.asc()).first()
-
-                if not odds_at_window_start:
-                    return None
-
-                odds_then = float(odds_at_window_start.yes_odds)
-                odds_now = float(contract.current_yes_odds)
-                odds_movement = odds_now - odds_then
-
-                # Estimate how much the market should have moved given the signal
-                scale = getattr(self.settings, 'gap_sentiment_prob_scale', 0.4)
-                expected_move = abs(sentiment_shift) * scale
-                market_lag = expected_move - abs(odds_movement)
-
-                # If the market has already moved as much or more than expected, no asymmetry
-                if abs(odds_movement) >= expected_move:
-                    return None
-
-                # Counter-move: market moved opposite to sentiment (stronger signal)
-                odds_direction = 1 if odds_movement > 0 else -1 if odds_movement < 0 else 0
-                counter_move = (odds_direction != 0 and odds_direction != shift_direction)
-
-                # --- Confidence scoring (max 100) ---
-                # Shift magnitude: 0-30
-                shift_factor = min(abs(sentiment_shift) / 0.5, 1.0) * 30
-                # Volume spike: 0-25 (0 at 1x rate, 25 at 3x+ rate)
-                volume_factor = max(0.0, min((volume_spike_ratio - 1.0) / 2.0, 1.0) * 25)
-                # Directional consistency: 0-20 (0 at 60%, 20 at 100%)
-                consistency_factor = max(0.0, (consistency - 0.60) / 0.40 * 20)
-                # Market lag size: 0-15
-                lag_factor = min(market_lag / 0.15, 1.0) * 15
-                # Counter-move bonus: 10
-                counter_factor = 10 if counter_move else 0
-
-                confidence = int(shift_factor + volume_factor + consistency_factor + lag_factor + counter_factor)
-                confidence = max(0, min(confidence, 100))
-
-                # --- Implied probability and edge ---
-                implied_move = sentiment_shift * scale
-                implied_prob = max(0.05, min(0.95, odds_now + implied_move))
-                edge_pct = abs(implied_prob - odds_now) * 100
-
-                # Source breakdown for evidence
-                sources_breakdown: Dict[str, int] = {}
-                for s in recent_analyses:
-                    platform = s.post.platform if s.post else 'unknown'
-                    sources_breakdown[platform] = sources_breakdown.get(platform, 0) + 1
-
-                direction_str = "bullish" if sentiment_shift > 0 else "bearish"
-
-                explanation = self._generate_gap_explanation(
-                    contract=contract,
-                    gap_type="info_asymmetry",
-                    market_odds=odds_now,
-                    implied_odds=implied_prob,
-                    sentiment_data={
-                        'weighted_sentiment_shift': round(sentiment_shift, 3),
-                        'recent_avg': round(recent_avg, 3),
-                        'baseline_avg': round(baseline_avg, 3),
-                        'volume_spike_ratio': round(volume_spike_ratio, 2),
-                        'consistency': round(consistency, 2),
-                        'odds_movement_in_window': round(odds_movement, 4),
-                        'has_news_sources': 'news_rss' in sources_breakdown,
-                        'direction': direction_str,
-                    }
-                )
-
-                return {
-                    'contract_id': contract_id,
-                    'gap_type': 'info_asymmetry',
-                    'confidence_score': confidence,
-                    'explanation': explanation,
-                    'market_odds': contract.current_yes_odds,
-                    'implied_odds': Decimal(str(round(implied_prob, 4))),
-                    'edge_percentage': Decimal(str(round(edge_pct, 2))),
-                    'evidence': {
-                        'weighted_sentiment_shift': round(sentiment_shift, 3),
-                        'recent_avg_sentiment': round(recent_avg, 3),
-                        'baseline_avg_sentiment': round(baseline_avg, 3),
-                        'recent_posts': len(recent_analyses),
-                        'baseline_posts': len(baseline_analyses),
-                        'volume_spike_ratio': round(volume_spike_ratio, 2),
-                        'consistency': round(consistency, 2),
-                        'sources_breakdown': sources_breakdown,
-                        'has_news_sources': 'news_rss' in sources_breakdown,
-                        'odds_at_window_start': round(odds_then, 4),
-                        'odds_movement': round(odds_movement, 4),
-                        'market_lag': round(market_lag, 4),
-                        'direction': direction_str,
-                        'counter_move': counter_move,
-                    }
+            if not contract.current_yes_odds:
+                return None
+
+            now = now or datetime.now(timezone.utc)
+            recent_cutoff = now - timedelta(hours=_ASYMMETRY_RECENT_HOURS)
+            baseline_cutoff = now - timedelta(hours=_ASYMMETRY_BASELINE_HOURS)
+
+            # Aggregate both windows per platform in one query. Engagement
+            # boost (up to 1.5x for highly-engaged posts) is applied in SQL;
+            # the per-platform source weight is applied to the group sums.
+            score = func.coalesce(SentimentAnalysis.ensemble_score, SentimentAnalysis.sentiment_score)
+            engagement_weight = 1.0 + func.least(func.coalesce(SocialPost.engagement_score, 0), 100) / 100.0 * 0.5
+            is_recent = SentimentAnalysis.analyzed_at >= recent_cutoff
+            window_rows = session.query(
+                is_recent,
+                SocialPost.platform,
+                func.count(SentimentAnalysis.id),
+                func.sum(score * engagement_weight),
+                func.sum(case((score.isnot(None), engagement_weight), else_=0)),
+                func.sum(case((SentimentAnalysis.sentiment_score > 0, 1), else_=0)),
+                func.sum(case((SentimentAnalysis.sentiment_score < 0, 1), else_=0)),
+            ).join(
+                SentimentAnalysis.post
+            ).filter(
+                SentimentAnalysis.contract_id == contract.id,
+                SentimentAnalysis.analyzed_at >= baseline_cutoff
+            ).group_by(is_recent, SocialPost.platform).all()
+
+            windows = {
+                True: {'count': 0, 'weighted_sum': 0.0, 'total_weight': 0.0, 'positive': 0, 'negative': 0},
+                False: {'count': 0, 'weighted_sum': 0.0, 'total_weight': 0.0, 'positive': 0, 'negative': 0},
+            }
+            sources_breakdown: Dict[str, int] = {}
+            for recent, platform, count, weighted_sum, total_weight, positive, negative in window_rows:
+                source_weight = SOURCE_WEIGHTS.get(platform, DEFAULT_WEIGHT)
+                w = windows[bool(recent)]
+                w['count'] += count
+                w['weighted_sum'] += float(weighted_sum or 0) * source_weight
+                w['total_weight'] += float(total_weight or 0) * source_weight
+                w['positive'] += positive or 0
+                w['negative'] += negative or 0
+                if recent:
+                    sources_breakdown[platform] = sources_breakdown.get(platform, 0) + count
+            recent_window, baseline_window = windows[True], windows[False]
+            recent_count = recent_window['count']
+            baseline_count = baseline_window['count']
+
+            # Minimum volume requirements
+            if recent_count < _ASYMMETRY_MIN_RECENT or baseline_count < _ASYMMETRY_MIN_BASELINE:
+                return None
+
+            # --- Volume spike check ---
+            # Normalize both windows to posts/hour for a fair comparison
+            baseline_window_hours = _ASYMMETRY_BASELINE_HOURS - _ASYMMETRY_RECENT_HOURS  # 4 hours
+            recent_rate = recent_count / _ASYMMETRY_RECENT_HOURS
+            baseline_rate = baseline_count / baseline_window_hours
+            volume_spike_ratio = recent_rate / baseline_rate if baseline_rate > 0 else 1.0
+
+            # --- Source-weighted sentiment ---
+            def weighted_avg(window):
+                if window['total_weight'] <= 0:
+                    return 0.0
+                return window['weighted_sum'] / window['total_weight']
+
+            recent_avg = weighted_avg(recent_window)
+            baseline_avg = weighted_avg(baseline_window)
+            sentiment_shift = recent_avg - baseline_avg
+
+            if abs(sentiment_shift) < 0.15:
+                return None
+
+            # --- Directional consistency ---
+            # At least 60% of recent posts must agree on direction
+            shift_direction = 1 if sentiment_shift > 0 else -1
+            agreeing = recent_window['positive'] if shift_direction > 0 else recent_window['negative']
+            consistency = agreeing / recent_count
+
+            if consistency < 0.60:
+                return None
+
+            # --- Odds movement over the same window ---
+            # Get the most recent historical odds record before recent_cutoff
+            # so we compare market movement over exactly the sentiment window,
+            # falling back to the oldest available record. Both are LIMIT 1
+            # index lookups, combined with COALESCE into one round trip.
+            odds_before_window = session.query(HistoricalOdds.yes_odds).filter(
+                HistoricalOdds.contract_id == contract.id,
+                HistoricalOdds.recorded_at <= recent_cutoff
+            ).order_by(HistoricalOdds.recorded_at.desc()).limit(1).scalar_subquery()
+            oldest_odds = session.query(HistoricalOdds.yes_odds).filter(
+                HistoricalOdds.contract_id == contract.id
+            ).order_by(HistoricalOdds.recorded_at.asc()).limit(1).scalar_subquery()
+            odds_at_window_start = session.query(
+                func.coalesce(odds_before_window, oldest_odds)
+            ).scalar()
+
+            if odds_at_window_start is None:
+                return None
+
+            odds_then = float(odds_at_window_start)
+            odds_now = float(contract.current_yes_odds)
+            odds_movement = odds_now - odds_then
+
+            # Estimate how much the market should have moved given the signal
+            scale = getattr(self.settings, 'gap_sentiment_prob_scale', 0.4)
+            expected_move = abs(sentiment_shift) * scale
+            market_lag = expected_move - abs(odds_movement)
+
+            # If the market has already moved as much or more than expected, no asymmetry
+            if abs(odds_movement) >= expected_move:
+                return None
+
+            # Counter-move: market moved opposite to sentiment (stronger signal)
+            odds_direction = 1 if odds_movement > 0 else -1 if odds_movement < 0 else 0
+            counter_move = (odds_direction != 0 and odds_direction != shift_direction)
+
+            # --- Confidence scoring (max 100) ---
+            # Shift magnitude: 0-30
+            shift_factor = min(abs(sentiment_shift) / 0.5, 1.0) * 30
+            # Volume spike: 0-25 (0 at 1x rate, 25 at 3x+ rate)
+            volume_factor = max(0.0, min((volume_spike_ratio - 1.0) / 2.0, 1.0) * 25)
+            # Directional consistency: 0-20 (0 at 60%, 20 at 100%)
+            consistency_factor = max(0.0, (consistency - 0.60) / 0.40 * 20)
+            # Market lag size: 0-15
+            lag_factor = min(market_lag / 0.15, 1.0) * 15
+            # Counter-move bonus: 10
+            counter_factor = 10 if counter_move else 0
+
+            confidence = int(shift_factor + volume_factor + consistency_factor + lag_factor + counter_factor)
+            confidence = max(0, min(confidence, 100))
+
+            # --- Implied probability and edge ---
+            implied_move = sentiment_shift * scale
+            implied_prob = max(0.05, min(0.95, odds_now + implied_move))
+            edge_pct = abs(implied_prob - odds_now) * 100
+
+            direction_str = "bullish" if sentiment_shift > 0 else "bearish"
+
+            explanation_prompt = self._explanation_prompt(
+                question=contract.question,
+                gap_type="info_asymmetry",
+                market_odds=odds_now,
+                implied_odds=implied_prob,
+                sentiment_data={
+                    'weighted_sentiment_shift': round(sentiment_shift, 3),
+                    'recent_avg': round(recent_avg, 3),
+                    'baseline_avg': round(baseline_avg, 3),
+                    'volume_spike_ratio': round(volume_spike_ratio, 2),
+                    'consistency': round(consistency, 2),
+                    'odds_movement_in_window': round(odds_movement, 4),
+                    'has_news_sources': 'news_rss' in sources_breakdown,
+                    'direction': direction_str,
                 }
+            )
+
+            return {
+                'contract_id': contract_id,
+                'gap_type': 'info_asymmetry',
+                'confidence_score': confidence,
+                'explanation': explanation_prompt.fallback,
+                'explanation_prompt': explanation_prompt.prompt,
+                'market_odds': contract.current_yes_odds,
+                'implied_odds': Decimal(implied_prob).quantize(_ODDS_QUANTUM, ROUND_HALF_UP),
+                'edge_percentage': Decimal(edge_pct).quantize(_EDGE_QUANTUM, ROUND_HALF_UP),
+                'evidence': {
+                    'weighted_sentiment_shift': round(sentiment_shift, 3),
+                    'recent_avg_sentiment': round(recent_avg, 3),
+                    'baseline_avg_sentiment': round(baseline_avg, 3),
+                    'recent_posts': recent_count,
+                    'baseline_posts': baseline_count,
+                    'volume_spike_ratio': round(volume_spike_ratio, 2),
+                    'consistency': round(consistency, 2),
+                    'sources_breakdown': sources_breakdown,
+                    'has_news_sources': 'news_rss' in sources_breakdown,
+                    'odds_at_window_start': round(odds_then, 4),
+                    'odds_movement': round(odds_movement, 4),
+                    'market_lag': round(market_lag, 4),
+                    'direction': direction_str,
+                    'counter_move': counter_move,
+                }
+            }
 
         except Exception as e:
+            session.rollback()  # keep a shared session usable for the next detector
             logger.error(f"Error detecting information asymmetry: {e}")
             return None
 
-    def detect_pattern_deviation(self, contract_id: str) -> Optional[Dict]:
+    def _detect_pattern_deviation(
+        self,
+        contract: Contract,
+        statistics: Optional[Tuple]
+    ) -> Optional[Dict]:
         """
         Detect historical pattern deviations.
 
         Args:
-            contract_id: Contract UUID as string
+            contract: Contract to analyze
+            statistics: Row from _odds_statistics for this contract, or None
 
         Returns:
             Gap dictionary if detected, None otherwise
         """
+        contract_id = str(contract.id)
         try:
-            with self.db_manager.get_session() as session:
-                # Get contract
-                contract = session.query(Contract).filter(
-                    Contract.id == UUID(contract_id)
-                ).first()
-
-                if not contract or not self.settings.enable_historical_analysis:
-                    return None
-
-                # Get historical odds
-                historical = session.query(HistoricalOdds).filter(
-                    HistoricalOdds.contract_id == UUID(contract_id)
-                ).order_by(HistoricalOdds.recorded_at.asc()).all()
-
-                if len(historical) < 10:
-                    # Need sufficient history
-                    return None
-
-                # Calculate volatility and trends
-                odds_values = [float(h.yes_odds) for h in historical]
-                current_odds = odds_values[-1]
-
-                # Calculate moving average and standard deviation
-                avg_odds = sum(odds_values) / len(odds_values)
-                variance = sum((x - avg_odds) ** 2 for x in odds_values) / len(odds_values)
-                std_dev = variance ** 0.5
-
-                # Check for unusual deviations
-                z_score = (current_odds - avg_odds) / std_dev if std_dev > 0 else 0
-
-                if abs(z_score) < 1.5:  # Not unusual enough (was 2.0)
-                    return None
-
-                # Calculate confidence based on deviation magnitude
-                confidence = int(min(abs(z_score) / 3.0, 1.0) * 70 + 10)
-
-                # Generate explanation
-                explanation = self._generate_gap_explanation(
-                    contract=contract,
-                    gap_type="pattern_deviation",
-                    market_odds=current_odds,
-                    implied_odds=avg_odds,
-                    sentiment_data={
-                        'z_score': z_score,
-                        'std_dev': std_dev,
-                        'avg_odds': avg_odds
-                    }
-                )
-
-                return {
-                    'contract_id': contract_id,
-                    'gap_type': 'pattern_deviation',
-                    'confidence_score': confidence,
-                    'explanation': explanation,
-                    'market_odds': contract.current_yes_odds,
-                    'implied_odds': Decimal(str(round(avg_odds, 4))),
-                    'edge_percentage': Decimal(str(round(abs(current_odds - avg_odds) * 100, 2))),
-                    'evidence': {
-                        'z_score': round(z_score, 2),
-                        'std_dev': round(std_dev, 4),
-                        'avg_odds': round(avg_odds, 4),
-                        'historical_points': len(historical)
-                    }
+            if not self.settings.enable_historical_analysis:
+                return None
+
+            if statistics is None:
+                return None
+
+            avg_value, std_value, historical_points, latest_odds = statistics
+            if historical_points < 10:
+                # Need sufficient history
+                return None
+
+            current_odds = float(latest_odds)
+            avg_odds = float(avg_value)
+            std_dev = float(std_value or 0)
+
+            # Check for unusual deviations
+            z_score = (current_odds - avg_odds) / std_dev if std_dev > 0 else 0
+
+            if abs(z_score) < 1.5:  # Not unusual enough (was 2.0)
+                return None
+
+            # Calculate confidence based on deviation magnitude
+            confidence = int(min(abs(z_score) / 3.0, 1.0) * 70 + 10)
+
+            # Explanation prompt (sent to the LLM in batch by _fill_explanations)
+            explanation_prompt = self._explanation_prompt(
+                question=contract.question,
+                gap_type="pattern_deviation",
+                market_odds=current_odds,
+                implied_odds=avg_odds,
+                sentiment_data={
+                    'z_score': round(z_score, 2),
+                    'std_dev': round(std_dev, 4),
+                    'avg_odds': round(avg_odds, 4)
+                }
+            )
+
+            return {
+                'contract_id': contract_id,
+                'gap_type': 'pattern_deviation',
+                'confidence_score': confidence,
+                'explanation': explanation_prompt.fallback,
+                'explanation_prompt': explanation_prompt.prompt,
+                'market_odds': contract.current_yes_odds,
+                'implied_odds': Decimal(avg_odds).quantize(_ODDS_QUANTUM, ROUND_HALF_UP),
+                'edge_percentage': Decimal(abs(current_odds - avg_odds) * 100).quantize(_EDGE_QUANTUM, ROUND_HALF_UP),
+                'evidence': {
+                    'z_score': round(z_score, 2),
+                    'std_dev': round(std_dev, 4),
+                    'avg_odds': round(avg_odds, 4),
+                    'historical_points': historical_points
                 }
+            }
 
         except Exception as e:
             logger.error(f"Error detecting pattern deviation: {e}")
             return None
 
-    def _generate_gap_explanation(
+    def _explanation_prompt(
         self,
-        contract: Contract,
+        question: str,
         gap_type: str,
         market_odds: float,
         implied_odds: Optional[float],
         sentiment_data: Dict
-    ) -> str:
+    ) -> ExplanationPrompt:
         """
-        Generate human-readable explanation using LLM.
+        Build the LLM prompt for a gap explanation.
+
+        Detectors attach the prompt to the gap instead of calling the LLM, so
+        all of a cycle's explanations can be generated in one batch by
+        _fill_explanations.
 
         Args:
-            contract: Contract object
+            question: Contract question
             gap_type: Type of gap detected
             market_odds: Current market odds
             implied_odds: Implied odds from analysis
             sentiment_data: Supporting sentiment data
 
         Returns:
-            Explanation string
+            Prompt plus the fallback explanation used if the LLM call fails
         """
-        try:
-            prompt = f"""Generate a clear, concise explanation for a pricing gap in a prediction market.
-
-Market Question: "{contract.question}"
+        # One "key: value" line per field: shorter than indented JSON, so
+        # fewer prompt tokens, and the values are already rounded
+        supporting_data = '\n'.join(f"- {key}: {value}" for key, value in sentiment_data.items())
+        prompt = _EXPLANATION_INSTRUCTIONS + f"""Market Question: "{question}"
 Current Market Odds: {market_odds:.1%} YES
 Gap Type: {gap_type}
 {f"Implied Odds: {implied_odds:.1%}" if implied_odds else ""}
 
-Supporting Data: {json.dumps(sentiment_data, indent=2)}
+Supporting Data:
+{supporting_data}
+"""
+        fallback = f"{gap_type.replace('_', ' ').title()} detected. Market odds at {market_odds:.1%}."
+        return ExplanationPrompt(prompt, fallback)
 
-Provide a 2-3 sentence explanation that:
-1. Describes the gap clearly
-2. Explains why it exists
-3. Notes the direction (bullish/bearish opportunity)
+    def _fill_explanations(self, gaps: List[Dict]) -> List[Dict]:
+        """
+        Generate LLM explanations for gaps in one concurrent batch.
 
-Be specific and actionable. Do not use phrases like "might" or "could be" - be direct.
-"""
+        Each gap's 'explanation_prompt' is removed. Its 'explanation' is
+        replaced by the LLM text, or keeps the fallback if the call failed.
+        Explanations are cached by prompt for gap_explanation_cache_ttl
+        seconds, and identical prompts in a batch are sent only once.
 
-            explanation = self._invoke_llm(prompt)
+        Args:
+            gaps: Gap dicts from the detectors
 
-            return explanation
+        Returns:
+            The same gap dicts, explained
+        """
+        pending = [gap for gap in gaps if gap.get('explanation_prompt')]
+        if not pending:
+            return gaps
+
+        ttl = self.settings.gap_explanation_cache_ttl
+
+        # Group gaps by prompt hash so each distinct prompt is sent at most once
+        by_key: Dict[str, List[Dict]] = {}
+        prompts: Dict[str, str] = {}
+        for gap in pending:
+            prompt = gap.pop('explanation_prompt')
+            key = hashlib.sha1(prompt.encode('utf-8')).hexdigest()
+            by_key.setdefault(key, []).append(gap)
+            prompts[key] = prompt
+
+        texts: Dict[str, Optional[str]] = {}
+        with self._explanation_cache_lock:
+            now = time.monotonic()
+            for key in by_key:
+                cached = self._explanation_cache.get(key)
+                if cached is not None and cached[0] > now:
+                    self._explanation_cache.move_to_end(key)
+                    texts[key] = cached[1]
+
+        misses = [key for key in by_key if key not in texts]
+        if misses:
+            try:
+                generated = self._invoke_llm_batch([prompts[key] for key in misses])
+            except Exception as e:
+                logger.error(f"Error generating explanations: {e}")
+                generated = [None] * len(misses)
+
+            # Expiry counts from when the explanations arrived, not from
+            # before the (slow) LLM batch
+            with self._explanation_cache_lock:
+                expires_at = time.monotonic() + ttl
+                for key, text in zip(misses, generated):
+                    texts[key] = text
+                    if text and ttl > 0:
+                        self._explanation_cache[key] = (expires_at, text)
+                        self._explanation_cache.move_to_end(key)
+                while len(self._explanation_cache) > _EXPLANATION_CACHE_SIZE:
+                    self._explanation_cache.popitem(last=False)
+
+        logger.debug(
+            "Gap explanations: %d cached, %d generated", len(by_key) - len(misses), len(misses)
+        )
 
-        except Exception as e:
-            logger.error(f"Error generating explanation: {e}")
-            # Fallback explanation
-            return f"{gap_type.replace('_', ' ').title()} detected. Market odds at {market_odds:.1%}."
+        for key, key_gaps in by_key.items():
+            text = texts.get(key)
+            if text:
+                for gap in key_gaps:
+                    gap['explanation'] = text
+        return gaps
 
-    def _extract_search_query(self, question: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_search_query(question: str) -> str:
         """
         Extract a concise search query from a Polymarket contract question.
 
         Removes filler words and keeps the core subject for cross-platform search.
+        Pure function of the question, so results are memoized.
         """
-        stop_words = {
-            'will', 'the', 'be', 'in', 'on', 'by', 'a', 'an', 'of', 'to',
-            'for', 'is', 'at', 'or', 'and', 'this', 'that', 'with', 'from',
-            'before', 'after', 'during', 'than', 'more', 'less', 'over',
-            'under', 'between', 'above', 'below', 'how', 'many', 'much',
-            'what', 'which', 'who', 'when', 'where', 'does', 'do', 'did',
-            'has', 'have', 'had', 'been', 'being', 'are', 'was', 'were',
-            'would', 'could', 'should', 'may', 'might', 'can', 'shall',
-        }
-
         # Remove question mark and common punctuation
         cleaned = question.replace('?', '').replace(',', ' ').replace("'s", '')
         words = cleaned.split()
@@ -630,13 +1081,15 @@ Be specific and actionable. Do not use phrases like "might" or "could be" - be d
         significant = []
         for word in words:
             lower = word.lower()
-            if lower not in stop_words and len(word) > 1:
+            if lower not in _STOP_WORDS and len(word) > 1:
                 significant.append(word)
 
         # Return first 4-5 significant words as the search query
         return ' '.join(significant[:5])
 
-    def _match_markets_with_llm(self, polymarket_question: str, candidates: List[Dict]) -> List[Dict]:
+    def _match_markets_with_llm(
+        self, polymarket_question: str, candidates: List[Dict]
+    ) -> Optional[List[Dict]]:
         """
         Use LLM to determine which candidate markets match the Polymarket question.
 
@@ -645,7 +1098,8 @@ Be specific and actionable. Do not use phrases like "might" or "could be" - be d
             candidates: List of candidate markets from other platforms
 
         Returns:
-            List of confirmed matching markets with match_confidence
+            List of confirmed matching markets with match_confidence (empty if
+            the LLM rejected them all), or None if the LLM call or its JSON failed
         """
         if not candidates:
             return []
@@ -653,29 +1107,24 @@ Be specific and actionable. Do not use phrases like "might" or "could be" - be d
         # Limit to top 8 candidates to keep prompt small for local LLMs
         candidates = candidates[:8]
 
+        # Whether two markets describe the same event depends only on their
+        # questions, so reuse an earlier decision for the same question set
+        # with the candidates' current prices
+        cache_key = self._match_cache_key(polymarket_question, candidates)
+        decisions = self._cached_match_decisions(cache_key)
+        if decisions is not None:
+            logger.debug("Cross-market match cache hit for: %s", polymarket_question[:50])
+            return self._apply_match_decisions(candidates, decisions)
+
         numbered = "\n".join(
             f'{i+1}. [{c["platform"]}] "{c["question"]}" (probability: {c["probability"]:.1%})'
             for i, c in enumerate(candidates)
         )
 
-        prompt = f"""Determine which of these prediction markets are about the SAME event as the Polymarket question.
-
-Polymarket question: "{polymarket_question}"
+        prompt = _MATCH_INSTRUCTIONS + f"""Polymarket question: "{polymarket_question}"
 
 Candidate markets from other platforms:
 {numbered}
-
-For each candidate, respond with ONLY a valid JSON array. Each element should have:
-- "index": the candidate number (1-based)
-- "match": true or false — true only if they resolve on the same real-world event
-- "confidence": 0.0 to 1.0 (how confident this is the same event)
-- "inverted": true if the questions are semantically OPPOSITE (e.g. "Will X resign?" vs "Will X remain in office?"), false otherwise
-
-Key rule: markets can cover the same event but be framed in opposite directions.
-For example, "Will Trump resign by 2026?" and "Will Trump be president at end of 2026?" resolve
-on the same underlying fact but YES on one corresponds to NO on the other — mark inverted=true.
-Only mark match=true if the markets genuinely resolve on the same underlying event.
-Respond with ONLY the JSON array, no extra text.
 """
 
         try:
@@ -683,159 +1132,402 @@ Respond with ONLY the JSON array, no extra text.
             result_text = self._clean_json(result_text)
 
             parsed = json.loads(result_text)
-            if not isinstance(parsed, list):
-                parsed = [parsed]
-
-            matches = []
-            for item in parsed:
-                try:
-                    if item.get("match") and item.get("confidence", 0) >= 0.6:
-                        idx = int(item["index"]) - 1
-                        if 0 <= idx < len(candidates):
-                            candidate = candidates[idx].copy()
-                            candidate["match_confidence"] = float(item["confidence"])
-                            candidate["inverted"] = bool(item.get("inverted", False))
-                            matches.append(candidate)
-                except (KeyError, ValueError, TypeError):
-                    continue
-
-            return matches
+            decisions = self._parse_match_decisions(parsed, len(candidates))
+            self._store_match_decisions(cache_key, decisions)
+            return self._apply_match_decisions(candidates, decisions)
 
         except json.JSONDecodeError as e:
             logger.warning(f"Cross-market match JSON parse failed: {e}")
-            return []
+            return None
         except Exception as e:
             logger.error(f"Error in LLM market matching: {e}")
-            return []
+            return None
 
-    def detect_cross_market_arbitrage(self, contract_id: str) -> List[Dict]:
+    def _match_markets_batch(self, items: List[Tuple[str, List[Dict]]]) -> List[Optional[List[Dict]]]:
+        """
+        Match candidate markets for many contracts with as few LLM calls as possible.
+
+        Cached decisions are reused. The remaining contracts are grouped
+        market_match_batch_size per prompt, and all prompts go out in one
+        concurrent batch. A contract missing from an unparseable or
+        incomplete response falls back to _match_markets_with_llm.
+
+        Args:
+            items: (Polymarket question, candidate markets) per contract
+
+        Returns:
+            Confirmed matching markets per item, in input order; None for an
+            item whose matching failed (LLM error or unparseable response)
+        """
+        results: List[Optional[List[Dict]]] = [[] for _ in items]
+        pending = []  # (item index, question, candidates, cache key)
+        for i, (question, candidates) in enumerate(items):
+            candidates = candidates[:8]
+            if not candidates:
+                continue
+            cache_key = self._match_cache_key(question, candidates)
+            decisions = self._cached_match_decisions(cache_key)
+            if decisions is not None:
+                results[i] = self._apply_match_decisions(candidates, decisions)
+            else:
+                pending.append((i, question, candidates, cache_key))
+
+        if not pending:
+            return results
+
+        size = self.settings.market_match_batch_size
+        groups = [pending[start:start + size] for start in range(0, len(pending), size)]
+        try:
+            texts = self._invoke_llm_batch([self._batch_match_prompt(group) for group in groups])
+        except Exception as e:
+            logger.error(f"Error in batched LLM market matching: {e}")
+            texts = [None] * len(groups)
+
+        for group, text in zip(groups, texts):
+            parsed = {}
+            if text:
+                try:
+                    parsed = json.loads(self._clean_json(text))
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Batched cross-market match JSON parse failed: {e}")
+            if not isinstance(parsed, dict):
+                parsed = {}
+
+            for number, (i, question, candidates, cache_key) in enumerate(group, start=1):
+                if str(number) not in parsed:
+                    results[i] = self._match_markets_with_llm(question, candidates)
+                    continue
+                decisions = self._parse_match_decisions(parsed[str(number)], len(candidates))
+                self._store_match_decisions(cache_key, decisions)
+                results[i] = self._apply_match_decisions(candidates, decisions)
+
+        logger.debug(
+            "Cross-market matching: %d contracts, %d cached, %d prompts",
+            len(items), len(items) - len(pending), len(groups)
+        )
+        return results
+
+    @staticmethod
+    def _batch_match_prompt(group: List[Tuple]) -> str:
+        """Build one market-match prompt covering several contracts."""
+        blocks = []
+        for number, (_, question, candidates, _) in enumerate(group, start=1):
+            numbered = "\n".join(
+                f'  {j+1}. [{c["platform"]}] "{c["question"]}" (probability: {c["probability"]:.1%})'
+                for j, c in enumerate(candidates)
+            )
+            blocks.append(f'CONTRACT {number}: "{question}"\n{numbered}')
+        return _BATCH_MATCH_INSTRUCTIONS + "\n\n".join(blocks) + "\n"
+
+    @staticmethod
+    def _match_cache_key(question: str, candidates: List[Dict]) -> str:
+        """Key match decisions by the normalized Polymarket and candidate questions."""
+        return hashlib.sha1('\n'.join(
+            [_normalize_question(question)]
+            + [f'{c["platform"]}|{_normalize_question(c["question"])}' for c in candidates]
+        ).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _parse_match_decisions(parsed, candidate_count: int) -> List[Tuple[int, float, bool]]:
+        """
+        Extract accepted matches from a parsed LLM match response.
+
+        Args:
+            parsed: JSON array (or single object) of per-candidate verdicts
+            candidate_count: Number of candidates the indexes refer to
+
+        Returns:
+            (0-based index, confidence, inverted) for matches with confidence >= 0.6
+        """
+        if not isinstance(parsed, list):
+            parsed = [parsed]
+
+        decisions = []
+        for item in parsed:
+            try:
+                if item.get("match") and item.get("confidence", 0) >= 0.6:
+                    idx = int(item["index"]) - 1
+                    if 0 <= idx < candidate_count:
+                        decisions.append((idx, float(item["confidence"]), bool(item.get("inverted", False))))
+            except (AttributeError, KeyError, ValueError, TypeError):
+                continue
+        return decisions
+
+    def _cached_match_decisions(self, cache_key: str) -> Optional[List[Tuple[int, float, bool]]]:
+        """Return unexpired match decisions for a question set, or None."""
+        with self._match_cache_lock:
+            cached = self._match_cache.get(cache_key)
+            if cached is None or cached[0] <= time.monotonic():
+                return None
+            self._match_cache.move_to_end(cache_key)
+            return cached[1]
+
+    def _store_match_decisions(self, cache_key: str, decisions: List[Tuple[int, float, bool]]) -> None:
+        """Cache match decisions for market_match_cache_ttl seconds (0 disables)."""
+        ttl = self.settings.market_match_cache_ttl
+        if ttl <= 0:
+            return
+        with self._match_cache_lock:
+            self._match_cache[cache_key] = (time.monotonic() + ttl, decisions)
+            self._match_cache.move_to_end(cache_key)
+            while len(self._match_cache) > _MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+
+    @staticmethod
+    def _apply_match_decisions(
+        candidates: List[Dict],
+        decisions: List[Tuple[int, float, bool]]
+    ) -> List[Dict]:
+        """
+        Build the matched-market list from (index, confidence, inverted) decisions.
+
+        Args:
+            candidates: Candidate markets the decisions index into
+            decisions: Accepted matches from the LLM (or the cache)
+
+        Returns:
+            Copies of the matching candidates with match_confidence and inverted set
+        """
+        matches = []
+        for idx, confidence, inverted in decisions:
+            candidate = candidates[idx].copy()
+            candidate["match_confidence"] = confidence
+            candidate["inverted"] = inverted
+            matches.append(candidate)
+        return matches
+
+    def _detect_cross_market_arbitrage(self, contract: Contract) -> List[Dict]:
         """
         Detect cross-market arbitrage by comparing Polymarket odds against
         Kalshi and Manifold Markets.
 
         Args:
-            contract_id: Contract UUID as string
+            contract: Contract to analyze
 
         Returns:
             List of arbitrage gap dicts (one per platform with price discrepancy)
         """
-        if not self.settings.enable_arbitrage_detection:
+        check = self._arbitrage_check(contract)
+        if check is None:
             return []
+        matches = self._match_markets_with_llm(check.question, check.candidates)
+        if matches is None:
+            return []
+        if not matches:
+            self._skip_arbitrage(check.contract_id)
+        return self._arbitrage_gaps(check, matches)
+
+    def _skip_arbitrage(self, contract_id: str) -> None:
+        """
+        Skip arbitrage checks for a contract for arbitrage_negative_ttl seconds.
+
+        Only called after a definite negative: searches that succeeded but
+        found no candidates, or an LLM response that parsed and matched
+        none. API and LLM failures must not land here.
+        """
+        ttl = self.settings.arbitrage_negative_ttl
+        if ttl <= 0:
+            return
+        with self._no_arbitrage_lock:
+            now = time.monotonic()
+            self._no_arbitrage_until[contract_id] = now + ttl
+            self._no_arbitrage_until.move_to_end(contract_id)
+            # Every entry gets the same TTL, so the oldest expire first
+            while next(iter(self._no_arbitrage_until.values())) <= now:
+                self._no_arbitrage_until.popitem(last=False)
+            while len(self._no_arbitrage_until) > _NO_ARBITRAGE_CACHE_SIZE:
+                self._no_arbitrage_until.popitem(last=False)
+
+    def _arbitrage_check(self, contract: Contract) -> Optional[ArbitrageCheck]:
+        """
+        Search competitor platforms for markets that may match a contract.
+
+        Args:
+            contract: Contract to analyze
+
+        Returns:
+            The contract's candidates awaiting LLM matching, or None if there are none
+        """
+        if not self.settings.enable_arbitrage_detection:
+            return None
+
+        # Recently found nothing for this contract: skip the searches and LLM
+        contract_id = str(contract.id)
+        with self._no_arbitrage_lock:
+            skip_until = self._no_arbitrage_until.get(contract_id, 0)
+        if skip_until > time.monotonic():
+            return None
 
         try:
-            with self.db_manager.get_session() as session:
-                contract = session.query(Contract).filter(
-                    Contract.id == UUID(contract_id)
-                ).first()
+            if not contract.current_yes_odds:
+                return None
 
-                if not contract or not contract.current_yes_odds:
-                    return []
+            question = contract.question
+            search_query = self._extract_search_query(question)
 
-                polymarket_prob = float(contract.current_yes_odds)
-                question = contract.question
-                search_query = self._extract_search_query(question)
+            if not search_query or len(search_query) < 3:
+                return None
 
-                if not search_query or len(search_query) < 3:
-                    return []
+            logger.debug(f"Arbitrage search for: '{search_query}' (from: {question[:60]}...)")
 
-                logger.debug(f"Arbitrage search for: '{search_query}' (from: {question[:60]}...)")
+            all_candidates = self._search_competitor_markets(search_query)
+            if all_candidates is None:
+                # A search failed; try again next cycle rather than skipping
+                return None
+            if not all_candidates:
+                self._skip_arbitrage(contract_id)
+                return None
 
-                # Search competitor platforms
-                all_candidates = []
+            return ArbitrageCheck(contract_id, question, contract.current_yes_odds, all_candidates)
 
-                kalshi_markets = self.kalshi_api.search_markets(search_query, limit=10)
-                all_candidates.extend(kalshi_markets)
+        except Exception as e:
+            logger.error(f"Error searching cross-market candidates: {e}")
+            return None
 
-                manifold_markets = self.manifold_api.search_markets(search_query, limit=10)
-                all_candidates.extend(manifold_markets)
+    def _search_competitor_markets(self, search_query: str) -> Optional[List[Dict]]:
+        """
+        Search Kalshi and Manifold concurrently, caching results by query.
 
-                if not all_candidates:
-                    return []
+        Args:
+            search_query: Query from _extract_search_query
 
-                # Use LLM to confirm matches
-                confirmed_matches = self._match_markets_with_llm(question, all_candidates)
+        Returns:
+            Kalshi candidates followed by Manifold candidates, or None if a
+            search failed and the other found nothing
+        """
+        key = search_query.lower()
+        with self._search_cache_lock:
+            cached = self._search_cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._search_cache.move_to_end(key)
+                logger.debug(f"Cross-market search cache hit for: '{search_query}'")
+                return list(cached[1])
+
+        # Manifold on the shared search pool while Kalshi runs on this thread
+        manifold_future = self._search_executor.submit(
+            self.manifold_api.search_markets, search_query, 10
+        )
+        kalshi_results = self.kalshi_api.search_markets(search_query, limit=10)
+        manifold_results = manifold_future.result()
+        candidates = list(kalshi_results or []) + list(manifold_results or [])
+        search_failed = kalshi_results is None or manifold_results is None
+        if not candidates and search_failed:
+            return None
 
-                if not confirmed_matches:
-                    return []
+        # Cache only complete, non-empty results: an empty or partial list
+        # may come from a failed (e.g. rate-limited) search, and caching it
+        # would blank the query for every contract sharing it
+        ttl = self.settings.cross_market_search_cache_ttl
+        if ttl > 0 and candidates and not search_failed:
+            with self._search_cache_lock:
+                self._search_cache[key] = (time.monotonic() + ttl, candidates)
+                self._search_cache.move_to_end(key)
+                while len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+        return list(candidates)
+
+    def _arbitrage_gaps(self, check: ArbitrageCheck, matches: List[Dict]) -> List[Dict]:
+        """
+        Build arbitrage gaps from a contract's LLM-confirmed matching markets.
 
-                # Check for arbitrage on each confirmed match
-                gaps = []
-                for match in confirmed_matches:
-                    raw_prob = match["probability"]
-                    # If the questions are semantically inverted (e.g. "Will X resign?" vs
-                    # "Will X remain in office?"), the YES probabilities are complements.
-                    # Flip so we're comparing apples to apples before computing the edge.
-                    inverted = match.get("inverted", False)
-                    competitor_prob = (1.0 - raw_prob) if inverted else raw_prob
-                    edge = abs(polymarket_prob - competitor_prob)
+        Args:
+            check: Contract snapshot from _arbitrage_check
+            matches: Confirmed matches from the LLM (or the match cache)
 
-                    if edge < self.settings.arbitrage_min_edge:
-                        continue
+        Returns:
+            List of arbitrage gap dicts (one per platform with price discrepancy)
+        """
+        if not matches:
+            return []
 
-                    # Determine direction
-                    if polymarket_prob < competitor_prob:
-                        direction = "bullish"
-                        explanation_hint = f"Polymarket prices YES at {polymarket_prob:.1%} while {match['platform'].title()} prices it at {competitor_prob:.1%}"
-                    else:
-                        direction = "bearish"
-                        explanation_hint = f"Polymarket prices YES at {polymarket_prob:.1%} while {match['platform'].title()} prices it at {competitor_prob:.1%}"
-
-                    # Confidence based on edge size and match confidence
-                    edge_factor = min(edge / 0.3, 1.0) * 50
-                    match_factor = match.get("match_confidence", 0.7) * 30
-                    base_confidence = 20
-                    confidence = int(edge_factor + match_factor + base_confidence)
-
-                    # Generate explanation
-                    explanation = self._generate_gap_explanation(
-                        contract=contract,
-                        gap_type="arbitrage",
-                        market_odds=polymarket_prob,
-                        implied_odds=competitor_prob,
-                        sentiment_data={
-                            "competitor_platform": match["platform"],
-                            "competitor_question": match["question"],
-                            "competitor_probability": competitor_prob,
-                            "direction": direction,
-                            "edge": round(edge, 3),
-                        }
-                    )
+        try:
+            polymarket_prob = float(check.yes_odds)
+            question = check.question
+
+            # Check for arbitrage on each confirmed match
+            gaps = []
+            for match in matches:
+                raw_prob = match["probability"]
+                # If the questions are semantically inverted (e.g. "Will X resign?" vs
+                # "Will X remain in office?"), the YES probabilities are complements.
+                # Flip so we're comparing apples to apples before computing the edge.
+                inverted = match.get("inverted", False)
+                competitor_prob = (1.0 - raw_prob) if inverted else raw_prob
+                edge = abs(polymarket_prob - competitor_prob)
+
+                if edge < self.settings.arbitrage_min_edge:
+                    continue
 
-                    gaps.append({
-                        "contract_id": contract_id,
-                        "gap_type": "arbitrage",
-                        "confidence_score": confidence,
-                        "explanation": explanation,
-                        "market_odds": contract.current_yes_odds,
-                        "implied_odds": Decimal(str(round(competitor_prob, 4))),
-                        "edge_percentage": Decimal(str(round(edge * 100, 2))),
-                        "evidence": {
-                            "competitor_platform": match["platform"],
-                            "competitor_market_id": match["market_id"],
-                            "competitor_question": match["question"],
-                            "competitor_probability_raw": round(raw_prob, 4),
-                            "competitor_probability_adjusted": round(competitor_prob, 4),
-                            "competitor_url": match.get("url", ""),
-                            "match_confidence": match.get("match_confidence", 0),
-                            "inverted": inverted,
-                            "direction": direction,
-                            "polymarket_probability": round(polymarket_prob, 4),
-                        }
-                    })
-
-                    logger.info(
-                        f"Arbitrage found: {question[:50]}... | "
-                        f"Polymarket={polymarket_prob:.1%} vs {match['platform']}={competitor_prob:.1%} "
-                        f"(edge={edge:.1%})"
-                    )
+                # Determine direction
+                if polymarket_prob < competitor_prob:
+                    direction = "bullish"
+                    explanation_hint = f"Polymarket prices YES at {polymarket_prob:.1%} while {match['platform'].title()} prices it at {competitor_prob:.1%}"
+                else:
+                    direction = "bearish"
+                    explanation_hint = f"Polymarket prices YES at {polymarket_prob:.1%} while {match['platform'].title()} prices it at {competitor_prob:.1%}"
+
+                # Confidence based on edge size and match confidence
+                edge_factor = min(edge / 0.3, 1.0) * 50
+                match_factor = match.get("match_confidence", 0.7) * 30
+                base_confidence = 20
+                confidence = int(edge_factor + match_factor + base_confidence)
+
+                # Explanation prompt (sent to the LLM in batch by _fill_explanations)
+                explanation_prompt = self._explanation_prompt(
+                    question=check.question,
+                    gap_type="arbitrage",
+                    market_odds=polymarket_prob,
+                    implied_odds=competitor_prob,
+                    sentiment_data={
+                        "competitor_platform": match["platform"],
+                        "competitor_question": match["question"],
+                        "competitor_probability": competitor_prob,
+                        "direction": direction,
+                        "edge": round(edge, 3),
+                    }
+                )
+
+                gaps.append({
+                    "contract_id": check.contract_id,
+                    "gap_type": "arbitrage",
+                    "confidence_score": confidence,
+                    "explanation": explanation_prompt.fallback,
+                    "explanation_prompt": explanation_prompt.prompt,
+                    "market_odds": check.yes_odds,
+                    "implied_odds": Decimal(competitor_prob).quantize(_ODDS_QUANTUM, ROUND_HALF_UP),
+                    "edge_percentage": Decimal(edge * 100).quantize(_EDGE_QUANTUM, ROUND_HALF_UP),
+                    "evidence": {
+                        "competitor_platform": match["platform"],
+                        "competitor_market_id": match["market_id"],
+                        "competitor_question": match["question"],
+                        "competitor_probability_raw": round(raw_prob, 4),
+                        "competitor_probability_adjusted": round(competitor_prob, 4),
+                        "competitor_url": match.get("url", ""),
+                        "match_confidence": match.get("match_confidence", 0),
+                        "inverted": inverted,
+                        "direction": direction,
+                        "polymarket_probability": round(polymarket_prob, 4),
+                    }
+                })
 
-                return gaps
+                logger.info(
+                    f"Arbitrage found: {question[:50]}... | "
+                    f"Polymarket={polymarket_prob:.1%} vs {match['platform']}={competitor_prob:.1%} "
+                    f"(edge={edge:.1%})"
+                )
+
+            return gaps
 
         except Exception as e:
             logger.error(f"Error detecting cross-market arbitrage: {e}")
             return []
 
-    def detect_volume_spike(self, contract_id: str) -> Optional[Dict]:
+    def _detect_volume_spike(
+        self,
+        session,
+        contract: Contract,
+        now: Optional[datetime] = None
+    ) -> Optional[Dict]:
         """
         Detect volume spike gaps — sudden surges in trading volume that haven't
         yet been reflected in the contract price.
@@ -847,7 +1539,13 @@ Respond with ONLY the JSON array, no extra text.
         - Split HistoricalOdds records into a recent window and a baseline window
         - Compare volume rates (per hour) between windows
         - If recent_rate / baseline_rate >= threshold AND price lag exists, flag it
+
+        Args:
+            session: Open database session
+            contract: Contract to analyze
+            now: Window end time (defaults to the current time)
         """
+        contract_id = str(contract.id)
         if not getattr(self.settings, 'enable_volume_spike_detection', True):
             return None
 
@@ -856,139 +1554,144 @@ Respond with ONLY the JSON array, no extra text.
         MIN_SPIKE_RATIO = getattr(self.settings, 'volume_spike_min_ratio', 3.0)
 
         try:
-            with self.db_manager.get_session() as session:
-                contract = session.query(Contract).filter(
-                    Contract.id == UUID(contract_id)
-                ).first()
-
-                if not contract or not contract.current_yes_odds:
-                    return None
-
-                now = datetime.now(timezone.utc)
-                recent_cutoff = now - timedelta(hours=RECENT_HOURS)
-                baseline_cutoff = now - timedelta(hours=BASELINE_HOURS)
-
-                # Fetch recent and baseline HistoricalOdds records (volume stored per snapshot)
-                recent_records = session.query(HistoricalOdds).filter(
-                    HistoricalOdds.contract_id == UUID(contract_id),
-                    HistoricalOdds.recorded_at >= recent_cutoff,
-                    HistoricalOdds.volume.isnot(None),
-                ).order_by(HistoricalOdds.recorded_at.asc()).all()
-
-                baseline_records = session.query(HistoricalOdds).filter(
-                    HistoricalOdds.contract_id == UUID(contract_id),
-                    HistoricalOdds.recorded_at >= baseline_cutoff,
-                    HistoricalOdds.recorded_at < recent_cutoff,
-                    HistoricalOdds.volume.isnot(None),
-                ).order_by(HistoricalOdds.recorded_at.asc()).all()
-
-                # Need enough data points in both windows
-                if len(recent_records) < 2 or len(baseline_records) < 3:
-                    return None
-
-                # Volume stored is volume_24h (a snapshot level). To get traded volume
-                # *within* a window, sum the incremental increases between consecutive snapshots.
-                # Increases represent new volume; decreases (counter-intuitive) are ignored.
-                def incremental_volume(records: list) -> float:
-                    total = 0.0
-                    for i in range(1, len(records)):
-                        delta = float(records[i].volume) - float(records[i - 1].volume)
-                        if delta > 0:
-                            total += delta
-                    return total
-
-                recent_vol = incremental_volume(recent_records)
-                baseline_vol = incremental_volume(baseline_records)
-
-                # Normalize to per-hour rates
-                baseline_window_hours = BASELINE_HOURS - RECENT_HOURS
-                recent_rate = recent_vol / RECENT_HOURS
-                baseline_rate = baseline_vol / baseline_window_hours if baseline_window_hours > 0 else 0.0
-
-                if baseline_rate <= 0:
-                    return None
-
-                spike_ratio = recent_rate / baseline_rate
-
-                if spike_ratio < MIN_SPIKE_RATIO:
-                    return None
-
-                # --- Price lag check ---
-                # Compare price at the start of the recent window vs now.
-                # A large spike with minimal price movement is the core gap signal.
-                odds_at_spike_start = float(recent_records[0].yes_odds)
-                odds_now = float(contract.current_yes_odds)
-                price_move = abs(odds_now - odds_at_spike_start)
-
-                # --- Confidence scoring (max 100) ---
-                # Spike magnitude: 3x→10x+ mapped to 0–40 pts
-                spike_factor = min((spike_ratio - MIN_SPIKE_RATIO) / (10.0 - MIN_SPIKE_RATIO), 1.0) * 40
-
-                # Price lag: 0–30 pts. Full score if price moved < 1% despite spike.
-                # Score decays as the market starts to catch up (up to 10% move).
-                price_lag_factor = max(0.0, 1.0 - (price_move / 0.10)) * 30
-
-                # Absolute volume size: bigger markets get higher weight — 0–15 pts
-                abs_vol_factor = min(recent_vol / 50_000, 1.0) * 15
-
-                # Recency: how close to "now" the spike peak is — 0–15 pts
-                # Use the most recent record timestamp
-                most_recent_ts = recent_records[-1].recorded_at
-                if most_recent_ts.tzinfo is None:
-                    most_recent_ts = most_recent_ts.replace(tzinfo=timezone.utc)
-                minutes_since_last_record = (now - most_recent_ts).total_seconds() / 60
-                recency_factor = max(0.0, 1.0 - (minutes_since_last_record / (RECENT_HOURS * 60))) * 15
-
-                confidence = int(spike_factor + price_lag_factor + abs_vol_factor + recency_factor)
-                confidence = max(0, min(confidence, 100))
-
-                # Direction: if price hasn't moved, direction is ambiguous — flag as "unknown"
-                # until cross-referenced with sentiment. If price started moving, use that direction.
-                if price_move < 0.02:
-                    direction = "unknown"
-                elif odds_now > odds_at_spike_start:
-                    direction = "bullish"
+            if not contract.current_yes_odds:
+                return None
+
+            now = now or datetime.now(timezone.utc)
+            recent_cutoff = now - timedelta(hours=RECENT_HOURS)
+            baseline_cutoff = now - timedelta(hours=BASELINE_HOURS)
+
+            # Fetch baseline + recent HistoricalOdds snapshots (volume stored per
+            # snapshot) in one streamed query of the three columns used, then
+            # split at recent_cutoff
+            records = session.query(
+                HistoricalOdds.yes_odds, HistoricalOdds.volume, HistoricalOdds.recorded_at
+            ).filter(
+                HistoricalOdds.contract_id == contract.id,
+                HistoricalOdds.recorded_at >= baseline_cutoff,
+                HistoricalOdds.volume.isnot(None),
+            ).order_by(HistoricalOdds.recorded_at.asc()).yield_per(2000)
+
+            baseline_records = []
+            recent_records = []
+            for record in records:
+                recorded_at = record.recorded_at
+                if recorded_at.tzinfo is None:
+                    recorded_at = recorded_at.replace(tzinfo=timezone.utc)
+                if recorded_at >= recent_cutoff:
+                    recent_records.append(record)
                 else:
-                    direction = "bearish"
-
-                explanation = self._generate_gap_explanation(
-                    contract=contract,
-                    gap_type="volume_spike",
-                    market_odds=odds_now,
-                    implied_odds=None,
-                    sentiment_data={
-                        'spike_ratio': round(spike_ratio, 2),
-                        'recent_volume': round(recent_vol, 2),
-                        'baseline_volume_rate_per_hour': round(baseline_rate, 2),
-                        'recent_volume_rate_per_hour': round(recent_rate, 2),
-                        'price_move': round(price_move, 4),
-                        'direction': direction,
-                    }
-                )
-
-                return {
-                    'contract_id': contract_id,
-                    'gap_type': 'volume_spike',
-                    'confidence_score': confidence,
-                    'explanation': explanation,
-                    'market_odds': contract.current_yes_odds,
-                    'implied_odds': None,
-                    'edge_percentage': Decimal('0'),
-                    'evidence': {
-                        'spike_ratio': round(spike_ratio, 2),
-                        'recent_volume': round(recent_vol, 2),
-                        'baseline_volume_rate_per_hour': round(baseline_rate, 2),
-                        'recent_volume_rate_per_hour': round(recent_rate, 2),
-                        'recent_snapshots': len(recent_records),
-                        'baseline_snapshots': len(baseline_records),
-                        'price_at_spike_start': round(odds_at_spike_start, 4),
-                        'price_now': round(odds_now, 4),
-                        'price_move': round(price_move, 4),
-                        'direction': direction,
-                    }
+                    baseline_records.append(record)
+
+            # Need enough data points in both windows
+            if len(recent_records) < _SPIKE_MIN_RECENT or len(baseline_records) < _SPIKE_MIN_BASELINE:
+                return None
+
+            # Volume stored is volume_24h (a snapshot level). To get traded volume
+            # *within* a window, sum the incremental increases between consecutive snapshots.
+            # Increases represent new volume; decreases (counter-intuitive) are ignored.
+            def incremental_volume(records: list) -> float:
+                total = 0.0
+                for i in range(1, len(records)):
+                    delta = float(records[i].volume) - float(records[i - 1].volume)
+                    if delta > 0:
+                        total += delta
+                return total
+
+            recent_vol = incremental_volume(recent_records)
+            baseline_vol = incremental_volume(baseline_records)
+
+            # Normalize to per-hour rates
+            baseline_window_hours = BASELINE_HOURS - RECENT_HOURS
+            recent_rate = recent_vol / RECENT_HOURS
+            baseline_rate = baseline_vol / baseline_window_hours if baseline_window_hours > 0 else 0.0
+
+            if baseline_rate <= 0:
+                return None
+
+            spike_ratio = recent_rate / baseline_rate
+
+            if spike_ratio < MIN_SPIKE_RATIO:
+                return None
+
+            # --- Price lag check ---
+            # Compare price at the start of the recent window vs now.
+            # A large spike with minimal price movement is the core gap signal.
+            odds_at_spike_start = float(recent_records[0].yes_odds)
+            odds_now = float(contract.current_yes_odds)
+            price_move = abs(odds_now - odds_at_spike_start)
+
+            # --- Confidence scoring (max 100) ---
+            # Spike magnitude: 3x→10x+ mapped to 0–40 pts
+            spike_factor = min((spike_ratio - MIN_SPIKE_RATIO) / (10.0 - MIN_SPIKE_RATIO), 1.0) * 40
+
+            # Price lag: 0–30 pts. Full score if price moved < 1% despite spike.
+            # Score decays as the market starts to catch up (up to 10% move).
+            price_lag_factor = max(0.0, 1.0 - (price_move / 0.10)) * 30
+
+            # Absolute volume size: bigger markets get higher weight — 0–15 pts
+            abs_vol_factor = min(recent_vol / 50_000, 1.0) * 15
+
+            # Recency: how close to "now" the spike peak is — 0–15 pts
+            # Use the most recent record timestamp
+            most_recent_ts = recent_records[-1].recorded_at
+            if most_recent_ts.tzinfo is None:
+                most_recent_ts = most_recent_ts.replace(tzinfo=timezone.utc)
+            minutes_since_last_record = (now - most_recent_ts).total_seconds() / 60
+            recency_factor = max(0.0, 1.0 - (minutes_since_last_record / (RECENT_HOURS * 60))) * 15
+
+            confidence = int(spike_factor + price_lag_factor + abs_vol_factor + recency_factor)
+            confidence = max(0, min(confidence, 100))
+
+            # Direction: if price hasn't moved, direction is ambiguous — flag as "unknown"
+            # until cross-referenced with sentiment. If price started moving, use that direction.
+            if price_move < 0.02:
+                direction = "unknown"
+            elif odds_now > odds_at_spike_start:
+                direction = "bullish"
+            else:
+                direction = "bearish"
+
+            explanation_prompt = self._explanation_prompt(
+                question=contract.question,
+                gap_type="volume_spike",
+                market_odds=odds_now,
+                implied_odds=None,
+                sentiment_data={
+                    'spike_ratio': round(spike_ratio, 2),
+                    'recent_volume': round(recent_vol, 2),
+                    'baseline_volume_rate_per_hour': round(baseline_rate, 2),
+                    'recent_volume_rate_per_hour': round(recent_rate, 2),
+                    'price_move': round(price_move, 4),
+                    'direction': direction,
+                }
+            )
+
+            return {
+                'contract_id': contract_id,
+                'gap_type': 'volume_spike',
+                'confidence_score': confidence,
+                'explanation': explanation_prompt.fallback,
+                'explanation_prompt': explanation_prompt.prompt,
+                'market_odds': contract.current_yes_odds,
+                'implied_odds': None,
+                'edge_percentage': Decimal('0'),
+                'evidence': {
+                    'spike_ratio': round(spike_ratio, 2),
+                    'recent_volume': round(recent_vol, 2),
+                    'baseline_volume_rate_per_hour': round(baseline_rate, 2),
+                    'recent_volume_rate_per_hour': round(recent_rate, 2),
+                    'recent_snapshots': len(recent_records),
+                    'baseline_snapshots': len(baseline_records),
+                    'price_at_spike_start': round(odds_at_spike_start, 4),
+                    'price_now': round(odds_now, 4),
+                    'price_move': round(price_move, 4),
+                    'direction': direction,
                 }
+            }
 
         except Exception as e:
+            session.rollback()  # keep a shared session usable for the next detector
             logger.error(f"Error detecting volume spike: {e}")
             return None
 
@@ -999,37 +1702,119 @@ Respond with ONLY the JSON array, no extra text.
         Args:
             contract_id: Contract UUID as string
 
+        Returns:
+            List of detected gaps
+        """
+        def detect(session, contract):
+            return self._detect_all_gaps(
+                session,
+                contract,
+                self._sentiment_aggregates(session, [contract.id]),
+                self._odds_statistics(session, [contract.id]),
+            )
+
+        return self._run_for_contract(contract_id, detect, default=[])
+
+    def _detect_all_gaps(
+        self,
+        session,
+        contract: Contract,
+        sentiment_aggregates: Dict[UUID, Tuple],
+        odds_statistics: Dict[UUID, Tuple],
+        window_activity: Optional[Tuple[int, int]] = None,
+        now: Optional[datetime] = None,
+        arbitrage_checks: Optional[List[ArbitrageCheck]] = None
+    ) -> List[Dict]:
+        """
+        Run all gap detection methods for an already-loaded contract.
+
+        Args:
+            session: Open database session the contract belongs to
+            contract: Contract to analyze
+            sentiment_aggregates: Prefetched _sentiment_aggregates results
+            odds_statistics: Prefetched _odds_statistics results
+            window_activity: This contract's _window_activity counts; if given,
+                detectors whose window cannot have enough data are skipped
+            now: Shared window end time for time-windowed detectors
+            arbitrage_checks: If given, cross-market candidates are appended
+                here for batched matching instead of being matched now
+
         Returns:
             List of detected gaps
         """
         gaps = []
+        sentiment_rows, volume_snapshots = window_activity or (None, None)
 
         # Sentiment mismatch
-        gap = self.detect_sentiment_mismatch(contract_id)
+        gap = self._detect_sentiment_mismatch(session, contract, sentiment_aggregates.get(contract.id))
         if gap:
             gaps.append(gap)
 
         # Information asymmetry
-        gap = self.detect_information_asymmetry(contract_id)
-        if gap:
-            gaps.append(gap)
+        if sentiment_rows is None or sentiment_rows >= _ASYMMETRY_MIN_RECENT + _ASYMMETRY_MIN_BASELINE:
+            gap = self._detect_information_asymmetry(session, contract, now)
+            if gap:
+                gaps.append(gap)
 
         # Pattern deviation
-        gap = self.detect_pattern_deviation(contract_id)
+        gap = self._detect_pattern_deviation(contract, odds_statistics.get(contract.id))
         if gap:
             gaps.append(gap)
 
         # Cross-market arbitrage
-        arbitrage_gaps = self.detect_cross_market_arbitrage(contract_id)
-        gaps.extend(arbitrage_gaps)
+        if arbitrage_checks is None:
+            gaps.extend(self._detect_cross_market_arbitrage(contract))
+        else:
+            check = self._arbitrage_check(contract)
+            if check:
+                arbitrage_checks.append(check)
 
         # Volume spike
-        gap = self.detect_volume_spike(contract_id)
-        if gap:
-            gaps.append(gap)
+        if volume_snapshots is None or volume_snapshots >= _SPIKE_MIN_RECENT + _SPIKE_MIN_BASELINE:
+            gap = self._detect_volume_spike(session, contract, now)
+            if gap:
+                gaps.append(gap)
 
         return gaps
 
+    def _detect_gaps_for_id(
+        self,
+        contract_id: UUID,
+        sentiment_aggregates: Dict[UUID, Tuple],
+        odds_statistics: Dict[UUID, Tuple],
+        window_activity: Dict[UUID, Tuple[int, int]],
+        now: datetime
+    ) -> Tuple[List[Dict], List[ArbitrageCheck]]:
+        """
+        Run all detectors for one contract in its own session (thread-pool worker).
+
+        Args:
+            contract_id: Contract primary key
+            sentiment_aggregates: Prefetched _sentiment_aggregates results
+            odds_statistics: Prefetched _odds_statistics results
+            window_activity: Prefetched _window_activity results
+            now: Detection start time shared by every contract's windows
+
+        Returns:
+            Detected gaps (explanations not yet generated), and the contract's
+            cross-market candidates still to be matched
+        """
+        arbitrage_checks: List[ArbitrageCheck] = []
+        try:
+            with self.db_manager.get_session() as session:
+                contract = session.get(Contract, contract_id, options=[_DETECTOR_COLUMNS])
+                if contract is None:
+                    return [], []
+                logger.info(f"Analyzing gaps for: {contract.question[:50]}...")
+                gaps = self._detect_all_gaps(
+                    session, contract, sentiment_aggregates, odds_statistics,
+                    window_activity.get(contract_id, (0, 0)), now, arbitrage_checks
+                )
+                return gaps, arbitrage_checks
+        except Exception as e:
+            logger.error(f"Error detecting gaps for contract {contract_id}: {e}")
+            return [], []
+
     def analyze_all_contracts(self) -> List[Dict]:
         """
         Analyze all active contracts for gaps.
@@ -1054,52 +1839,108 @@ Respond with ONLY the JSON array, no extra text.
                     HistoricalOdds.contract_id == Contract.id,
                     HistoricalOdds.volume.isnot(None),
                 )
-                contracts = session.query(Contract).filter(
+                # Only ids here: each worker loads its contract (detector
+                # columns only) in its own session
+                contract_ids = [row.id for row in session.query(Contract.id).filter(
                     Contract.active == True,
                     (Contract.end_date > now) | (Contract.end_date == None),
                     or_(has_sentiment, has_volume_history)
-                ).all()
+                )]
 
                 dedupe_hours = getattr(self.settings, 'gap_dedupe_hours', 24)
                 dedupe_since = now - timedelta(hours=dedupe_hours)
 
-                for contract in contracts:
-                    logger.info(f"Analyzing gaps for: {contract.question[:50]}...")
-
-                    gaps = self.detect_all_gaps(str(contract.id))
+                # Per-contract aggregates for every contract in GROUP BY
+                # queries, instead of re-querying (and re-loading the contract)
+                # inside each detector
+                sentiment_aggregates = self._sentiment_aggregates(session, contract_ids)
+                odds_statistics = (
+                    self._odds_statistics(session, contract_ids)
+                    if self.settings.enable_historical_analysis else {}
+                )
+                # Window row counts, so the information-asymmetry and
+                # volume-spike queries only run where they can find a gap
+                window_activity = self._window_activity(session, contract_ids, now)
+
+                # (contract, gap type) pairs already detected inside the dedupe
+                # window, fetched once rather than checked with a query per gap
+                recent_gap_keys = set(session.query(
+                    DetectedGap.contract_id, DetectedGap.gap_type
+                ).filter(
+                    DetectedGap.detected_at >= dedupe_since
+                ).distinct().all())
+
+                # Contracts are independent and detection is I/O-bound (DB
+                # queries, cross-market HTTP), so run them on a thread pool with
+                # one session per worker. map() keeps results in contract order
+                # so dedupe stays deterministic.
+                max_workers = max(1, min(self.settings.gap_detection_workers, len(contract_ids)))
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(
+                        lambda cid: self._detect_gaps_for_id(
+                            cid, sentiment_aggregates, odds_statistics, window_activity, now
+                        ),
+                        contract_ids
+                    ))
+
+                # Cross-market matching for every contract's candidates in a
+                # few multi-contract LLM prompts instead of one call each
+                checks = [check for _, contract_checks in results for check in contract_checks]
+                matches = self._match_markets_batch([(c.question, c.candidates) for c in checks])
+                arbitrage_gaps: Dict[str, List[Dict]] = {}
+                for check, check_matches in zip(checks, matches):
+                    if check_matches is None:
+                        # Matching failed; retry next cycle instead of skipping
+                        continue
+                    if not check_matches:
+                        self._skip_arbitrage(check.contract_id)
+                    arbitrage_gaps.setdefault(check.contract_id, []).extend(
+                        self._arbitrage_gaps(check, check_matches)
+                    )
 
+                new_gaps = []
+                for contract_id, (gaps, _) in zip(contract_ids, results):
+                    gaps = gaps + arbitrage_gaps.get(str(contract_id), [])
                     # Store gaps in database (skip if same contract+type already detected recently)
                     for gap in gaps:
                         if gap['confidence_score'] < self.settings.min_confidence_score:
                             continue
                         # Avoid duplicate rows: skip if we already have this gap type for this contract recently
-                        existing = session.query(DetectedGap).filter(
-                            DetectedGap.contract_id == UUID(gap['contract_id']),
-                            DetectedGap.gap_type == gap['gap_type'],
-                            DetectedGap.detected_at >= dedupe_since,
-                        ).first()
-                        if existing:
+                        gap_key = (contract_id, gap['gap_type'])
+                        if gap_key in recent_gap_keys:
                             logger.debug(
-                                "Skipping duplicate gap: contract=%s type=%s (already detected at %s)",
-                                gap['contract_id'], gap['gap_type'], existing.detected_at
+                                "Skipping duplicate gap: contract=%s type=%s (already detected recently)",
+                                gap['contract_id'], gap['gap_type']
                             )
                             continue
+                        recent_gap_keys.add(gap_key)
+                        new_gaps.append((contract_id, gap))
 
-                        detected_gap = DetectedGap(
-                            contract_id=UUID(gap['contract_id']),
-                            gap_type=gap['gap_type'],
-                            confidence_score=gap['confidence_score'],
-                            explanation=gap['explanation'],
-                            evidence=gap['evidence'],
-                            market_odds=gap['market_odds'],
-                            implied_odds=gap.get('implied_odds'),
-                            edge_percentage=gap['edge_percentage'],
-                            social_sources_count=gap.get('social_sources_count', 0),
-                            contract_features=gap.get('contract_features'),
-                        )
-                        session.add(detected_gap)
-                        all_gaps.append(gap)
+                # Explain only the gaps being stored, in one concurrent LLM
+                # batch instead of one blocking call per gap during detection
+                self._fill_explanations([gap for _, gap in new_gaps])
 
+                # Reuse the UUID from the id query rather than re-parsing the
+                # gap's string contract_id
+                to_insert = [{
+                    'contract_id': contract_id,
+                    'gap_type': gap['gap_type'],
+                    'confidence_score': gap['confidence_score'],
+                    'explanation': gap['explanation'],
+                    'evidence': gap['evidence'],
+                    'market_odds': gap['market_odds'],
+                    'implied_odds': gap.get('implied_odds'),
+                    'edge_percentage': gap['edge_percentage'],
+                    'social_sources_count': gap.get('social_sources_count', 0),
+                    'contract_features': gap.get('contract_features'),
+                } for contract_id, gap in new_gaps]
+                all_gaps.extend(gap for _, gap in new_gaps)
+
+                # One Core executemany after detection: no ORM objects, and a
+                # detector error (which rolls back the shared session) cannot
+                # discard gaps that were already pending
+                if to_insert:
+                    session.execute(DetectedGap.__table__.insert(), to_insert)
                 session.commit()
 
         except Exception as e:
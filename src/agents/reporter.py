@@ -1,6 +1,7 @@
 """Reporting Agent - Ranks and formats pricing gap opportunities."""
 
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, List, Optional
 from uuid import UUID
 
@@ -10,9 +11,6 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-from sqlalchemy import func
-from sqlalchemy.orm import joinedload
-
 from ..config import get_settings
 from ..database import get_db_manager
 from ..database.models import Contract, DetectedGap
@@ -20,6 +18,14 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# (minimum confidence, border style, title style) for gap panels, highest first
+_CONFIDENCE_STYLES = (
+    (80, "bold green", "bold white on green"),
+    (70, "green", "white on green"),
+    (60, "yellow", "black on yellow"),
+    (0, "dim", "white on dim"),
+)
+
 
 class ReportingAgent:
     """
@@ -72,31 +78,42 @@ class ReportingAgent:
         try:
             with self.db_manager.get_session() as session:
                 # Get recent unresolved gaps. One row per (contract_id, gap_type) - latest only.
-                subq = (
-                    session.query(
-                        DetectedGap.id,
-                        func.row_number().over(
-                            partition_by=[DetectedGap.contract_id, DetectedGap.gap_type],
-                            order_by=DetectedGap.detected_at.desc()
-                        ).label('rn')
-                    ).filter(
+                # DISTINCT ON walks idx_detected_gaps_latest_open (backwards, hence
+                # the all-DESC ordering) instead of numbering every row.
+                latest = (
+                    session.query(DetectedGap.id)
+                    .filter(
                         DetectedGap.resolved == False,
                         DetectedGap.confidence_score >= self.settings.min_confidence_score
                     )
+                    .distinct(DetectedGap.contract_id, DetectedGap.gap_type)
+                    .order_by(
+                        DetectedGap.contract_id.desc(),
+                        DetectedGap.gap_type.desc(),
+                        DetectedGap.detected_at.desc()
+                    )
                 ).subquery()
 
-                gap_ids = [
-                    r[0] for r in
-                    session.query(subq.c.id).filter(subq.c.rn == 1).limit(limit * 2).all()
-                ]
-
-                if not gap_ids:
-                    return []
-
-                gaps = (
-                    session.query(DetectedGap)
-                    .options(joinedload(DetectedGap.contract))
-                    .filter(DetectedGap.id.in_(gap_ids))
+                # Plain column rows; the contract's fields come from the join
+                # (gaps whose contract is gone are dropped by the inner join)
+                rows = (
+                    session.query(
+                        DetectedGap.id,
+                        DetectedGap.contract_id,
+                        Contract.question,
+                        DetectedGap.gap_type,
+                        DetectedGap.confidence_score,
+                        DetectedGap.explanation,
+                        DetectedGap.evidence,
+                        DetectedGap.market_odds,
+                        DetectedGap.implied_odds,
+                        DetectedGap.edge_percentage,
+                        DetectedGap.detected_at,
+                        Contract.category,
+                        Contract.end_date,
+                    )
+                    .join(latest, DetectedGap.id == latest.c.id)
+                    .join(Contract, Contract.id == DetectedGap.contract_id)
                     .order_by(DetectedGap.confidence_score.desc(), DetectedGap.detected_at.desc())
                     .limit(limit)
                     .all()
@@ -104,25 +121,22 @@ class ReportingAgent:
 
                 # Format gaps with contract information
                 result = []
-                for gap in gaps:
-                    contract = gap.contract
-
-                    if contract:
-                        result.append({
-                            'id': str(gap.id),
-                            'contract_id': str(gap.contract_id),
-                            'question': contract.question,
-                            'gap_type': gap.gap_type,
-                            'confidence_score': gap.confidence_score,
-                            'explanation': gap.explanation,
-                            'evidence': gap.evidence,
-                            'market_odds': float(gap.market_odds) if gap.market_odds else None,
-                            'implied_odds': float(gap.implied_odds) if gap.implied_odds else None,
-                            'edge_percentage': float(gap.edge_percentage) if gap.edge_percentage else None,
-                            'detected_at': gap.detected_at.isoformat(),
-                            'category': contract.category,
-                            'end_date': contract.end_date.isoformat() if contract.end_date else None
-                        })
+                for row in rows:
+                    result.append({
+                        'id': str(row.id),
+                        'contract_id': str(row.contract_id),
+                        'question': row.question,
+                        'gap_type': row.gap_type,
+                        'confidence_score': row.confidence_score,
+                        'explanation': row.explanation,
+                        'evidence': row.evidence,
+                        'market_odds': float(row.market_odds) if row.market_odds else None,
+                        'implied_odds': float(row.implied_odds) if row.implied_odds else None,
+                        'edge_percentage': float(row.edge_percentage) if row.edge_percentage else None,
+                        'detected_at': row.detected_at.isoformat(),
+                        'category': row.category,
+                        'end_date': row.end_date.isoformat() if row.end_date else None
+                    })
 
                 return result
 
@@ -143,14 +157,15 @@ class ReportingAgent:
         # Calculate composite score: confidence * edge_factor
         for gap in gaps:
             confidence = gap['confidence_score']
-            edge = gap.get('edge_percentage', 0)
+            edge = gap.get('edge_percentage') or 0  # NULL for gaps without an edge estimate
 
             # Composite score favors high confidence and high edge
             composite_score = (confidence * 0.7) + (min(edge, 20) * 1.5)
             gap['composite_score'] = composite_score
 
-        # Sort by composite score
-        ranked = sorted(gaps, key=lambda x: x['composite_score'], reverse=True)
+        # Sort by composite score. The input is already capped at
+        # max_gaps_to_display by fetch_recent_gaps, so a full sort is cheap.
+        ranked = sorted(gaps, key=itemgetter('composite_score'), reverse=True)
 
         # Add rank numbers
         for i, gap in enumerate(ranked, 1):
@@ -312,18 +327,9 @@ class ReportingAgent:
         content.append(f"Detected: {gap['detected_at'][:19]}", style="dim")
 
         # Panel styling based on confidence
-        if confidence >= 80:
-            border_style = "bold green"
-            title_style = "bold white on green"
-        elif confidence >= 70:
-            border_style = "green"
-            title_style = "white on green"
-        elif confidence >= 60:
-            border_style = "yellow"
-            title_style = "black on yellow"
-        else:
-            border_style = "dim"
-            title_style = "white on dim"
+        border_style, title_style = next(
+            (border, title) for floor, border, title in _CONFIDENCE_STYLES if confidence >= floor
+        )
 
         # Create panel
         panel = Panel(
@@ -361,7 +367,7 @@ class ReportingAgent:
                 f"{gap['confidence_score']}/100",
                 self.format_gap_type(gap['gap_type']),
                 gap['question'][:47] + "..." if len(gap['question']) > 50 else gap['question'],
-                f"{gap.get('edge_percentage', 0):.1f}%"
+                f"{gap.get('edge_percentage') or 0:.1f}%"
             )
 
         return table
@@ -1,16 +1,23 @@
 """Sentiment Analysis Agent - Analyzes social media sentiment using LLM."""
 
+import concurrent.futures
+import hashlib
 import json
+import re
 import sys
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 sys.path.insert(0, str(Path.home() / ".api-monitor"))
 
 from crewai import Agent, Task
+from sqlalchemy import case, func
 
 from ..config import get_settings, get_llm
 from ..database import get_db_manager
@@ -25,6 +32,37 @@ MIN_POSTS_FOR_ANALYSIS = 3
 # Number of posts to send per LLM call (keep small for 7b models)
 BATCH_SIZE = 5
 
+# Maximum number of per-post sentiment results kept in memory
+_SENTIMENT_CACHE_SIZE = 10000
+
+# Prompt templates, built once at import and filled with str.format per call
+_BATCH_PROMPT = """Analyze the sentiment of these {count} social media posts in the context of prediction markets.
+
+{numbered}
+
+For EACH post, determine:
+- sentiment_score: number from -1.0 (very bearish) to +1.0 (very bullish)
+- sentiment_label: "positive", "negative", or "neutral"
+- confidence: your confidence 0.0 to 1.0
+- topics: 2-3 key topics mentioned
+
+Respond with ONLY a valid JSON array of {count} objects (one per post, in order). No extra text.
+Example: [{{"sentiment_score": 0.5, "sentiment_label": "positive", "confidence": 0.8, "topics": ["topic1"]}}]
+"""
+
+_SINGLE_POST_PROMPT = """Analyze the sentiment of this social media post in the context of prediction markets.
+
+Post: "{content}"
+
+Provide a JSON response with:
+1. sentiment_score: A number from -1.0 (very negative/bearish) to +1.0 (very positive/bullish)
+2. sentiment_label: One of "positive", "negative", or "neutral"
+3. confidence: Your confidence in this analysis (0.0 to 1.0)
+4. topics: A list of 2-3 key topics or themes mentioned
+
+Respond with ONLY valid JSON, no additional text.
+"""
+
 
 class SentimentAnalysisAgent:
     """
@@ -46,6 +84,12 @@ class SentimentAnalysisAgent:
         # Initialize LLM (OpenAI or Ollama based on config)
         self.llm = get_llm()
 
+        # sha256(normalized content) -> (expires_at, sentiment); the same text
+        # (reposts, shared headlines) shows up across posts and contracts.
+        # Shared by the per-contract worker threads.
+        self._sentiment_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._sentiment_cache_lock = threading.Lock()
+
         # Initialize ensemble sentiment (VADER + TextBlob)
         self.ensemble = None
         if self.settings.enable_ensemble_sentiment:
@@ -78,7 +122,37 @@ class SentimentAnalysisAgent:
 
     def _invoke_llm(self, prompt: str) -> str:
         """Call LLM and return the response text, handling provider differences."""
-        response = self.llm.invoke(prompt)
+        return self._response_text(self.llm.invoke(prompt))
+
+    def _invoke_llm_batch(self, prompts: List[str]) -> List[Optional[str]]:
+        """
+        Send several prompts to the LLM concurrently.
+
+        Args:
+            prompts: Prompts to send
+
+        Returns:
+            Response texts in prompt order; None where a call failed
+        """
+        if not prompts:
+            return []
+        responses = self.llm.batch(
+            prompts,
+            config={'max_concurrency': self.settings.llm_batch_concurrency},
+            return_exceptions=True
+        )
+        texts = []
+        for response in responses:
+            if isinstance(response, Exception):
+                logger.error(f"LLM batch call failed: {response}")
+                texts.append(None)
+            else:
+                texts.append(self._response_text(response))
+        return texts
+
+    @staticmethod
+    def _response_text(response) -> str:
+        """Log token usage for one LLM response and return its text."""
         try:
             from api_logger import log_api_call
             meta = getattr(response, "response_metadata", {}) or {}
@@ -97,8 +171,6 @@ class SentimentAnalysisAgent:
     @staticmethod
     def _clean_json(text: str) -> str:
         """Strip markdown code fences and repair common LLM JSON issues."""
-        import re
-
         # Remove markdown code fences
         if text.startswith('```'):
             text = text.split('```')[1]
@@ -143,134 +215,199 @@ class SentimentAnalysisAgent:
 
         return text
 
-    def _analyze_batch(self, contents: List[str]) -> List[Optional[Dict]]:
+    @staticmethod
+    def _parse_sentiment(item: Dict) -> Dict:
         """
-        Analyze sentiment for a batch of posts in a single LLM call.
-
-        Args:
-            contents: List of post content strings (max ~10)
+        Normalize one sentiment object returned by the LLM.
 
-        Returns:
-            List of sentiment dicts (same length as contents, None for failures)
+        Raises:
+            KeyError, ValueError, TypeError: If the object is malformed
         """
+        return {
+            'score': Decimal(str(max(-1.0, min(1.0, float(item['sentiment_score']))))),
+            'label': item['sentiment_label'].lower(),
+            'confidence': Decimal(str(max(0.0, min(1.0, float(item['confidence']))))),
+            'topics': item.get('topics', [])[:5]
+        }
+
+    def _parse_items(self, items: List, count: int) -> List[Optional[Dict]]:
+        """Parse up to count sentiment objects, padding with None."""
+        results = []
+        for item in items[:count]:
+            try:
+                results.append(self._parse_sentiment(item))
+            except (KeyError, ValueError, TypeError, AttributeError):
+                results.append(None)
+
+        # Pad with None if LLM returned fewer items than expected
+        while len(results) < count:
+            results.append(None)
+        return results
+
+    @staticmethod
+    def _batch_prompt(contents: List[str]) -> str:
+        """Build the multi-post sentiment prompt for a batch of posts."""
         numbered = "\n".join(
             f'Post {i+1}: "{c[:500]}"' for i, c in enumerate(contents)
         )
 
-        prompt = f"""Analyze the sentiment of these {len(contents)} social media posts in the context of prediction markets.
-
-{numbered}
+        return _BATCH_PROMPT.format(count=len(contents), numbered=numbered)
 
-For EACH post, determine:
-- sentiment_score: number from -1.0 (very bearish) to +1.0 (very bullish)
-- sentiment_label: "positive", "negative", or "neutral"
-- confidence: your confidence 0.0 to 1.0
-- topics: 2-3 key topics mentioned
+    def _parse_batch(self, contents: List[str], result_text: str) -> Optional[List[Optional[Dict]]]:
+        """
+        Parse the LLM response to a batch prompt.
 
-Respond with ONLY a valid JSON array of {len(contents)} objects (one per post, in order). No extra text.
-Example: [{{"sentiment_score": 0.5, "sentiment_label": "positive", "confidence": 0.8, "topics": ["topic1"]}}]
-"""
+        Args:
+            contents: Post contents the prompt was built from
+            result_text: Raw LLM response
 
+        Returns:
+            Sentiment dicts (same length as contents, None for failures),
+            or None if the response could not be parsed as JSON at all
+        """
+        result_text = self._clean_json(result_text)
         try:
-            result_text = self._invoke_llm(prompt)
-            result_text = self._clean_json(result_text)
-
             parsed = json.loads(result_text)
-
             if not isinstance(parsed, list):
                 parsed = [parsed]
-
-            results = []
-            for item in parsed[:len(contents)]:
-                try:
-                    results.append({
-                        'score': Decimal(str(max(-1.0, min(1.0, float(item['sentiment_score']))))),
-                        'label': item['sentiment_label'].lower(),
-                        'confidence': Decimal(str(max(0.0, min(1.0, float(item['confidence']))))),
-                        'topics': item.get('topics', [])[:5]
-                    })
-                except (KeyError, ValueError, TypeError):
-                    results.append(None)
-
-            # Pad with None if LLM returned fewer items than expected
-            while len(results) < len(contents):
-                results.append(None)
-
-            return results
+            return self._parse_items(parsed, len(contents))
 
         except json.JSONDecodeError as e:
             # Last resort: try to extract individual JSON objects manually
             try:
-                import re
                 objects = re.findall(r'\{[^{}]+\}', result_text)
                 if len(objects) >= len(contents):
                     parsed = [json.loads(obj) for obj in objects[:len(contents)]]
-                    results = []
-                    for item in parsed:
-                        try:
-                            results.append({
-                                'score': Decimal(str(max(-1.0, min(1.0, float(item['sentiment_score']))))),
-                                'label': item['sentiment_label'].lower(),
-                                'confidence': Decimal(str(max(0.0, min(1.0, float(item['confidence']))))),
-                                'topics': item.get('topics', [])[:5]
-                            })
-                        except (KeyError, ValueError, TypeError):
-                            results.append(None)
-                    while len(results) < len(contents):
-                        results.append(None)
                     logger.debug(f"Batch JSON repaired by extracting individual objects")
-                    return results
+                    return self._parse_items(parsed, len(contents))
             except Exception:
                 pass
 
             logger.warning(f"Batch JSON parse failed ({e}), falling back to single-post analysis")
-            return [self._analyze_single_post(c) for c in contents]
-        except Exception as e:
-            logger.error(f"Batch analysis error: {e}")
-            return [None] * len(contents)
+            return None
 
-    def _analyze_single_post(self, content: str) -> Optional[Dict]:
+    @staticmethod
+    def _content_key(content: str) -> str:
+        """Cache key for a post's content, ignoring case and surrounding whitespace."""
+        return hashlib.sha256(content.strip().lower().encode('utf-8')).hexdigest()
+
+    def _analyze_posts(self, contents: List[str]) -> List[Optional[Dict]]:
         """
-        Analyze sentiment of a single post using LLM (fallback for failed batches).
+        Analyze sentiment for posts, reusing cached results for known content.
+
+        Identical contents are analyzed once. The remaining posts are sent
+        to the LLM in batches of BATCH_SIZE, and successful results are
+        cached for sentiment_cache_ttl seconds.
 
         Args:
-            content: Post content text
+            contents: Post content strings
 
         Returns:
-            Sentiment analysis result dictionary
+            Sentiment dicts in input order (None for failures)
         """
-        try:
-            prompt = f"""Analyze the sentiment of this social media post in the context of prediction markets.
+        now = time.monotonic()
+        ttl = self.settings.sentiment_cache_ttl
+        keys = [self._content_key(content) for content in contents]
+
+        sentiments: Dict[str, Optional[Dict]] = {}
+        misses: Dict[str, str] = {}
+        with self._sentiment_cache_lock:
+            for key, content in zip(keys, contents):
+                if key in sentiments or key in misses:
+                    continue
+                cached = self._sentiment_cache.get(key)
+                if cached is not None and cached[0] > now:
+                    sentiments[key] = cached[1]
+                else:
+                    misses[key] = content
+
+        if misses:
+            miss_keys = list(misses)
+            batches = [
+                [misses[key] for key in miss_keys[i:i + BATCH_SIZE]]
+                for i in range(0, len(miss_keys), BATCH_SIZE)
+            ]
+            results = [r for batch_results in self._analyze_batches(batches) for r in batch_results]
+            with self._sentiment_cache_lock:
+                for key, sentiment in zip(miss_keys, results):
+                    sentiments[key] = sentiment
+                    if sentiment and ttl > 0:
+                        self._sentiment_cache[key] = (now + ttl, sentiment)
+                        self._sentiment_cache.move_to_end(key)
+                while len(self._sentiment_cache) > _SENTIMENT_CACHE_SIZE:
+                    self._sentiment_cache.popitem(last=False)
+
+        logger.debug(
+            "Post sentiment: %d cached, %d analyzed", len(sentiments) - len(misses), len(misses)
+        )
+        return [sentiments[key] for key in keys]
 
-Post: "{content[:500]}"
+    def _analyze_batches(self, batches: List[List[str]]) -> List[List[Optional[Dict]]]:
+        """
+        Analyze sentiment for several batches of posts.
 
-Provide a JSON response with:
-1. sentiment_score: A number from -1.0 (very negative/bearish) to +1.0 (very positive/bullish)
-2. sentiment_label: One of "positive", "negative", or "neutral"
-3. confidence: Your confidence in this analysis (0.0 to 1.0)
-4. topics: A list of 2-3 key topics or themes mentioned
+        Each batch becomes one multi-post prompt, and all prompts are sent
+        to the LLM concurrently. Posts from batches whose response cannot
+        be parsed are retried one post per prompt, also concurrently.
 
-Respond with ONLY valid JSON, no additional text.
-"""
+        Args:
+            batches: Lists of post content strings (max ~10 each)
 
-            result_text = self._invoke_llm(prompt)
-            result_text = self._clean_json(result_text)
+        Returns:
+            One list of sentiment dicts per batch (same length as the
+            batch, None for failures)
+        """
+        texts = self._invoke_llm_batch([self._batch_prompt(contents) for contents in batches])
 
-            sentiment = json.loads(result_text)
+        results: List[Optional[List[Optional[Dict]]]] = []
+        for contents, text in zip(batches, texts):
+            if text is None:
+                results.append([None] * len(contents))
+                continue
+            try:
+                results.append(self._parse_batch(contents, text))
+            except Exception as e:
+                logger.error(f"Batch analysis error: {e}")
+                results.append([None] * len(contents))
 
-            return {
-                'score': Decimal(str(max(-1.0, min(1.0, float(sentiment['sentiment_score']))))),
-                'label': sentiment['sentiment_label'].lower(),
-                'confidence': Decimal(str(max(0.0, min(1.0, float(sentiment['confidence']))))),
-                'topics': sentiment.get('topics', [])[:5]
-            }
+        failed = [i for i, batch_results in enumerate(results) if batch_results is None]
+        if failed:
+            singles = iter(self._analyze_single_posts(
+                [content for i in failed for content in batches[i]]
+            ))
+            for i in failed:
+                results[i] = [next(singles) for _ in batches[i]]
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing LLM JSON response: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Error in sentiment analysis: {e}")
-            return None
+        return results
+
+    def _analyze_single_posts(self, contents: List[str]) -> List[Optional[Dict]]:
+        """
+        Analyze posts one per LLM call (fallback for failed batches).
+
+        The calls are sent concurrently.
+
+        Args:
+            contents: Post content texts
+
+        Returns:
+            Sentiment analysis result dictionaries (None for failures)
+        """
+        prompts = [_SINGLE_POST_PROMPT.format(content=content[:500]) for content in contents]
+
+        results = []
+        for result_text in self._invoke_llm_batch(prompts):
+            if result_text is None:
+                results.append(None)
+                continue
+            try:
+                results.append(self._parse_sentiment(json.loads(self._clean_json(result_text))))
+            except json.JSONDecodeError as e:
+                logger.error(f"Error parsing LLM JSON response: {e}")
+                results.append(None)
+            except Exception as e:
+                logger.error(f"Error in sentiment analysis: {e}")
+                results.append(None)
+        return results
 
     def analyze_contract_sentiment(self, contract_id: str) -> Dict:
         """
@@ -310,10 +447,13 @@ Respond with ONLY valid JSON, no additional text.
                         'sentiment_distribution': {'positive': 0, 'negative': 0, 'neutral': 0}
                     }
 
-                # Filter to only posts that haven't been analyzed yet
+                # Filter to only posts that haven't been analyzed yet (one
+                # lookup restricted to the fetched posts, not the contract's
+                # whole analysis history)
                 analyzed_ids = set(
                     row[0] for row in session.query(SentimentAnalysis.post_id).filter(
-                        SentimentAnalysis.contract_id == contract_uuid
+                        SentimentAnalysis.contract_id == contract_uuid,
+                        SentimentAnalysis.post_id.in_([p.id for p in posts])
                     ).all()
                 )
                 posts_to_analyze = [p for p in posts if p.id not in analyzed_ids]
@@ -327,58 +467,63 @@ Respond with ONLY valid JSON, no additional text.
                 if posts_to_analyze:
                     logger.info(f"Analyzing {len(posts_to_analyze)} new posts in batches of {BATCH_SIZE}...")
 
-                    for i in range(0, len(posts_to_analyze), BATCH_SIZE):
-                        batch_posts = posts_to_analyze[i:i + BATCH_SIZE]
-                        batch_contents = [p.content for p in batch_posts]
-
-                        sentiments = self._analyze_batch(batch_contents)
-
-                        for post, sentiment in zip(batch_posts, sentiments):
-                            if sentiment:
-                                # Compute ensemble scores if available
-                                vader_score = None
-                                textblob_score = None
-                                ensemble_score = None
-
-                                if self.ensemble:
-                                    try:
-                                        lexicon = self.ensemble.score(post.content)
-                                        vader_score = Decimal(str(lexicon['vader_score'])) \
-                                            if lexicon['vader_score'] is not None else None
-                                        textblob_score = Decimal(str(lexicon['textblob_score'])) \
-                                            if lexicon['textblob_score'] is not None else None
-
-                                        ens = self.ensemble.ensemble_score(
-                                            llm_score=float(sentiment['score']),
-                                            vader_score=lexicon['vader_score'],
-                                            textblob_score=lexicon['textblob_score'],
-                                            llm_weight=0.5
-                                        )
-                                        ensemble_score = Decimal(str(ens))
-                                    except Exception as e:
-                                        logger.debug(f"Ensemble scoring failed: {e}")
-
-                                analysis = SentimentAnalysis(
-                                    post_id=post.id,
-                                    contract_id=contract_uuid,
-                                    sentiment_score=sentiment['score'],
-                                    sentiment_label=sentiment['label'],
-                                    confidence=sentiment['confidence'],
-                                    topics=sentiment.get('topics', []),
-                                    vader_score=vader_score,
-                                    textblob_score=textblob_score,
-                                    ensemble_score=ensemble_score,
-                                )
-                                session.add(analysis)
+                    sentiments = self._analyze_posts([p.content for p in posts_to_analyze])
+
+                    rows = []
+                    for post, sentiment in zip(posts_to_analyze, sentiments):
+                        if sentiment:
+                            # Compute ensemble scores if available
+                            vader_score = None
+                            textblob_score = None
+                            ensemble_score = None
+
+                            if self.ensemble:
+                                try:
+                                    lexicon = self.ensemble.score(post.content)
+                                    vader_score = Decimal(str(lexicon['vader_score'])) \
+                                        if lexicon['vader_score'] is not None else None
+                                    textblob_score = Decimal(str(lexicon['textblob_score'])) \
+                                        if lexicon['textblob_score'] is not None else None
+
+                                    ens = self.ensemble.ensemble_score(
+                                        llm_score=float(sentiment['score']),
+                                        vader_score=lexicon['vader_score'],
+                                        textblob_score=lexicon['textblob_score'],
+                                        llm_weight=0.5
+                                    )
+                                    ensemble_score = Decimal(str(ens))
+                                except Exception as e:
+                                    logger.debug(f"Ensemble scoring failed: {e}")
+
+                            rows.append({
+                                'post_id': post.id,
+                                'contract_id': contract_uuid,
+                                'sentiment_score': sentiment['score'],
+                                'sentiment_label': sentiment['label'],
+                                'confidence': sentiment['confidence'],
+                                'topics': sentiment.get('topics', []),
+                                'vader_score': vader_score,
+                                'textblob_score': textblob_score,
+                                'ensemble_score': ensemble_score,
+                            })
 
+                    # One executemany instead of an ORM unit of work per row
+                    if rows:
+                        session.execute(SentimentAnalysis.__table__.insert(), rows)
                     session.commit()
 
-                # Aggregate all sentiment (existing + new)
-                analyses = session.query(SentimentAnalysis).filter(
-                    SentimentAnalysis.contract_id == contract_uuid
-                ).all()
-
-                if not analyses:
+                # Aggregate all sentiment (existing + new) in SQL: one summary
+                # row plus the top topics, instead of every analysis row
+                contract_filter = SentimentAnalysis.contract_id == contract_uuid
+                total, avg_sentiment, positive, negative, neutral = session.query(
+                    func.count(SentimentAnalysis.id),
+                    func.avg(SentimentAnalysis.sentiment_score),
+                    func.sum(case((SentimentAnalysis.sentiment_label == 'positive', 1), else_=0)),
+                    func.sum(case((SentimentAnalysis.sentiment_label == 'negative', 1), else_=0)),
+                    func.sum(case((SentimentAnalysis.sentiment_label == 'neutral', 1), else_=0)),
+                ).filter(contract_filter).one()
+
+                if not total:
                     return {
                         'contract_id': contract_id,
                         'total_posts': len(posts),
@@ -386,21 +531,13 @@ Respond with ONLY valid JSON, no additional text.
                         'sentiment_distribution': {'positive': 0, 'negative': 0, 'neutral': 0}
                     }
 
-                # Calculate aggregates
-                total = len(analyses)
-                avg_sentiment = sum(float(a.sentiment_score) for a in analyses) / total
-                positive = sum(1 for a in analyses if a.sentiment_label == 'positive')
-                negative = sum(1 for a in analyses if a.sentiment_label == 'negative')
-                neutral = sum(1 for a in analyses if a.sentiment_label == 'neutral')
+                avg_sentiment = float(avg_sentiment or 0.0)
 
                 # Extract common topics
-                all_topics = []
-                for a in analyses:
-                    all_topics.extend(a.topics or [])
-                topic_counts = {}
-                for topic in all_topics:
-                    topic_counts[topic] = topic_counts.get(topic, 0) + 1
-                top_topics = sorted(topic_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+                topic = func.unnest(SentimentAnalysis.topics).label('topic')
+                top_topics = session.query(topic, func.count()).filter(
+                    contract_filter
+                ).group_by(topic).order_by(func.count().desc()).limit(5).all()
 
                 # Compute rolling sentiment snapshots
                 if self.ensemble:
@@ -449,15 +586,21 @@ Respond with ONLY valid JSON, no additional text.
                     Contract.id == any_(SocialPost.related_contracts)
                 )
                 now = datetime.now(timezone.utc)
-                contracts = session.query(Contract).filter(
-                    Contract.active == True,
-                    (Contract.end_date > now) | (Contract.end_date == None)
-                ).order_by(
-                    Contract.end_date.asc().nulls_last()
-                ).limit(self.settings.max_contracts_per_cycle).all()
-
-                for contract in contracts:
-                    sentiment = self.analyze_contract_sentiment(str(contract.id))
+                contract_ids = [
+                    str(row.id) for row in session.query(Contract.id).filter(
+                        Contract.active == True,
+                        (Contract.end_date > now) | (Contract.end_date == None)
+                    ).order_by(
+                        Contract.end_date.asc().nulls_last()
+                    ).limit(self.settings.max_contracts_per_cycle).all()
+                ]
+
+            # Contracts are independent, so analyze them concurrently. Each
+            # worker opens its own session; the listing session above is
+            # already closed so it doesn't hold a pool connection meanwhile.
+            max_workers = max(1, min(self.settings.sentiment_analysis_workers, len(contract_ids)))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for sentiment in executor.map(self.analyze_contract_sentiment, contract_ids):
                     if sentiment:
                         results.append(sentiment)
 
@@ -24,6 +24,10 @@ class Settings(BaseSettings):
     )
     db_pool_size: int = Field(default=20, description='Database connection pool size')
     db_max_overflow: int = Field(default=0, description='Database max overflow connections')
+    db_pool_recycle: int = Field(
+        default=1800,
+        description='Seconds before a pooled connection is replaced (-1 = never)'
+    )
 
     # LLM Configuration
     llm_provider: str = Field(
@@ -55,6 +59,15 @@ class Settings(BaseSettings):
         le=2.0,
         description='LLM temperature for generation'
     )
+    llm_batch_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description=(
+            'Max concurrent LLM requests per batch call (gap explanations, market matching, '
+            'post sentiment); sentiment batches run in each of sentiment_analysis_workers '
+            'threads, so up to workers x this many requests can be in flight'
+        )
+    )
 
     # DeepSeek API Configuration (Optional - falls back to Ollama if missing)
     deepseek_api_key: Optional[str] = Field(default=None, description='DeepSeek API key')
@@ -127,8 +140,18 @@ class Settings(BaseSettings):
     )
     max_contracts_for_social: int = Field(
         default=10,
+        ge=0,
+        description='Max contracts to fetch social/news data for (0 = no cap; per-source rate limits still apply)'
+    )
+    social_source_workers: int = Field(
+        default=12,
+        ge=1,
+        description='Threads shared by all contracts for querying social/news sources concurrently'
+    )
+    social_fetch_workers: int = Field(
+        default=8,
         ge=1,
-        description='Max contracts to fetch social/news data for (more = more coverage, more API usage)'
+        description='Threads shared by all contracts for concurrent per-keyword social API calls'
     )
     min_confidence_score: int = Field(
         default=25,
@@ -178,6 +201,16 @@ class Settings(BaseSettings):
         ge=1,
         description='Posts per sentiment analysis batch'
     )
+    sentiment_cache_ttl: int = Field(
+        default=21600,
+        ge=0,
+        description='Seconds to reuse an LLM sentiment result for identical post content (0 disables caching)'
+    )
+    sentiment_analysis_workers: int = Field(
+        default=4,
+        ge=1,
+        description='Threads analyzing contract sentiment concurrently (each holds a DB connection)'
+    )
     gap_detection_threshold: float = Field(
         default=0.04,
         ge=0.0,
@@ -189,6 +222,16 @@ class Settings(BaseSettings):
         ge=0,
         description='Skip storing a gap if same contract+type was already detected within this many hours'
     )
+    gap_detection_workers: int = Field(
+        default=8,
+        ge=1,
+        description='Threads running gap detectors on contracts concurrently (each holds a DB connection)'
+    )
+    gap_explanation_cache_ttl: int = Field(
+        default=3600,
+        ge=0,
+        description='Seconds to reuse an LLM gap explanation for an identical prompt (0 disables caching)'
+    )
     # Sentiment score (-1..1) is mapped to implied probability: 0.5 + (sentiment * scale). Default 0.4 → 0.1..0.9
     gap_sentiment_prob_scale: float = Field(
         default=0.4,
@@ -196,6 +239,26 @@ class Settings(BaseSettings):
         le=0.5,
         description='Scale from sentiment to implied probability (0.5 + sentiment * scale)'
     )
+    arbitrage_negative_ttl: int = Field(
+        default=600,
+        ge=0,
+        description='Seconds to skip arbitrage checks for a contract after finding no matching markets (0 disables)'
+    )
+    cross_market_search_cache_ttl: int = Field(
+        default=300,
+        ge=0,
+        description='Seconds to reuse Kalshi/Manifold search results for the same query (0 disables caching)'
+    )
+    market_match_batch_size: int = Field(
+        default=10,
+        ge=1,
+        description='Contracts whose cross-market candidates are matched in one LLM prompt'
+    )
+    market_match_cache_ttl: int = Field(
+        default=21600,
+        ge=0,
+        description='Seconds to reuse an LLM cross-market match decision for the same questions (0 disables caching)'
+    )
     arbitrage_min_edge: float = Field(
         default=0.10,
         ge=0.0,
@@ -421,6 +484,8 @@ class Settings(BaseSettings):
 
 # Global settings instance
 _settings: Optional[Settings] = None
+_llm = None
+_fast_llm = None
 
 
 def get_settings() -> Settings:
@@ -447,8 +512,10 @@ def get_settings() -> Settings:
 
 def reload_settings():
     """Reload settings from environment."""
-    global _settings
+    global _settings, _llm, _fast_llm
     _settings = None
+    _llm = None
+    _fast_llm = None
     return get_settings()
 
 
@@ -457,11 +524,21 @@ def get_llm():
     Get configured LLM instance based on settings.
 
     Supports: 'deepseek' (primary reasoning), 'openai', 'ollama' (free local fallback).
-    DeepSeek uses the OpenAI-compatible API format.
+    DeepSeek uses the OpenAI-compatible API format. The instance is created
+    once per process and shared by every agent, so they all reuse one HTTP
+    connection pool instead of each paying its own TCP/TLS setup.
 
     Returns:
         LLM instance
     """
+    global _llm
+    if _llm is None:
+        _llm = _create_llm()
+    return _llm
+
+
+def _create_llm():
+    """Build a new LLM client for the configured provider."""
     settings = get_settings()
 
     if settings.llm_provider == 'deepseek':
@@ -501,18 +578,24 @@ def get_fast_llm():
     """
     Get a fast/cheap LLM for simple classification tasks.
     Always uses Ollama to avoid burning API credits on trivial work.
+    Like get_llm(), the instance is shared process-wide.
 
     Returns:
         Ollama LLM instance
     """
+    global _fast_llm
+    if _fast_llm is not None:
+        return _fast_llm
+
     settings = get_settings()
     try:
         from langchain_community.llms import Ollama
-        return Ollama(
+        _fast_llm = Ollama(
             model=settings.ollama_model,
             base_url=settings.ollama_base_url,
             temperature=0.1
         )
     except ImportError:
         # If Ollama not available, fall back to primary LLM
-        return get_llm()
+        _fast_llm = get_llm()
+    return _fast_llm
@@ -118,7 +118,12 @@ def get_sentiment_history(
 
     with db.get_session() as session:
         # Sentiment data
-        sentiments = session.query(SentimentAnalysis).filter(
+        sentiments = session.query(
+            SentimentAnalysis.ensemble_score,
+            SentimentAnalysis.sentiment_score,
+            SentimentAnalysis.sentiment_label,
+            SentimentAnalysis.analyzed_at,
+        ).filter(
             SentimentAnalysis.contract_id == UUID(contract_id),
             SentimentAnalysis.analyzed_at >= cutoff,
         ).order_by(SentimentAnalysis.analyzed_at).all()
@@ -130,7 +135,10 @@ def get_sentiment_history(
         } for s in sentiments]
 
         # Odds data
-        odds = session.query(HistoricalOdds).filter(
+        odds = session.query(
+            HistoricalOdds.yes_odds,
+            HistoricalOdds.recorded_at,
+        ).filter(
             HistoricalOdds.contract_id == UUID(contract_id),
             HistoricalOdds.recorded_at >= cutoff,
         ).order_by(HistoricalOdds.recorded_at).all()
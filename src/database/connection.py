@@ -1,6 +1,7 @@
 """Database connection management."""
 
 import os
+import threading
 from contextlib import contextmanager
 from typing import Generator, Optional
 
@@ -11,6 +12,43 @@ from sqlalchemy.pool import QueuePool
 
 from .models import Base
 
+# Records every odds change into historical_odds as part of the contracts
+# upsert itself. Kept in sync with migrations/005_odds_history_trigger.sql;
+# create_tables() installs it idempotently so create_all() databases get it.
+# recorded_at holds naive UTC, hence timezone('utc', now()).
+_ODDS_HISTORY_TRIGGER_DDL = """
+CREATE OR REPLACE FUNCTION record_odds_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO historical_odds (id, contract_id, yes_odds, no_odds, volume, recorded_at)
+    VALUES (
+        gen_random_uuid(),
+        NEW.id,
+        NEW.current_yes_odds,
+        COALESCE(NEW.current_no_odds, 1 - NEW.current_yes_odds),
+        NEW.volume_24h,
+        timezone('utc', now())
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS record_contract_odds_insert ON contracts;
+CREATE TRIGGER record_contract_odds_insert
+    AFTER INSERT ON contracts
+    FOR EACH ROW
+    WHEN (NEW.current_yes_odds IS NOT NULL)
+    EXECUTE FUNCTION record_odds_change();
+
+DROP TRIGGER IF EXISTS record_contract_odds_update ON contracts;
+CREATE TRIGGER record_contract_odds_update
+    AFTER UPDATE OF current_yes_odds ON contracts
+    FOR EACH ROW
+    WHEN (NEW.current_yes_odds IS NOT NULL
+          AND OLD.current_yes_odds IS DISTINCT FROM NEW.current_yes_odds)
+    EXECUTE FUNCTION record_odds_change();
+"""
+
 
 class DatabaseManager:
     """Manages database connections and sessions."""
@@ -29,10 +67,12 @@ class DatabaseManager:
             self.database_url = settings.database_url
             pool_size = settings.db_pool_size
             max_overflow = settings.db_max_overflow
+            pool_recycle = settings.db_pool_recycle
         else:
             self.database_url = database_url
             pool_size = int(os.getenv('DB_POOL_SIZE', '20'))
             max_overflow = int(os.getenv('DB_MAX_OVERFLOW', '0'))
+            pool_recycle = int(os.getenv('DB_POOL_RECYCLE', '1800'))
 
         # Engine configuration for connection pooling
         self.engine = create_engine(
@@ -41,6 +81,7 @@ class DatabaseManager:
             pool_size=pool_size,
             max_overflow=max_overflow,
             pool_pre_ping=True,  # Verify connections before using
+            pool_recycle=pool_recycle,  # Replace connections before server/proxy idle timeouts
             echo=False  # Set to True for SQL query logging
         )
 
@@ -65,8 +106,10 @@ class DatabaseManager:
                 cursor.execute("SET TIME ZONE 'UTC'")
 
     def create_tables(self):
-        """Create all tables in the database."""
+        """Create all tables in the database and install the odds-history trigger."""
         Base.metadata.create_all(bind=self.engine)
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(_ODDS_HISTORY_TRIGGER_DDL)
 
     def drop_tables(self):
         """Drop all tables in the database. USE WITH CAUTION!"""
@@ -171,18 +214,25 @@ class DatabaseManager:
 
 # Global database manager instance
 _db_manager: Optional[DatabaseManager] = None
+_db_manager_lock = threading.Lock()
 
 
 def get_db_manager() -> DatabaseManager:
     """
     Get or create global database manager instance.
 
+    Creation is locked so concurrent first callers (agent worker threads,
+    dashboard requests) share one engine and connection pool instead of
+    each building their own.
+
     Returns:
         DatabaseManager: Singleton database manager
     """
     global _db_manager
     if _db_manager is None:
-        _db_manager = DatabaseManager()
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = DatabaseManager()
     return _db_manager
 
 
@@ -7,7 +7,7 @@ from uuid import uuid4
 
 from sqlalchemy import (
     Boolean, Column, DateTime, Integer, String, Text,
-    DECIMAL, ARRAY, ForeignKey, JSON, CheckConstraint
+    DECIMAL, ARRAY, ForeignKey, JSON, CheckConstraint, Index, text
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.ext.declarative import declarative_base
@@ -36,6 +36,11 @@ class Contract(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Active, unexpired contract lookups (migration 007)
+        Index('idx_contracts_active_open', 'end_date', postgresql_where=text('active = true')),
+    )
+
     # Relationships
     historical_odds = relationship("HistoricalOdds", back_populates="contract", cascade="all, delete-orphan")
     sentiment_analyses = relationship("SentimentAnalysis", back_populates="contract", cascade="all, delete-orphan")
@@ -75,6 +80,10 @@ class HistoricalOdds(Base):
     volume = Column(DECIMAL(15, 2))
     recorded_at = Column(DateTime, default=datetime.utcnow, index=True)
 
+    __table_args__ = (
+        Index('idx_historical_odds_contract', 'contract_id', 'recorded_at'),
+    )
+
     # Relationships
     contract = relationship("Contract", back_populates="historical_odds")
 
@@ -138,6 +147,10 @@ class SentimentAnalysis(Base):
     ensemble_score = Column(DECIMAL(4, 3))  # Weighted average of LLM + lexicon
     analyzed_at = Column(DateTime, default=datetime.utcnow, index=True)
 
+    __table_args__ = (
+        Index('idx_sentiment_contract_analyzed_at', 'contract_id', 'analyzed_at'),
+    )
+
     # Relationships
     post = relationship("SocialPost", back_populates="sentiment_analyses")
     contract = relationship("Contract", back_populates="sentiment_analyses")
@@ -188,6 +201,14 @@ class DetectedGap(Base):
     realized_edge = Column(DECIMAL(5, 4))  # actual_prob - entry_prob at resolution
     resolved_at = Column(DateTime)
 
+    __table_args__ = (
+        # Latest unresolved gap per (contract, type) for reporting (migration 008)
+        Index(
+            'idx_detected_gaps_latest_open', 'contract_id', 'gap_type', 'detected_at',
+            postgresql_where=text('resolved = false')
+        ),
+    )
+
     # Relationships
     contract = relationship("Contract", back_populates="detected_gaps")
 
@@ -140,7 +140,11 @@ class EnsembleSentiment:
             cutoff = datetime.now(timezone.utc) - timedelta(hours=window_hours)
 
             with db_manager.get_session() as session:
-                analyses = session.query(SentimentAnalysis).filter(
+                analyses = session.query(
+                    SentimentAnalysis.ensemble_score,
+                    SentimentAnalysis.sentiment_score,
+                    SentimentAnalysis.sentiment_label,
+                ).filter(
                     SentimentAnalysis.contract_id == UUID(contract_id),
                     SentimentAnalysis.analyzed_at >= cutoff
                 ).all()
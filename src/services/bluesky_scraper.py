@@ -5,10 +5,10 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
 import requests
-from ratelimit import limits, sleep_and_retry
 
 from ..config import get_settings
 from ..utils.logger import get_logger
+from ..utils.rate_limiter import TokenBucket
 
 logger = get_logger(__name__)
 
@@ -28,6 +28,8 @@ class BlueskyScraper:
         self.settings = get_settings()
         self.enabled = self.settings.enable_bluesky and self.settings.has_bluesky_credentials
         self.session = requests.Session()
+        # Shared by all collector threads: requests are paced, not rejected
+        self.limiter = TokenBucket(calls=self.settings.bluesky_rate_limit, period=60)
         self.session.headers.update({
             "Accept": "application/json",
         })
@@ -86,8 +88,6 @@ class BlueskyScraper:
 
         return True
 
-    @sleep_and_retry
-    @limits(calls=30, period=60)
     def search_posts(
         self,
         query: str,
@@ -111,6 +111,7 @@ class BlueskyScraper:
         if not self._ensure_authenticated():
             return []
 
+        self.limiter.acquire()
         return self._do_search(query, max_results, hours_back, allow_retry=True)
 
     def _do_search(
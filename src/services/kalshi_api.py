@@ -76,7 +76,7 @@ class KalshiAPI:
             logger.error(f"Kalshi API request error: {e}")
             return None
 
-    def search_markets(self, query: str, limit: int = 20) -> List[Dict]:
+    def search_markets(self, query: str, limit: int = 20) -> Optional[List[Dict]]:
         """
         Search Kalshi markets by query string.
 
@@ -85,7 +85,8 @@ class KalshiAPI:
             limit: Maximum results to return
 
         Returns:
-            List of standardized market dicts
+            List of standardized market dicts (empty if nothing matched),
+            or None if the request failed
         """
         if not self.enabled:
             return []
@@ -97,7 +98,9 @@ class KalshiAPI:
             }
 
             data = self._make_request("/markets", params)
-            if not data or "markets" not in data:
+            if data is None:
+                return None
+            if "markets" not in data:
                 return []
 
             raw_markets = data["markets"]
@@ -126,7 +129,7 @@ class KalshiAPI:
 
         except Exception as e:
             logger.error(f"Error searching Kalshi markets: {e}")
-            return []
+            return None
 
     def search_events(self, query: str, limit: int = 10) -> List[Dict]:
         """
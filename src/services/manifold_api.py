@@ -77,7 +77,7 @@ class ManifoldAPI:
             logger.error(f"Manifold API request error: {e}")
             return None
 
-    def search_markets(self, query: str, limit: int = 20) -> List[Dict]:
+    def search_markets(self, query: str, limit: int = 20) -> Optional[List[Dict]]:
         """
         Search Manifold markets by text query.
 
@@ -86,7 +86,8 @@ class ManifoldAPI:
             limit: Maximum results to return
 
         Returns:
-            List of standardized market dicts
+            List of standardized market dicts (empty if nothing matched),
+            or None if the request failed
         """
         if not self.enabled:
             return []
@@ -101,7 +102,9 @@ class ManifoldAPI:
             }
 
             data = self._make_request("/v0/search-markets", params)
-            if not data or not isinstance(data, list):
+            if data is None:
+                return None
+            if not isinstance(data, list):
                 return []
 
             results = []
@@ -115,7 +118,7 @@ class ManifoldAPI:
 
         except Exception as e:
             logger.error(f"Error searching Manifold markets: {e}")
-            return []
+            return None
 
     def get_market(self, market_id: str) -> Optional[Dict]:
         """
@@ -1,9 +1,10 @@
 """Polymarket API integration with ethical data fetching."""
 
+import json
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from ratelimit import limits, sleep_and_retry
 
 import requests
@@ -16,6 +17,34 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _parse_iso_datetime(value) -> Optional[datetime]:
+    """
+    Parse an API ISO-8601 timestamp into an aware UTC datetime.
+
+    Uses the C-implemented datetime.fromisoformat; only the trailing 'Z'
+    (not accepted before Python 3.11) is rewritten first. Date-only and
+    other naive values are taken as UTC so they compare safely against
+    aware cycle timestamps.
+
+    Args:
+        value: Timestamp string, e.g. '2025-11-04T12:00:00Z' or '2025-11-04'
+
+    Returns:
+        Aware datetime, or None if value is missing or unparseable
+    """
+    if not value or not isinstance(value, str):
+        return None
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
 class PolymarketAPI:
     """
     Ethical Polymarket API client with rate limiting and retry logic.
@@ -119,30 +148,48 @@ class PolymarketAPI:
             raise last_error
         raise requests.exceptions.RequestException("Request failed after retries")
 
-    def get_active_markets(self, limit: int = 100) -> List[Dict]:
+    def iter_active_markets(
+        self,
+        limit: int = 100,
+        end_date_min: Optional[datetime] = None
+    ) -> Iterator[Dict]:
         """
-        Fetch active prediction markets with pagination.
+        Stream active prediction markets one at a time, paginating lazily.
+
+        Only the current page is held in memory, so callers that process
+        markets as they arrive keep peak memory flat regardless of limit.
+        A failed page request ends the stream; markets already yielded stand.
 
         Args:
             limit: Maximum total number of markets to fetch
+            end_date_min: Only return markets ending at or after this time
+                (filtered server-side, so expired markets never use up limit)
 
-        Returns:
-            List of market dictionaries
+        Yields:
+            Market dictionaries
         """
-        try:
-            url = f"{self.gamma_url}/markets"
-            all_markets = []
-            page_size = 100  # API max per request
-            offset = 0
+        url = f"{self.gamma_url}/markets"
+        page_size = 100  # API max per request
+        offset = 0
+        pages = 0
 
-            logger.info(f"Fetching active markets (target={limit})")
+        end_date_param = None
+        if end_date_min is not None:
+            if end_date_min.tzinfo is None:
+                end_date_min = end_date_min.replace(tzinfo=timezone.utc)
+            end_date_param = end_date_min.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
 
-            while len(all_markets) < limit:
+        logger.info(f"Fetching active markets (target={limit})")
+
+        try:
+            while offset < limit:
                 params = {
                     'closed': 'false',
-                    'limit': min(page_size, limit - len(all_markets)),
+                    'limit': min(page_size, limit - offset),
                     'offset': offset
                 }
+                if end_date_param:
+                    params['end_date_min'] = end_date_param
 
                 response = self._make_request(url, params)
                 markets = response if isinstance(response, list) else response.get('data', [])
@@ -150,19 +197,35 @@ class PolymarketAPI:
                 if not markets:
                     break  # No more results
 
-                all_markets.extend(markets)
+                pages += 1
                 offset += len(markets)
+                yield from markets
 
                 # If we got fewer than page_size, there are no more pages
                 if len(markets) < page_size:
                     break
 
-            logger.info(f"Fetched {len(all_markets)} active markets across {offset // page_size + 1} page(s)")
-            return all_markets
-
         except Exception as e:
             logger.error(f"Error fetching active markets: {e}")
-            return all_markets if all_markets else []
+
+        logger.info(f"Fetched {offset} active markets across {pages} page(s)")
+
+    def get_active_markets(
+        self,
+        limit: int = 100,
+        end_date_min: Optional[datetime] = None
+    ) -> List[Dict]:
+        """
+        Fetch active prediction markets with pagination.
+
+        Args:
+            limit: Maximum total number of markets to fetch
+            end_date_min: Only return markets ending at or after this time
+
+        Returns:
+            List of market dictionaries
+        """
+        return list(self.iter_active_markets(limit=limit, end_date_min=end_date_min))
 
     def get_market_details(self, condition_id: str) -> Optional[Dict]:
         """
@@ -263,13 +326,7 @@ class PolymarketAPI:
             description = market.get('description', '')
 
             # Parse end date
-            end_date_str = market.get('end_date_iso') or market.get('endDate')
-            end_date = None
-            if end_date_str:
-                try:
-                    end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-                except:
-                    pass
+            end_date = _parse_iso_datetime(market.get('end_date_iso') or market.get('endDate'))
 
             # Get current odds from outcomes
             outcomes = market.get('outcomes', [])
@@ -280,14 +337,12 @@ class PolymarketAPI:
             # Gamma API returns JSON-encoded strings: '["0.5", "0.5"]'
             if isinstance(outcome_prices, str):
                 try:
-                    import json as _json
-                    outcome_prices = _json.loads(outcome_prices)
+                    outcome_prices = json.loads(outcome_prices)
                 except Exception:
                     outcome_prices = []
             if isinstance(outcomes, str):
                 try:
-                    import json as _json
-                    outcomes = _json.loads(outcomes)
+                    outcomes = json.loads(outcomes)
                 except Exception:
                     outcomes = []
 
@@ -389,13 +444,7 @@ class PolymarketAPI:
                           or item.get('author', 'anonymous'))
 
                 posted_at_str = item.get('created_at') or item.get('createdAt') or item.get('timestamp')
-                if posted_at_str:
-                    try:
-                        posted_at = datetime.fromisoformat(posted_at_str.replace('Z', '+00:00'))
-                    except (ValueError, AttributeError):
-                        posted_at = datetime.now(timezone.utc)
-                else:
-                    posted_at = datetime.now(timezone.utc)
+                posted_at = _parse_iso_datetime(posted_at_str) or datetime.now(timezone.utc)
 
                 comments.append({
                     'post_id': f"polymarket_comment_{comment_id}",
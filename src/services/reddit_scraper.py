@@ -1,9 +1,7 @@
 """Reddit scraping and API integration with ethical data collection."""
 
-import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from ratelimit import limits, sleep_and_retry
+from typing import Dict, List, Optional, Union
 
 try:
     import praw
@@ -14,9 +12,24 @@ except ImportError:
 
 from ..config import get_settings
 from ..utils.logger import get_logger
+from ..utils.rate_limiter import TokenBucket
 
 logger = get_logger(__name__)
 
+# Filler words dropped by extract_keywords_from_question (built once, not per call)
+_COMMON_WORDS = frozenset({'will', 'the', 'be', 'in', 'to', 'of', 'and', 'or', 'a', 'an', 'by', 'on'})
+
+# Predefined subreddits for common prediction market topics
+_TOPIC_SUBREDDITS = {
+    'politics': ('politics', 'worldnews', 'PoliticalDiscussion', 'geopolitics'),
+    'crypto': ('cryptocurrency', 'bitcoin', 'CryptoCurrency', 'ethfinance'),
+    'sports': ('sports', 'nfl', 'nba', 'soccer', 'baseball'),
+    'finance': ('wallstreetbets', 'stocks', 'investing', 'Economics'),
+    'tech': ('technology', 'tech', 'programming', 'Futurology'),
+    'entertainment': ('movies', 'television', 'entertainment', 'Music'),
+}
+_DEFAULT_SUBREDDITS = ('all', 'news', 'worldnews')
+
 
 class RedditScraper:
     """
@@ -33,6 +46,8 @@ class RedditScraper:
         """Initialize Reddit scraper."""
         self.settings = get_settings()
         self.reddit = None
+        # Shared by all collector threads: requests are paced, not rejected
+        self.limiter = TokenBucket(calls=self.settings.reddit_rate_limit, period=60)
         self.enabled = self.settings.enable_reddit and self.settings.has_reddit_credentials
 
         if self.enabled and PRAW_AVAILABLE:
@@ -58,8 +73,6 @@ class RedditScraper:
             logger.error(f"Error initializing Reddit client: {e}")
             self.enabled = False
 
-    @sleep_and_retry
-    @limits(calls=60, period=60)  # 60 calls per minute
     def search_posts(
         self,
         query: str,
@@ -86,6 +99,8 @@ class RedditScraper:
             return []
 
         try:
+            self.limiter.acquire()
+
             # Determine search scope
             if subreddits:
                 subreddit_str = '+'.join(subreddits)
@@ -167,6 +182,7 @@ class RedditScraper:
             return []
 
         try:
+            self.limiter.acquire()
             subreddit = self.reddit.subreddit(subreddit_name)
             time_limit = datetime.utcnow() - timedelta(hours=hours_back)
 
@@ -222,41 +238,45 @@ class RedditScraper:
     def search_multiple_subreddits(
         self,
         subreddits: List[str],
-        query: str,
+        query: Union[str, List[str]],
         max_per_subreddit: int = 25,
         hours_back: int = 24
     ) -> List[Dict]:
         """
         Search multiple subreddits for relevant posts.
 
+        Issues a single search over the combined 'a+b+c' subreddit; a list
+        of queries is OR-joined into that same request.
+
         Args:
             subreddits: List of subreddit names
-            query: Search query
+            query: Search query, or list of queries to match any of
             max_per_subreddit: Max posts per subreddit
             hours_back: Hours to look back
 
         Returns:
             Combined list of posts
         """
+        if not isinstance(query, str):
+            terms = [f'"{q}"' if ' ' in q else q for q in (q.strip() for q in query) if q]
+            if not terms:
+                return []
+            query = ' OR '.join(terms)
+
+        posts = self.search_posts(
+            query=query,
+            subreddits=subreddits,
+            max_results=max_per_subreddit * max(len(subreddits), 1),
+            hours_back=hours_back
+        )
+
+        # Deduplicate
         all_posts = []
         seen_ids = set()
-
-        for subreddit in subreddits:
-            posts = self.search_subreddit_posts(
-                subreddit_name=subreddit,
-                query=query,
-                max_results=max_per_subreddit,
-                hours_back=hours_back
-            )
-
-            # Deduplicate
-            for post in posts:
-                if post['post_id'] not in seen_ids:
-                    all_posts.append(post)
-                    seen_ids.add(post['post_id'])
-
-            # Rate limiting between subreddits
-            time.sleep(1)
+        for post in posts:
+            if post['post_id'] not in seen_ids:
+                all_posts.append(post)
+                seen_ids.add(post['post_id'])
 
         logger.info(f"Collected {len(all_posts)} posts from {len(subreddits)} subreddits")
         return all_posts
@@ -312,24 +332,13 @@ class RedditScraper:
         Returns:
             List of subreddit names
         """
-        # Predefined subreddits for common prediction market topics
-        topic_subreddits = {
-            'politics': ['politics', 'worldnews', 'PoliticalDiscussion', 'geopolitics'],
-            'crypto': ['cryptocurrency', 'bitcoin', 'CryptoCurrency', 'ethfinance'],
-            'sports': ['sports', 'nfl', 'nba', 'soccer', 'baseball'],
-            'finance': ['wallstreetbets', 'stocks', 'investing', 'Economics'],
-            'tech': ['technology', 'tech', 'programming', 'Futurology'],
-            'entertainment': ['movies', 'television', 'entertainment', 'Music'],
-            'default': ['all', 'news', 'worldnews']
-        }
-
         # Simple keyword matching
         topic_lower = topic.lower()
-        for key, subreddits in topic_subreddits.items():
+        for key, subreddits in _TOPIC_SUBREDDITS.items():
             if key in topic_lower:
-                return subreddits
+                return list(subreddits)
 
-        return topic_subreddits['default']
+        return list(_DEFAULT_SUBREDDITS)
 
     def extract_keywords_from_question(self, question: str) -> List[str]:
         """
@@ -342,10 +351,8 @@ class RedditScraper:
             List of search keywords
         """
         # Simple keyword extraction
-        common_words = {'will', 'the', 'be', 'in', 'to', 'of', 'and', 'or', 'a', 'an', 'by', 'on'}
-
         words = question.lower().replace('?', '').split()
-        keywords = [w for w in words if len(w) > 3 and w not in common_words]
+        keywords = [w for w in words if len(w) > 3 and w not in _COMMON_WORDS]
 
         # Take top 3-5 most relevant keywords
         return keywords[:5]
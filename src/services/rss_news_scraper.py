@@ -74,7 +74,9 @@ class RSSNewsScraper:
             return []
 
         articles = []
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours_back)
+        # One clock read per call, shared by the cutoff and undated articles
+        now = datetime.utcnow()
+        cutoff_time = now - timedelta(hours=hours_back)
 
         # Convert keywords to lowercase for case-insensitive matching
         keywords_lower = [k.lower() for k in keywords]
@@ -113,7 +115,7 @@ class RSSNewsScraper:
                             'title': title,
                             'content': summary,
                             'url': entry.get('link', ''),
-                            'published_at': published or datetime.utcnow(),
+                            'published_at': published or now,
                             'author': entry.get('author', 'Unknown')
                         })
 
@@ -140,7 +142,9 @@ class RSSNewsScraper:
             List of recent articles
         """
         articles = []
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours_back)
+        # One clock read per call, shared by the cutoff and undated articles
+        now = datetime.utcnow()
+        cutoff_time = now - timedelta(hours=hours_back)
 
         logger.info(f"Fetching recent news from {len(self.feeds)} sources")
 
@@ -167,7 +171,7 @@ class RSSNewsScraper:
                         'title': entry.get('title', ''),
                         'content': entry.get('summary', '') or entry.get('description', ''),
                         'url': entry.get('link', ''),
-                        'published_at': published or datetime.utcnow(),
+                        'published_at': published or now,
                         'author': entry.get('author', 'Unknown')
                     })
 
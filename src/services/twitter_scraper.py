@@ -2,8 +2,7 @@
 
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from ratelimit import limits, sleep_and_retry
+from typing import Dict, List, Optional, Union
 
 try:
     import tweepy
@@ -14,9 +13,13 @@ except ImportError:
 
 from ..config import get_settings
 from ..utils.logger import get_logger
+from ..utils.rate_limiter import TokenBucket
 
 logger = get_logger(__name__)
 
+# Filler words dropped by extract_keywords_from_question (built once, not per call)
+_COMMON_WORDS = frozenset({'will', 'the', 'be', 'in', 'to', 'of', 'and', 'or', 'a', 'an', 'by', 'on'})
+
 
 class TwitterScraper:
     """
@@ -34,6 +37,8 @@ class TwitterScraper:
         self.settings = get_settings()
         self.client = None
         self.api = None
+        # Shared by all collector threads: requests are paced, not rejected
+        self.limiter = TokenBucket(calls=self.settings.twitter_rate_limit, period=900)
         self.enabled = self.settings.enable_twitter and self.settings.has_twitter_credentials
 
         if self.enabled and TWEEPY_AVAILABLE:
@@ -72,19 +77,21 @@ class TwitterScraper:
             logger.error(f"Error initializing Twitter client: {e}")
             self.enabled = False
 
-    @sleep_and_retry
-    @limits(calls=15, period=900)  # 15 calls per 15 minutes
     def search_tweets(
         self,
-        query: str,
+        query: Union[str, List[str]],
         max_results: int = 100,
         hours_back: int = 6
     ) -> List[Dict]:
         """
         Search recent tweets matching query.
 
+        A list of queries is OR-joined into a single search request, so
+        several keywords cost one API call (and one rate-limit slot)
+        instead of one each.
+
         Args:
-            query: Search query
+            query: Search query, or list of queries to match any of
             max_results: Maximum tweets to return
             hours_back: How many hours back to search
 
@@ -95,7 +102,14 @@ class TwitterScraper:
             logger.warning("Twitter search skipped (not enabled)")
             return []
 
+        if not isinstance(query, str):
+            query = self.build_or_query(query)
+            if not query:
+                return []
+
         try:
+            self.limiter.acquire()
+
             # Calculate start time
             start_time = datetime.utcnow() - timedelta(hours=hours_back)
 
@@ -154,6 +168,26 @@ class TwitterScraper:
             logger.error(f"Error searching tweets: {e}")
             return []
 
+    @staticmethod
+    def build_or_query(queries: List[str]) -> str:
+        """
+        Combine several search terms into one OR query.
+
+        Args:
+            queries: Search terms (multi-word terms are quoted as phrases)
+
+        Returns:
+            Query string such as '(kw1 OR kw2 OR "two words")', or '' if empty
+        """
+        terms = []
+        for q in queries:
+            q = q.strip()
+            if q:
+                terms.append(f'"{q}"' if ' ' in q else q)
+        if len(terms) <= 1:
+            return terms[0] if terms else ''
+        return f"({' OR '.join(terms)})"
+
     def search_tweets_by_keywords(
         self,
         keywords: List[str],
@@ -171,24 +205,20 @@ class TwitterScraper:
         Returns:
             Combined list of unique tweets
         """
+        # One OR-joined request instead of one request per keyword
+        tweets = self.search_tweets(
+            query=keywords,
+            max_results=max_per_keyword * len(keywords),
+            hours_back=hours_back
+        )
+
+        # Deduplicate
         all_tweets = []
         seen_ids = set()
-
-        for keyword in keywords:
-            tweets = self.search_tweets(
-                query=keyword,
-                max_results=max_per_keyword,
-                hours_back=hours_back
-            )
-
-            # Deduplicate
-            for tweet in tweets:
-                if tweet['post_id'] not in seen_ids:
-                    all_tweets.append(tweet)
-                    seen_ids.add(tweet['post_id'])
-
-            # Rate limiting between keywords
-            time.sleep(2)
+        for tweet in tweets:
+            if tweet['post_id'] not in seen_ids:
+                all_tweets.append(tweet)
+                seen_ids.add(tweet['post_id'])
 
         logger.info(f"Collected {len(all_tweets)} unique tweets across {len(keywords)} keywords")
         return all_tweets
@@ -291,10 +321,8 @@ class TwitterScraper:
         """
         # Simple keyword extraction (could be enhanced with NLP)
         # Remove common words and extract key terms
-        common_words = {'will', 'the', 'be', 'in', 'to', 'of', 'and', 'or', 'a', 'an', 'by', 'on'}
-
         words = question.lower().replace('?', '').split()
-        keywords = [w for w in words if len(w) > 3 and w not in common_words]
+        keywords = [w for w in words if len(w) > 3 and w not in _COMMON_WORDS]
 
         # Take top 3-5 most relevant keywords
         return keywords[:5]
@@ -1,5 +1,6 @@
 """Utility modules."""
 
 from .logger import setup_logger, get_logger
+from .rate_limiter import TokenBucket
 
-__all__ = ['setup_logger', 'get_logger']
+__all__ = ['setup_logger', 'get_logger', 'TokenBucket']
@@ -0,0 +1,55 @@
+"""Thread-safe token-bucket rate limiting for outbound API calls."""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by every thread calling one API.
+
+    Callers block in acquire() until a token is available, so requests are
+    spread evenly at the allowed rate instead of bursting to the limit and
+    waiting for a 429. Tokens are reserved under the lock and the sleep
+    happens outside it, so concurrent callers queue up in arrival order
+    without holding each other up while waiting.
+    """
+
+    def __init__(self, calls: int, period: float, capacity: Optional[int] = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            calls: Requests allowed per period
+            period: Period length in seconds
+            capacity: Maximum burst size (defaults to calls)
+        """
+        if calls <= 0 or period <= 0:
+            raise ValueError("calls and period must be positive")
+        self.rate = calls / period
+        self.capacity = float(capacity if capacity is not None else calls)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait